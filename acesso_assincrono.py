@@ -0,0 +1,249 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from catalogo import CONSULTAS, parametros as parametros_catalogo, sql_para
+from executor_consultas import FilaCheia
+from limites_execucao import TEMPO_LIMITE_PADRAO_S, ControleExecucao
+from paginacao import LIMITE_LINHAS_MATERIALIZADAS, buscar_linhas
+from pool_conexoes import PoolConexoes
+
+MAX_PENDENTES = 10_000
+
+ESPERA_FILA_S = 5.0
+
+TAMANHO_BLOCO_ITERACAO = 500
+
+SQL_REVISOES_DO_ARTIGO = """
+SELECT R.Cod_Revisor, U.Nome AS Revisor, R.Nota, R.Parecer, R.Data_Entrega
+FROM Revisao R
+JOIN Usuario U ON U.ID_Usuario = R.Cod_Revisor
+WHERE R.Cod_Artigo = ?
+ORDER BY R.Data_Entrega, R.Cod_Revisor
+"""
+
+class AcessoAssincrono:
+    """Acesso asyncio ao banco: as chamadas bloqueantes do sqlite3 rodam num pool fixo de threads.
+
+    Cada thread usa uma conexão de leitura do PoolConexoes, então milhares de requisições concorrentes
+    ocupam só `max_trabalhadores` threads e conexões; as demais esperam num semáforo (no máximo
+    `max_pendentes`, por até `espera_fila_s` segundos, antes de FilaCheia). O tempo limite de cada
+    requisição interrompe a consulta no SQLite, liberando a thread. Use com `async with`.
+    """
+
+    def __init__(self, db_path, max_trabalhadores=8, max_pendentes=MAX_PENDENTES, espera_fila_s=ESPERA_FILA_S,
+                 tempo_limite_s=TEMPO_LIMITE_PADRAO_S, metricas=None):
+        self.max_trabalhadores = max_trabalhadores
+        self.max_pendentes = max_pendentes
+        self.espera_fila_s = espera_fila_s
+        self.tempo_limite_s = tempo_limite_s
+        self.metricas = metricas
+        self.pool = PoolConexoes(db_path, max_leitores=max_trabalhadores)
+        self._executor = ThreadPoolExecutor(max_workers=max_trabalhadores, thread_name_prefix="async")
+        self._vagas = None
+        self._conexoes = None
+
+    async def __aenter__(self):
+        self._vagas = asyncio.Semaphore(self.max_pendentes)
+        self._conexoes = asyncio.Semaphore(self.max_trabalhadores)
+        return self
+
+    async def __aexit__(self, *excecao):
+        await self.fechar()
+
+    async def fechar(self):
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self.pool.fechar()
+
+    async def _entrar_na_fila(self):
+        if self._vagas is None:
+            raise RuntimeError("Use `async with AcessoAssincrono(...)` antes de consultar")
+        try:
+            await asyncio.wait_for(self._vagas.acquire(), self.espera_fila_s)
+        except asyncio.TimeoutError:
+            raise FilaCheia(
+                f"Limite de {self.max_pendentes} requisições pendentes atingido por {self.espera_fila_s:g} s."
+            ) from None
+
+    async def _na_thread(self, funcao, controle, tempo_limite_s):
+        """Roda `funcao` numa thread do pool; no tempo limite ou no cancelamento, interrompe a consulta."""
+        futuro = asyncio.get_running_loop().run_in_executor(self._executor, funcao)
+        try:
+            return await asyncio.wait_for(futuro, tempo_limite_s)
+        except asyncio.TimeoutError:
+            controle.motivo = controle.motivo or f"Tempo limite de {tempo_limite_s:g} s excedido"
+            controle.cancelar()
+            raise controle.abortar() from None
+        except asyncio.CancelledError:
+            controle.cancelar()
+            raise
+
+    async def _executar(self, funcao, sql, parametros, tempo_limite_s, escrita=False):
+        """Executa funcao(conn, controle) com uma conexão do pool, respeitando fila, tempo limite e métricas."""
+        tempo_limite_s = self.tempo_limite_s if tempo_limite_s is None else tempo_limite_s
+        controle = ControleExecucao(tempo_limite_s=tempo_limite_s)
+
+        def trabalho():
+            with (self.pool.escrita() if escrita else self.pool.leitura()) as conn:
+                return funcao(conn, controle)
+
+        await self._entrar_na_fila()
+        inicio = time.perf_counter()
+        resultado = erro = None
+        try:
+            async with self._conexoes:
+                resultado = await self._na_thread(trabalho, controle, tempo_limite_s or None)
+            return resultado
+        except asyncio.CancelledError:
+            erro = "Requisição cancelada"
+            raise
+        except Exception as e:
+            erro = str(e)
+            raise
+        finally:
+            self._vagas.release()
+            if self.metricas is not None:
+                linhas = len(resultado[1]) if isinstance(resultado, tuple) else resultado
+                self.metricas.registrar(sql, time.perf_counter() - inicio, linhas, None, erro, "async", parametros)
+
+    async def consultar(self, sql, parametros=(), limite=LIMITE_LINHAS_MATERIALIZADAS, tempo_limite_s=None):
+        """SELECT materializado: devolve (colunas, linhas), com no máximo `limite` linhas."""
+        def ler(conn, controle):
+            colunas, linhas, _ = buscar_linhas(conn, sql, limite, controle, parametros)
+            return colunas, linhas
+
+        return await self._executar(ler, sql, parametros, tempo_limite_s)
+
+    async def executar_catalogo(self, num, valores=None, limite=LIMITE_LINHAS_MATERIALIZADAS, tempo_limite_s=None):
+        """Consulta `num` do catálogo (com a variante materializada quando existir), como em executar_queries."""
+        argumentos = parametros_catalogo(num, valores)
+
+        def ler(conn, controle):
+            colunas, linhas, _ = buscar_linhas(conn, sql_para(conn, num), limite, controle, argumentos)
+            return colunas, linhas
+
+        return await self._executar(ler, CONSULTAS[num]["sql"], argumentos, tempo_limite_s)
+
+    async def escrever(self, sql, parametros=(), tempo_limite_s=None):
+        """INSERT/UPDATE/DELETE pelo escritor único do pool; devolve as linhas afetadas."""
+        def gravar(conn, controle):
+            with controle.aplicar(conn):
+                return conn.execute(sql, parametros).rowcount
+
+        return await self._executar(gravar, sql, parametros, tempo_limite_s, escrita=True)
+
+    async def iterar(self, sql, parametros=(), tamanho_bloco=TAMANHO_BLOCO_ITERACAO, tempo_limite_s=None):
+        """Itera as linhas de um SELECT sem materializar o resultado, buscando `tamanho_bloco` por vez.
+
+        A conexão de leitura fica reservada até o fim da iteração; para devolvê-la logo após um `break`, use
+        `async with contextlib.aclosing(acesso.iterar(...)) as linhas`. O tempo limite vale para a iteração
+        inteira, incluindo o tempo entre um bloco e outro.
+        """
+        tempo_limite_s = self.tempo_limite_s if tempo_limite_s is None else tempo_limite_s
+        controle = ControleExecucao(tempo_limite_s=tempo_limite_s)
+        await self._entrar_na_fila()
+        try:
+            async with self._conexoes:
+                leitura = self.pool.leitura()
+                entrada = asyncio.get_running_loop().run_in_executor(self._executor, leitura.__enter__)
+                try:
+                    conn = await asyncio.shield(entrada)
+                except asyncio.CancelledError:
+                    # A reserva segue na thread mesmo com a tarefa cancelada: quando terminar, a conexão
+                    # (ainda sem transação aberta) volta ao pool.
+                    def devolver_reservada(futuro):
+                        if not futuro.cancelled() and futuro.exception() is None:
+                            leitura.__exit__(None, None, None)
+
+                    entrada.add_done_callback(devolver_reservada)
+                    raise
+                cursor = None
+                try:
+                    def abrir():
+                        with controle.aplicar(conn):
+                            return conn.execute(sql, parametros)
+
+                    def proximo_bloco():
+                        with controle.aplicar(conn):
+                            return cursor.fetchmany(tamanho_bloco)
+
+                    cursor = await self._na_thread(abrir, controle, tempo_limite_s or None)
+                    while True:
+                        restante = tempo_limite_s - controle.tempo_decorrido() if tempo_limite_s else None
+                        if restante is not None and restante <= 0:
+                            controle.motivo = f"Tempo limite de {tempo_limite_s:g} s excedido"
+                            raise controle.abortar()
+                        bloco = await self._na_thread(proximo_bloco, controle, restante)
+                        if not bloco:
+                            break
+                        controle.linhas += len(bloco)
+                        for linha in bloco:
+                            yield linha
+                finally:
+                    def devolver():
+                        if cursor is not None:
+                            cursor.close()
+                        leitura.__exit__(None, None, None)
+
+                    await asyncio.shield(asyncio.get_running_loop().run_in_executor(self._executor, devolver))
+        finally:
+            self._vagas.release()
+
+    async def revisoes_do_artigo(self, cod_artigo, tempo_limite_s=None):
+        """Revisões de um artigo (busca pela chave primária de Revisao), como lista de dicionários."""
+        colunas, linhas = await self.consultar(SQL_REVISOES_DO_ARTIGO, (cod_artigo,), tempo_limite_s=tempo_limite_s)
+        return [dict(zip(colunas, linha)) for linha in linhas]
+
+def percentil(valores, fracao):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(fracao * len(ordenados)))] if ordenados else 0.0
+
+async def _demonstrar(args):
+    import random
+    import threading
+    import sqlite3
+
+    conn = sqlite3.connect(args.db)
+    maior_artigo = conn.execute("SELECT COALESCE(MAX(Cod_Artigo), 0) FROM Artigo").fetchone()[0]
+    conn.close()
+    if not maior_artigo:
+        raise SystemExit("O banco não tem artigos.")
+    sorteio = random.Random(args.seed)
+    artigos = [sorteio.randint(1, maior_artigo) for _ in range(args.requisicoes)]
+
+    async with AcessoAssincrono(args.db, args.trabalhadores, tempo_limite_s=args.tempo_limite) as acesso:
+        latencias = []
+
+        async def requisicao(cod_artigo):
+            inicio = time.perf_counter()
+            revisoes = await acesso.revisoes_do_artigo(cod_artigo)
+            latencias.append(time.perf_counter() - inicio)
+            return len(revisoes)
+
+        inicio = time.perf_counter()
+        quantidades = await asyncio.gather(*(requisicao(cod) for cod in artigos))
+        segundos = time.perf_counter() - inicio
+        threads = threading.active_count()
+
+    print(f"{args.requisicoes:,} requisições concorrentes de revisões por artigo em {segundos:.2f} s "
+          f"({args.requisicoes / segundos:,.0f}/s), {sum(quantidades):,} revisões lidas")
+    print(f"Latência (inclui a espera na fila): p50 {percentil(latencias, 0.5) * 1000:.1f} ms, "
+          f"p99 {percentil(latencias, 0.99) * 1000:.1f} ms")
+    print(f"Threads no processo: {threads} ({args.trabalhadores} trabalhadores)")
+
+def main():
+    import argparse
+    from banco_de_dados import DB_PATH
+
+    parser = argparse.ArgumentParser(description="Dispara requisições concorrentes pela API assíncrona.")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    parser.add_argument("--requisicoes", type=int, default=5000, help="Quantidade de requisições concorrentes")
+    parser.add_argument("--trabalhadores", type=int, default=8, help="Threads (e conexões de leitura) do pool")
+    parser.add_argument("--tempo-limite", type=float, default=TEMPO_LIMITE_PADRAO_S,
+                        help="Tempo limite por requisição, em segundos")
+    parser.add_argument("--seed", type=int, default=42, help="Semente do sorteio dos artigos")
+    args = parser.parse_args()
+    asyncio.run(_demonstrar(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+TABELAS_RESUMO = {
+    "Resumo_Status": """
+        CREATE TABLE IF NOT EXISTS Resumo_Status (
+            Status TEXT PRIMARY KEY,
+            Qtd_Linhas INTEGER NOT NULL
+        );
+    """,
+    "Resumo_Revisor": """
+        CREATE TABLE IF NOT EXISTS Resumo_Revisor (
+            Cod_Revisor INTEGER PRIMARY KEY,
+            Qtd_Linhas INTEGER NOT NULL,
+            Qtd_Notas INTEGER NOT NULL,
+            Soma_Notas REAL NOT NULL
+        );
+    """,
+    "Resumo_Area": """
+        CREATE TABLE IF NOT EXISTS Resumo_Area (
+            Cod_Area INTEGER PRIMARY KEY,
+            Qtd_Linhas INTEGER NOT NULL,
+            Qtd_Revisores INTEGER NOT NULL
+        );
+    """,
+    "Resumo_Edicao": """
+        CREATE TABLE IF NOT EXISTS Resumo_Edicao (
+            Cod_Edicao INTEGER PRIMARY KEY,
+            Qtd_Linhas INTEGER NOT NULL,
+            Qtd_Notas INTEGER NOT NULL,
+            Soma_Notas REAL NOT NULL
+        );
+    """,
+    "Resumo_Autor": """
+        CREATE TABLE IF NOT EXISTS Resumo_Autor (
+            Cod_Autor INTEGER PRIMARY KEY,
+            Qtd_Linhas INTEGER NOT NULL,
+            Qtd_Artigos INTEGER NOT NULL
+        );
+    """,
+}
+
+RECONSTRUCAO = {
+    "Resumo_Status": "SELECT Status, COUNT(*) FROM Artigo GROUP BY Status",
+    "Resumo_Revisor": """
+        SELECT Cod_Revisor, COUNT(*), COUNT(Nota), TOTAL(Nota)
+        FROM Revisao WHERE Cod_Revisor IS NOT NULL GROUP BY Cod_Revisor
+    """,
+    "Resumo_Area": """
+        SELECT Cod_Area, COUNT(*), COUNT(ID_Revisor)
+        FROM Revisor_Area WHERE Cod_Area IS NOT NULL GROUP BY Cod_Area
+    """,
+    "Resumo_Edicao": """
+        SELECT A.Cod_Edicao, COUNT(*), COUNT(R.Nota), TOTAL(R.Nota)
+        FROM Revisao R JOIN Artigo A ON A.Cod_Artigo = R.Cod_Artigo GROUP BY A.Cod_Edicao
+    """,
+    "Resumo_Autor": """
+        SELECT Cod_Autor, COUNT(*), COUNT(Cod_Artigo)
+        FROM Autoria WHERE Cod_Autor IS NOT NULL GROUP BY Cod_Autor
+    """,
+}
+
+def _aplicar(resumo, coluna_chave, chave, valores, sinal, aceita_nulo=False):
+    """Comandos de trigger que somam (ou subtraem) uma contribuição ao grupo `chave` de um resumo.
+
+    Usa `IS` em vez de `=` para que o grupo NULL (ex.: Status nulo) também seja encontrado.
+    Grupos que ficam sem linhas são removidos, como aconteceria no GROUP BY.
+    """
+    filtro = "" if aceita_nulo else f" AND ({chave}) IS NOT NULL"
+    atribuicoes = ", ".join(f"{coluna} = {coluna} {sinal} ({expr})" for coluna, expr in valores.items())
+    comandos = f"""
+                UPDATE {resumo} SET {atribuicoes} WHERE {coluna_chave} IS ({chave}){filtro};"""
+    if sinal == "+":
+        comandos += f"""
+                INSERT INTO {resumo} ({coluna_chave}, {", ".join(valores)})
+                SELECT ({chave}), {", ".join(f"({expr})" for expr in valores.values())}
+                WHERE NOT EXISTS (SELECT 1 FROM {resumo} WHERE {coluna_chave} IS ({chave}))
+                  AND ({valores["Qtd_Linhas"]}) > 0{filtro};"""
+    else:
+        comandos += f"""
+                DELETE FROM {resumo} WHERE {coluna_chave} IS ({chave}) AND Qtd_Linhas <= 0;"""
+    return comandos
+
+def _contribuicoes(linha):
+    """Contribuição de uma linha (NEW ou OLD) de cada tabela-base aos resumos que ela alimenta."""
+    edicao_da_revisao = f"(SELECT Cod_Edicao FROM Artigo WHERE Cod_Artigo = {linha}.Cod_Artigo)"
+    revisoes_do_artigo = f"FROM Revisao WHERE Cod_Artigo = {linha}.Cod_Artigo"
+    return {
+        "Artigo": [
+            ("Resumo_Status", "Status", f"{linha}.Status", {"Qtd_Linhas": "1"}, True),
+            ("Resumo_Edicao", "Cod_Edicao", f"{linha}.Cod_Edicao", {
+                "Qtd_Linhas": f"SELECT COUNT(*) {revisoes_do_artigo}",
+                "Qtd_Notas": f"SELECT COUNT(Nota) {revisoes_do_artigo}",
+                "Soma_Notas": f"SELECT TOTAL(Nota) {revisoes_do_artigo}",
+            }, False),
+        ],
+        "Revisao": [
+            ("Resumo_Revisor", "Cod_Revisor", f"{linha}.Cod_Revisor", {
+                "Qtd_Linhas": "1",
+                "Qtd_Notas": f"{linha}.Nota IS NOT NULL",
+                "Soma_Notas": f"COALESCE({linha}.Nota, 0)",
+            }, False),
+            ("Resumo_Edicao", "Cod_Edicao", edicao_da_revisao, {
+                "Qtd_Linhas": "1",
+                "Qtd_Notas": f"{linha}.Nota IS NOT NULL",
+                "Soma_Notas": f"COALESCE({linha}.Nota, 0)",
+            }, False),
+        ],
+        "Revisor_Area": [
+            ("Resumo_Area", "Cod_Area", f"{linha}.Cod_Area", {
+                "Qtd_Linhas": "1",
+                "Qtd_Revisores": f"{linha}.ID_Revisor IS NOT NULL",
+            }, False),
+        ],
+        "Autoria": [
+            ("Resumo_Autor", "Cod_Autor", f"{linha}.Cod_Autor", {
+                "Qtd_Linhas": "1",
+                "Qtd_Artigos": f"{linha}.Cod_Artigo IS NOT NULL",
+            }, False),
+        ],
+    }
+
+COLUNAS_ATUALIZADAS = {
+    "Artigo": ["Cod_Artigo", "Status", "Cod_Edicao"],
+    "Revisao": ["Cod_Artigo", "Cod_Revisor", "Nota"],
+    "Revisor_Area": ["ID_Revisor", "Cod_Area"],
+    "Autoria": ["Cod_Autor", "Cod_Artigo"],
+}
+
+def _corpo(tabela, linha, sinal):
+    return "".join(
+        _aplicar(resumo, coluna_chave, chave, valores, sinal, aceita_nulo)
+        for resumo, coluna_chave, chave, valores, aceita_nulo in _contribuicoes(linha)[tabela]
+    )
+
+def criar_triggers_agregados(cursor):
+    for tabela, colunas in COLUNAS_ATUALIZADAS.items():
+        mudou = " OR ".join(f"OLD.{coluna} IS NOT NEW.{coluna}" for coluna in colunas)
+        cursor.executescript(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_resumo_insert AFTER INSERT ON {tabela}
+            BEGIN{_corpo(tabela, "NEW", "+")}
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_resumo_delete AFTER DELETE ON {tabela}
+            BEGIN{_corpo(tabela, "OLD", "-")}
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_resumo_update
+            AFTER UPDATE OF {", ".join(colunas)} ON {tabela} WHEN {mudou}
+            BEGIN{_corpo(tabela, "OLD", "-")}{_corpo(tabela, "NEW", "+")}
+            END;
+        """)
+
+def reconstruir_agregados(cursor):
+    """Recalcula todos os resumos a partir das tabelas-base (após cargas em lote ou para corrigir deriva)."""
+    for resumo, consulta in RECONSTRUCAO.items():
+        cursor.execute(f"DELETE FROM {resumo}")
+        cursor.execute(f"INSERT INTO {resumo} {consulta}")
+
+def criar_agregados(cursor):
+    """Cria os resumos materializados das consultas 8-12, preenche a partir dos dados atuais e instala os triggers."""
+    cursor.executescript("".join(TABELAS_RESUMO.values()))
+    cursor.execute("BEGIN")
+    reconstruir_agregados(cursor)
+    cursor.execute("COMMIT")
+    criar_triggers_agregados(cursor)
+
+def agregados_disponiveis(conn):
+    encontrados = conn.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ({', '.join('?' * len(TABELAS_RESUMO))})",
+        list(TABELAS_RESUMO)
+    ).fetchone()[0]
+    return encontrados == len(TABELAS_RESUMO)
+
+def main():
+    import argparse
+    from banco_de_dados import DB_PATH, conectar
+
+    parser = argparse.ArgumentParser(description="Cria ou reconstrói os resumos materializados das consultas 8-12.")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    args = parser.parse_args()
+
+    conn = conectar(args.db, isolation_level=None)
+    criar_agregados(conn.cursor())
+    conn.close()
+    print(f"✓ Resumos materializados reconstruídos em {args.db}")
+
+if __name__ == "__main__":
+    main()
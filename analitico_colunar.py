@@ -0,0 +1,371 @@
+import sqlite3
+import threading
+import time
+
+from limites_execucao import ControleExecucao
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TABELAS_COLUNARES = {
+    "Usuario": {"ID_Usuario": "inteiro", "Nome": "texto"},
+    "Area": {"Cod_Area": "inteiro", "Nome_Area": "texto"},
+    "Edicao": {"Cod_Edicao": "inteiro", "Ano": "texto"},
+    "Artigo": {"Cod_Artigo": "inteiro", "Cod_Edicao": "inteiro", "Status": "texto"},
+    "Revisao": {"Cod_Artigo": "inteiro", "Cod_Revisor": "inteiro", "Nota": "real"},
+    "Autoria": {"Cod_Autor": "inteiro", "Cod_Artigo": "inteiro"},
+    "Revisor_Area": {"ID_Revisor": "inteiro", "Cod_Area": "inteiro"},
+}
+
+NULO = -1
+
+TAMANHO_BLOCO = 100_000
+
+def numpy_disponivel():
+    return np is not None
+
+def criar_alteracoes_colunares(cursor):
+    """Contadores de inserções e de alterações (UPDATE/DELETE) por tabela, mantidos por triggers.
+
+    Com eles o modo analítico sabe se basta anexar as linhas novas (rowid maior que o último lido)
+    ou se precisa reler a tabela. A linha que um REPLACE apaga conta como alteração pelo trigger de DELETE,
+    que só dispara com recursive_triggers ligado (banco_de_dados.conectar e PoolConexoes ligam).
+    """
+    cursor.executescript("""
+        CREATE TABLE IF NOT EXISTS Alteracoes_Colunares (
+            Tabela TEXT PRIMARY KEY,
+            Insercoes INTEGER NOT NULL,
+            Alteracoes INTEGER NOT NULL
+        );
+    """)
+    for tabela in TABELAS_COLUNARES:
+        cursor.executescript(f"""
+            INSERT OR IGNORE INTO Alteracoes_Colunares (Tabela, Insercoes, Alteracoes) VALUES ('{tabela}', 0, 0);
+
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_colunar_insert AFTER INSERT ON {tabela}
+            BEGIN
+                UPDATE Alteracoes_Colunares SET Insercoes = Insercoes + 1 WHERE Tabela = '{tabela}';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_colunar_update AFTER UPDATE ON {tabela}
+            BEGIN
+                UPDATE Alteracoes_Colunares SET Alteracoes = Alteracoes + 1 WHERE Tabela = '{tabela}';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_colunar_delete AFTER DELETE ON {tabela}
+            BEGIN
+                UPDATE Alteracoes_Colunares SET Alteracoes = Alteracoes + 1 WHERE Tabela = '{tabela}';
+            END;
+        """)
+
+def marcar_alteradas(cursor, tabelas):
+    """Força a releitura das tabelas no modo analítico (ex.: após uma carga em lote com os triggers removidos)."""
+    cursor.execute(
+        f"UPDATE Alteracoes_Colunares SET Alteracoes = Alteracoes + 1 WHERE Tabela IN ({', '.join('?' * len(tabelas))})",
+        list(tabelas)
+    )
+
+def _fatorar(valores):
+    """Códigos inteiros para valores quaisquer (NULL incluído) e a lista de categorias na ordem dos códigos."""
+    indices = {}
+    codigos = np.fromiter((indices.setdefault(valor, len(indices)) for valor in valores),
+                          dtype=np.int64, count=len(valores))
+    return codigos, list(indices)
+
+def _mapa(chaves, valores):
+    """Vetor indexado pela chave (ex.: ID_Usuario) com o valor correspondente; NULO onde a chave não existe."""
+    mapa = np.full(int(chaves.max()) + 1 if len(chaves) else 0, NULO, dtype=np.int64)
+    validas = chaves >= 0
+    mapa[chaves[validas]] = valores[validas]
+    return mapa
+
+def _consultar(mapa, chaves):
+    """mapa[chaves], com NULO para chaves nulas ou fora do mapa (equivale ao INNER JOIN)."""
+    resultado = np.full(len(chaves), NULO, dtype=np.int64)
+    dentro = (chaves >= 0) & (chaves < len(mapa))
+    resultado[dentro] = mapa[chaves[dentro]]
+    return resultado
+
+class TabelaColunar:
+    def __init__(self, nome, colunas):
+        self.nome = nome
+        self.tipos = colunas
+        self.colunas = {}
+        self.ultimo_rowid = 0
+        self.contadores = None
+
+    def __len__(self):
+        return len(self.colunas["rowid"]) if self.colunas else 0
+
+    def _ler(self, conn, desde_rowid):
+        expressoes = ["rowid"] + [
+            f"COALESCE({coluna}, {NULO})" if tipo == "inteiro" else coluna for coluna, tipo in self.tipos.items()
+        ]
+        cursor = conn.execute(
+            f"SELECT {', '.join(expressoes)} FROM {self.nome} WHERE rowid > ? ORDER BY rowid", (desde_rowid,)
+        )
+        nomes = ["rowid"] + list(self.tipos)
+        tipos = ["inteiro"] + list(self.tipos.values())
+        partes = {nome: [] for nome in nomes}
+        while True:
+            bloco = cursor.fetchmany(TAMANHO_BLOCO)
+            if not bloco:
+                break
+            for nome, tipo, valores in zip(nomes, tipos, zip(*bloco)):
+                if tipo == "inteiro":
+                    partes[nome].append(np.array(valores, dtype=np.int64))
+                elif tipo == "real":
+                    partes[nome].append(np.array(valores, dtype=np.float64))
+                else:
+                    parte = np.empty(len(valores), dtype=object)
+                    parte[:] = valores
+                    partes[nome].append(parte)
+        return {
+            nome: np.concatenate(blocos) if blocos else np.empty(0, dtype=np.float64 if tipo == "real" else
+                                                                (np.int64 if tipo == "inteiro" else object))
+            for (nome, blocos), tipo in zip(partes.items(), tipos)
+        }
+
+    def recarregar(self, conn, contadores):
+        self.colunas = self._ler(conn, 0)
+        self.ultimo_rowid = int(self.colunas["rowid"].max()) if len(self.colunas["rowid"]) else 0
+        self.contadores = contadores
+
+    def anexar(self, conn, contadores):
+        """Lê só as linhas com rowid acima do último lido; devolve False se isso não explica as inserções."""
+        novas = self._ler(conn, self.ultimo_rowid)
+        if len(novas["rowid"]) != contadores[1] - self.contadores[1]:
+            return False
+        if len(novas["rowid"]):
+            self.colunas = {nome: np.concatenate([self.colunas[nome], novas[nome]]) for nome in self.colunas}
+            self.ultimo_rowid = int(novas["rowid"].max())
+        self.contadores = contadores
+        return True
+
+    def tamanho_bytes(self):
+        return sum(coluna.nbytes for coluna in self.colunas.values())
+
+class AnaliticoColunar:
+    """Cópias colunares (NumPy) das tabelas das consultas 8-12 e agregações vetorizadas sobre elas.
+
+    Usa uma conexão própria somente leitura: `PRAGMA data_version` diz se alguém gravou desde a última
+    consulta, `PRAGMA schema_version` se o banco foi restaurado e os contadores de Alteracoes_Colunares
+    dizem, por tabela, se basta anexar as linhas novas.
+    """
+
+    def __init__(self, db_path):
+        if np is None:
+            raise RuntimeError("O modo analítico precisa do NumPy: pip install numpy")
+        self.db_path = db_path
+        self.tabelas = {nome: TabelaColunar(nome, colunas) for nome, colunas in TABELAS_COLUNARES.items()}
+        self.versao = None
+        self.ultima_atualizacao = {}
+        self._fatorados = {}
+        self.trava = threading.Lock()
+        self._conn = sqlite3.connect(
+            f"file:{db_path}?mode=ro", uri=True, isolation_level=None, check_same_thread=False
+        )
+
+    def _contadores(self):
+        """{tabela: (schema_version, inserções, alterações)}.
+
+        A API de backup incrementa o schema_version do destino, então restaurar um modelo ou backup (mesmo o
+        mesmo, várias vezes) muda a primeira posição e força a releitura de tudo.
+        """
+        esquema = self._conn.execute("PRAGMA schema_version").fetchone()[0]
+        try:
+            return {
+                tabela: (esquema, insercoes, alteracoes)
+                for tabela, insercoes, alteracoes in self._conn.execute(
+                    "SELECT Tabela, Insercoes, Alteracoes FROM Alteracoes_Colunares"
+                )
+            }
+        except sqlite3.OperationalError:
+            return {}
+
+    def atualizar(self, controle=None):
+        """Sincroniza as cópias com o banco; devolve {tabela: 'inalterada' | 'anexada' | 'recarregada'}.
+
+        As leituras rodam sob os limites de `controle` (tempo, instruções da VM e cancelamento).
+        """
+        controle = controle or ControleExecucao(tempo_limite_s=None)
+        with self.trava, controle.aplicar(self._conn):
+            versao = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if versao == self.versao:
+                return {tabela: "inalterada" for tabela in self.tabelas}
+
+            situacao = {}
+            inicio = time.perf_counter()
+            self._conn.execute("BEGIN")
+            try:
+                contadores = self._contadores()
+                for nome, tabela in self.tabelas.items():
+                    novos = contadores.get(nome)
+                    if tabela.contadores is not None and novos is not None:
+                        if novos == tabela.contadores:
+                            situacao[nome] = "inalterada"
+                            continue
+                        mesmo_banco = novos[0] == tabela.contadores[0] and novos[2] == tabela.contadores[2]
+                        if mesmo_banco and novos[1] > tabela.contadores[1] and tabela.anexar(self._conn, novos):
+                            situacao[nome] = "anexada"
+                            continue
+                    tabela.recarregar(self._conn, novos)
+                    situacao[nome] = "recarregada"
+            finally:
+                self._fatorados = {
+                    chave: valor for chave, valor in self._fatorados.items() if situacao.get(chave[0]) == "inalterada"
+                }
+                self._conn.set_progress_handler(None, 0)
+                self._conn.execute("COMMIT")
+
+            self.versao = versao
+            self.ultima_atualizacao = {"segundos": time.perf_counter() - inicio, "tabelas": situacao}
+            return situacao
+
+    def tamanho_bytes(self):
+        return sum(tabela.tamanho_bytes() for tabela in self.tabelas.values())
+
+    def _coluna(self, tabela, coluna):
+        return self.tabelas[tabela].colunas[coluna]
+
+    def _fatorada(self, tabela, coluna):
+        """_fatorar da coluna, guardado até a próxima atualização que mexer na tabela."""
+        if (tabela, coluna) not in self._fatorados:
+            self._fatorados[tabela, coluna] = _fatorar(self._coluna(tabela, coluna))
+        return self._fatorados[tabela, coluna]
+
+    def _nomes_por_usuario(self):
+        codigos, nomes = self._fatorada("Usuario", "Nome")
+        return _mapa(self._coluna("Usuario", "ID_Usuario"), codigos), nomes
+
+    def _status_por_quantidade(self):
+        codigos, status = self._fatorada("Artigo", "Status")
+        quantidades = np.bincount(codigos, minlength=len(status))
+        grupos = [(status[i], int(quantidades[i])) for i in range(len(status)) if quantidades[i] > 1]
+        return ["Status", "Qtd_Artigos"], sorted(grupos, key=lambda grupo: -grupo[1])
+
+    def _media_por_revisor(self, nota_minima):
+        nome_por_usuario, nomes = self._nomes_por_usuario()
+        grupos = _consultar(nome_por_usuario, self._coluna("Revisao", "Cod_Revisor"))
+        notas = self._coluna("Revisao", "Nota")
+        com_nota = (grupos != NULO) & ~np.isnan(notas)
+        soma = np.bincount(grupos[com_nota], weights=notas[com_nota], minlength=len(nomes))
+        quantidade = np.bincount(grupos[com_nota], minlength=len(nomes))
+        if nota_minima is None:
+            return ["Revisor", "Media_Notas_Dadas"], []
+        media = np.divide(soma, quantidade, out=np.zeros_like(soma), where=quantidade > 0)
+        escolhidos = np.flatnonzero((quantidade > 0) & (media > nota_minima))
+        linhas = [(nomes[i], float(media[i])) for i in escolhidos]
+        return ["Revisor", "Media_Notas_Dadas"], sorted(linhas, key=lambda linha: -linha[1])
+
+    def _revisores_por_area(self, minimo_revisores):
+        codigos, nomes = self._fatorada("Area", "Nome_Area")
+        grupos = _consultar(_mapa(self._coluna("Area", "Cod_Area"), codigos), self._coluna("Revisor_Area", "Cod_Area"))
+        unidas = grupos != NULO
+        contagem = np.bincount(grupos[unidas & (self._coluna("Revisor_Area", "ID_Revisor") != NULO)],
+                               minlength=len(nomes))
+        presentes = np.bincount(grupos[unidas], minlength=len(nomes))
+        if minimo_revisores is None:
+            return ["Nome_Area", "Qtd_Revisores"], []
+        linhas = [(nomes[i], int(contagem[i])) for i in np.flatnonzero((presentes > 0) & (contagem >= minimo_revisores))]
+        return ["Nome_Area", "Qtd_Revisores"], sorted(linhas, key=lambda linha: (linha[0] is not None, linha[0] or ""))
+
+    def _soma_notas_por_ano(self, soma_minima):
+        codigos, anos = self._fatorada("Edicao", "Ano")
+        ano_por_edicao = _mapa(self._coluna("Edicao", "Cod_Edicao"), codigos)
+        ano_por_artigo = _mapa(self._coluna("Artigo", "Cod_Artigo"),
+                               _consultar(ano_por_edicao, self._coluna("Artigo", "Cod_Edicao")))
+        grupos = _consultar(ano_por_artigo, self._coluna("Revisao", "Cod_Artigo"))
+        notas = self._coluna("Revisao", "Nota")
+        com_nota = (grupos != NULO) & ~np.isnan(notas)
+        soma = np.bincount(grupos[com_nota], weights=notas[com_nota], minlength=len(anos))
+        quantidade = np.bincount(grupos[com_nota], minlength=len(anos))
+        if soma_minima is None:
+            return ["Ano", "Soma_Notas"], []
+        escolhidos = np.flatnonzero((quantidade > 0) & (soma > soma_minima))
+        linhas = [(anos[i], float(soma[i])) for i in escolhidos]
+        return ["Ano", "Soma_Notas"], sorted(linhas, key=lambda linha: -linha[1])
+
+    def _artigos_por_autor(self):
+        nome_por_usuario, nomes = self._nomes_por_usuario()
+        grupos = _consultar(nome_por_usuario, self._coluna("Autoria", "Cod_Autor"))
+        com_artigo = (grupos != NULO) & (self._coluna("Autoria", "Cod_Artigo") != NULO)
+        contagem = np.bincount(grupos[com_artigo], minlength=len(nomes))
+        linhas = [(nomes[i], int(contagem[i])) for i in np.flatnonzero(contagem >= 1)]
+        return ["Autor", "Total_Artigos"], sorted(linhas, key=lambda linha: -linha[1])
+
+    def executar(self, num, valores=None, controle=None):
+        """Resultado (colunas, linhas) da consulta `num` do catálogo, com os mesmos nomes de coluna do SQL.
+
+        Um cancelamento durante a atualização das cópias interrompe a leitura; depois dela, impede a agregação.
+        """
+        from catalogo import parametros
+
+        if num not in CONSULTAS_ANALITICAS:
+            raise ValueError(f"A consulta {num} não tem versão colunar (disponíveis: {sorted(CONSULTAS_ANALITICAS)})")
+        controle = controle or ControleExecucao(tempo_limite_s=None)
+        self.atualizar(controle)
+        if controle.cancelado:
+            controle.motivo = "Consulta cancelada pelo usuário"
+            raise controle.abortar()
+        with self.trava:
+            return getattr(self, CONSULTAS_ANALITICAS[num])(**parametros(num, valores))
+
+    def fechar(self):
+        self._conn.close()
+
+CONSULTAS_ANALITICAS = {
+    8: "_status_por_quantidade",
+    9: "_media_por_revisor",
+    10: "_revisores_por_area",
+    11: "_soma_notas_por_ano",
+    12: "_artigos_por_autor",
+}
+
+def main():
+    import argparse
+    from banco_de_dados import DB_PATH
+    from catalogo import CONSULTAS, interpretar_valor, parametros
+
+    parser = argparse.ArgumentParser(description="Consultas 8-12 em cópias colunares (NumPy), comparadas ao SQLite.")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    parser.add_argument("--consultas", default=None, help="Números das consultas separados por vírgula (padrão: 8-12)")
+    parser.add_argument("--param", action="append", default=[], metavar="NOME=VALOR",
+                        help="Parâmetro nomeado; pode repetir")
+    args = parser.parse_args()
+
+    numeros = [int(n) for n in args.consultas.split(",")] if args.consultas else sorted(CONSULTAS_ANALITICAS)
+    valores = {}
+    for atribuicao in args.param:
+        nome, _, texto = atribuicao.partition("=")
+        valores[nome.strip()] = interpretar_valor(texto)
+
+    analitico = AnaliticoColunar(args.db)
+    inicio = time.perf_counter()
+    analitico.atualizar()
+    print(f"Cópias colunares carregadas em {time.perf_counter() - inicio:.2f} s "
+          f"({analitico.tamanho_bytes() / 1024 / 1024:.1f} MB)")
+
+    conn = sqlite3.connect(args.db)
+    for num in numeros:
+        inicio = time.perf_counter()
+        _, linhas = analitico.executar(num, valores)
+        colunar_ms = (time.perf_counter() - inicio) * 1000
+
+        inicio = time.perf_counter()
+        esperadas = conn.execute(CONSULTAS[num]["sql"], parametros(num, valores)).fetchall()
+        sql_ms = (time.perf_counter() - inicio) * 1000
+
+        iguais = len(linhas) == len(esperadas) and all(
+            obtida[0] == esperada[0] and abs(obtida[1] - esperada[1]) <= 1e-6 * max(1.0, abs(esperada[1]))
+            for obtida, esperada in zip(sorted(linhas, key=repr), sorted(esperadas, key=repr))
+        )
+        print(f"  {num:>2}. {CONSULTAS[num]['nome']:<45} colunar {colunar_ms:8.1f} ms | "
+              f"SQL original {sql_ms:8.1f} ms | {'✓ mesmo resultado' if iguais else '✗ DIFERENTE'}")
+    conn.close()
+    analitico.fechar()
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,31 @@
 import streamlit as st
 import sqlite3
 import pandas as pd
-from datetime import datetime, timedelta
-import random
+import os
+import time
+from banco_de_dados import DB_PATH, ler_contadores
+from catalogo import CONSULTAS, interpretar_valor, parametros, sql_para
+from assistente_indices import analisar_consulta
+from pool_conexoes import PoolConexoes
+from cache_resultados import CacheResultados, normalizar_sql
+from paginacao import (
+    LIMITE_LINHAS_MATERIALIZADAS, TAMANHOS_PAGINA, buscar_linhas, buscar_pagina,
+    contar_em_segundo_plano, e_consulta_leitura
+)
+from exportacao import FORMATOS, exportar_para_temporario, formatos_disponiveis
+from limites_execucao import TEMPO_LIMITE_PADRAO_S, ControleExecucao
+from executor_consultas import ExecutorConsultas, FilaCheia
+from resultado_colunar import ResultadoColunar
+from script_sql import RelatorioScript, dividir_comandos, executar_script
+from busca_textual import busca_disponivel, buscar_artigos, buscar_pareceres
+from modelos_banco import ModeloIndisponivel, preparar_modelo, resetar_banco
+from metricas import PORTA_METRICAS, MetricasConsultas
+from backup import criar_backup, formatar_bytes, listar_backups, restaurar_backup
+from perfil_consultas import perfilar, resumo_tempos
+from analitico_colunar import CONSULTAS_ANALITICAS, AnaliticoColunar, numpy_disponivel
+from recomendacao_revisores import (
+    IndiceRevisores, desfazer_reserva, gravar_atribuicoes, interpretar_intervalos, recomendar_lote
+)
 
 st.set_page_config(
     page_title="Sistema de Submissão de Artigos - SQL Runner",
@@ -10,465 +33,424 @@ st.set_page_config(
     layout="wide"
 )
 
-DB_PATH = "submissao.db"
-
-def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.executescript("""
-        DROP TABLE IF EXISTS Revisor_Area;
-        DROP TABLE IF EXISTS Revisao;
-        DROP TABLE IF EXISTS Autoria;
-        DROP TABLE IF EXISTS Artigo_Area;
-        DROP TABLE IF EXISTS Artigo;
-        DROP TABLE IF EXISTS Chamada_Especial;
-        DROP TABLE IF EXISTS Edicao_Regular;
-        DROP TABLE IF EXISTS Edicao;
-        DROP TABLE IF EXISTS Area;
-        DROP TABLE IF EXISTS Editor;
-        DROP TABLE IF EXISTS Revisor;
-        DROP TABLE IF EXISTS Autor;
-        DROP TABLE IF EXISTS Usuario;
-    """)
-    
-    cursor.executescript("""
-        CREATE TABLE Usuario (
-            ID_Usuario INTEGER PRIMARY KEY AUTOINCREMENT,
-            Nome TEXT NOT NULL,
-            Email TEXT NOT NULL,
-            Senha TEXT NOT NULL,
-            Instituicao TEXT,
-            Data_Cadastro DATE NOT NULL
-        );
-        
-        CREATE TABLE Autor (
-            ID_Usuario INTEGER PRIMARY KEY,
-            ORCID TEXT,
-            Bio_Resumida TEXT,
-            FOREIGN KEY (ID_Usuario) REFERENCES Usuario(ID_Usuario)
-        );
-        
-        CREATE TABLE Revisor (
-            ID_Usuario INTEGER PRIMARY KEY,
-            Nota_Media REAL,
-            FOREIGN KEY (ID_Usuario) REFERENCES Usuario(ID_Usuario)
-        );
-        
-        CREATE TABLE Editor (
-            ID_Usuario INTEGER PRIMARY KEY,
-            Cargo TEXT,
-            Ativo BOOLEAN DEFAULT 1,
-            FOREIGN KEY (ID_Usuario) REFERENCES Usuario(ID_Usuario)
-        );
-        
-        CREATE TABLE Area (
-            Cod_Area INTEGER PRIMARY KEY AUTOINCREMENT,
-            Nome_Area TEXT NOT NULL,
-            Descricao TEXT
-        );
-        
-        CREATE TABLE Edicao (
-            Cod_Edicao INTEGER PRIMARY KEY AUTOINCREMENT,
-            Ano INTEGER NOT NULL,
-            Status TEXT
-        );
-        
-        CREATE TABLE Edicao_Regular (
-            Cod_Edicao INTEGER PRIMARY KEY,
-            Volume INTEGER,
-            Numero INTEGER,
-            FOREIGN KEY (Cod_Edicao) REFERENCES Edicao(Cod_Edicao)
-        );
-        
-        CREATE TABLE Chamada_Especial (
-            Cod_Edicao INTEGER PRIMARY KEY,
-            Titulo_Tematico TEXT,
-            Descricao TEXT,
-            Data_Limite DATE,
-            FOREIGN KEY (Cod_Edicao) REFERENCES Edicao(Cod_Edicao)
-        );
-        
-        CREATE TABLE Artigo (
-            Cod_Artigo INTEGER PRIMARY KEY AUTOINCREMENT,
-            Titulo TEXT NOT NULL,
-            Resumo TEXT,
-            Arquivo TEXT,
-            Status TEXT,
-            Cod_Edicao INTEGER NOT NULL,
-            FOREIGN KEY (Cod_Edicao) REFERENCES Edicao(Cod_Edicao)
-        );
-        
-        CREATE TABLE Artigo_Area (
-            Cod_Artigo INTEGER,
-            Cod_Area INTEGER,
-            PRIMARY KEY (Cod_Artigo, Cod_Area),
-            FOREIGN KEY (Cod_Artigo) REFERENCES Artigo(Cod_Artigo),
-            FOREIGN KEY (Cod_Area) REFERENCES Area(Cod_Area)
-        );
+@st.cache_resource
+def obter_pool():
+    return PoolConexoes(DB_PATH)
+
+@st.cache_resource
+def obter_cache():
+    return CacheResultados()
+
+@st.cache_resource
+def obter_executor():
+    return ExecutorConsultas(max_trabalhadores=4)
+
+@st.cache_resource
+def obter_indice_revisores():
+    return IndiceRevisores()
+
+@st.cache_resource
+def obter_analitico():
+    return AnaliticoColunar(DB_PATH)
+
+@st.cache_resource
+def obter_metricas():
+    metricas = MetricasConsultas()
+    try:
+        metricas.servir(int(os.environ.get("METRICAS_PORTA", PORTA_METRICAS)))
+    except OSError:
+        pass
+    return metricas
+
+MAX_TAREFAS_EXIBIDAS = 5
+
+LIMITE_RESULTADOS_BUSCA = 20
+
+pool = obter_pool()
+cache = obter_cache()
+
+def execute_query(query, limite_linhas=LIMITE_LINHAS_MATERIALIZADAS, controle=None, parametros=None,
+                  continuar_em_erro=False, perfil=False):
+    inicio = time.perf_counter()
+    resultado, erro = _executar(query, limite_linhas, controle, parametros, continuar_em_erro, perfil)
+    
+    linhas = bytes_resultado = None
+    if isinstance(resultado, ResultadoColunar):
+        linhas, bytes_resultado = len(resultado), resultado.tamanho_bytes()
+    elif isinstance(resultado, RelatorioScript):
+        linhas = resultado.linhas_afetadas
+    obter_metricas().registrar(query, time.perf_counter() - inicio, linhas, bytes_resultado, erro, "app", parametros)
+    return resultado, erro
+
+def _executar(query, limite_linhas, controle, parametros, continuar_em_erro, perfil):
+    try:
+        controle = controle or ControleExecucao()
+        parametros = parametros or {}
         
-        CREATE TABLE Autoria (
-            Cod_Autor INTEGER,
-            Cod_Artigo INTEGER,
-            Ordem_Autoria INTEGER,
-            PRIMARY KEY (Cod_Autor, Cod_Artigo),
-            FOREIGN KEY (Cod_Autor) REFERENCES Autor(ID_Usuario),
-            FOREIGN KEY (Cod_Artigo) REFERENCES Artigo(Cod_Artigo)
-        );
+        comandos = dividir_comandos(query)
+        if len(comandos) > 1:
+            with pool.escrita() as conn:
+                relatorio = executar_script(conn, comandos, controle, continuar_em_erro)
+            cache.invalidar()
+            return relatorio, None
         
-        CREATE TABLE Revisao (
-            Cod_Artigo INTEGER,
-            Cod_Revisor INTEGER,
-            Parecer TEXT,
-            Nota REAL,
-            Data_Entrega DATE,
-            PRIMARY KEY (Cod_Artigo, Cod_Revisor),
-            FOREIGN KEY (Cod_Artigo) REFERENCES Artigo(Cod_Artigo),
-            FOREIGN KEY (Cod_Revisor) REFERENCES Revisor(ID_Usuario)
-        );
+        query_upper = query.strip().upper()
+        is_write_command = any(query_upper.startswith(cmd) for cmd in ['INSERT', 'UPDATE', 'DELETE', 'CREATE', 'DROP', 'ALTER', 'REPLACE'])
         
-        CREATE TABLE Revisor_Area (
-            ID_Revisor INTEGER,
-            Cod_Area INTEGER,
-            PRIMARY KEY (ID_Revisor, Cod_Area),
-            FOREIGN KEY (ID_Revisor) REFERENCES Revisor(ID_Usuario),
-            FOREIGN KEY (Cod_Area) REFERENCES Area(Cod_Area)
-        );
-    """)
+        if is_write_command:
+            with pool.escrita() as conn, controle.aplicar(conn):
+                cursor = conn.execute(query, parametros)
+                rows_affected = cursor.rowcount
+            cache.invalidar()
+            return f"Comando executado com sucesso! {rows_affected} linha(s) afetada(s).", None
+        elif perfil:
+            with pool.leitura() as conn:
+                colunas, linhas, truncado, medicoes = perfilar(conn, query, parametros, controle, limite_linhas)
+            inicio = time.perf_counter()
+            resultado = ResultadoColunar.do_cursor(colunas, linhas, truncado)
+            medicoes["tempos"]["colunar_ms"] = (time.perf_counter() - inicio) * 1000
+            resultado.perfil = medicoes
+            return resultado, None
+        else:
+            versao = pool.versao_dados()
+            variante = (limite_linhas, tuple(sorted(parametros.items())))
+            resultado = cache.obter(query, versao, variante)
+            if resultado is None:
+                with pool.leitura() as conn:
+                    colunas, linhas, truncado = buscar_linhas(conn, query, limite_linhas, controle, parametros)
+                resultado = ResultadoColunar.do_cursor(colunas, linhas, truncado)
+                cache.guardar(query, versao, resultado, variante)
+            return resultado, None
+    except Exception as e:
+        return None, str(e)
+
+def execute_analitico(query, controle=None, num=None, parametros=None):
+    """Consulta `num` do catálogo pelas cópias colunares (NumPy), com o mesmo formato de resultado do SQLite."""
+    inicio = time.perf_counter()
+    try:
+        colunas, linhas = obter_analitico().executar(num, parametros, controle)
+        resultado, erro = ResultadoColunar.do_cursor(colunas, linhas), None
+    except Exception as e:
+        resultado, erro = None, str(e)
+    
+    linhas = bytes_resultado = None
+    if resultado is not None:
+        linhas, bytes_resultado = len(resultado), resultado.tamanho_bytes()
+    obter_metricas().registrar(query, time.perf_counter() - inicio, linhas, bytes_resultado, erro, "analitico",
+                               parametros)
+    return resultado, erro
+
+def sql_da_consulta(num):
+    with obter_pool().leitura() as conn:
+        return sql_para(conn, num)
+
+def analisar_indices(query, parametros=None):
+    try:
+        with obter_pool().leitura() as conn:
+            alertas = analisar_consulta(conn, query, parametros or {})
+        return alertas, None
+    except Exception as e:
+        return None, str(e)
+
+def exibir_alertas_indices(alertas):
+    if not alertas:
+        st.success("Nenhuma varredura completa (SCAN) ou índice automático no plano.")
+        return
+    
+    for alerta in alertas:
+        st.markdown(f"**{alerta['tipo']}** em `{alerta['tabela']}`: `{alerta['detalhe']}`")
+        if alerta.get("sugestao"):
+            st.code(alerta["sugestao"], language="sql")
+        elif alerta.get("observacao"):
+            st.caption(alerta["observacao"])
+
+def exibir_resultado_paginado(controle):
+    sql = st.session_state["consulta_paginada"]
+    parametros_consulta = st.session_state.get("parametros_paginados", {})
+    contagem = st.session_state["contagem_paginada"]
+    
+    total = None
+    if contagem.done():
+        if contagem.exception():
+            st.warning(f"Não foi possível contar as linhas: {contagem.exception()}")
+        else:
+            total = contagem.result()
     
-    usuarios = [
-        ('João Silva', 'joao.silva@univ.edu.br', 'senha123', 'Universidade A', '2023-01-15'),
-        ('Maria Santos', 'maria.santos@inst.org', 'senha456', 'Instituto B', '2023-02-20'),
-        ('Pedro Souza', 'pedro.souza@tech.com', 'senha789', 'Tech Solutions', '2023-03-10'),
-        ('Ana Oliveira', 'ana.oliveira@univ.edu.br', 'senhaabc', 'Universidade A', '2023-03-15'),
-        ('Carlos Pereira', 'carlos.pereira@univ.c', 'senhadef', 'Universidade C', '2023-01-10'),
-        ('Fernanda Costa', 'fernanda.costa@lab.net', 'senhaghi', 'Laboratório X', '2023-02-28'),
-        ('Lucas Almeida', 'lucas.almeida@univ.edu.br', 'senhajkl', 'Universidade A', '2023-04-05'),
-        ('Julia Lima', 'julia.lima@inst.org', 'senhamno', 'Instituto B', '2023-04-20'),
-        ('Marcos Rocha', 'marcos.rocha@editora.com', 'senhapqr', 'Editora Global', '2022-11-01'),
-        ('Patricia Gomes', 'patricia.gomes@univ.c', 'senhastu', 'Universidade C', '2022-12-15'),
-        ('Rafael Mendes', 'rafael.mendes@univ.edu.br', 'senhavwx', 'Universidade A', '2022-10-30'),
-        ('Sofia Martins', 'sofia.martins@tech.com', 'senhayz1', 'Tech Solutions', '2023-01-05')
-    ]
+    col_tamanho, col_pagina, col_total = st.columns([1, 1, 2])
     
-    cursor.executemany("""
-        INSERT INTO Usuario (Nome, Email, Senha, Instituicao, Data_Cadastro) 
-        VALUES (?, ?, ?, ?, ?)
-    """, usuarios)
+    with col_tamanho:
+        tamanho_pagina = st.selectbox("Linhas por página", TAMANHOS_PAGINA, index=1)
     
-    autores = [
-        (1, '0000-0001-2345-6789', 'Pesquisador em IA.'),
-        (2, '0000-0002-3456-7890', 'Especialista em Banco de Dados.'),
-        (3, '0000-0003-4567-8901', 'Engenheiro de Software Sênior.'),
-        (4, '0000-0004-5678-9012', 'Doutoranda em Redes.')
-    ]
+    total_paginas = max(1, -(-total // tamanho_pagina)) if total is not None else None
     
-    cursor.executemany("""
-        INSERT INTO Autor (ID_Usuario, ORCID, Bio_Resumida) 
-        VALUES (?, ?, ?)
-    """, autores)
+    with col_pagina:
+        pagina = st.number_input("Página", min_value=1, max_value=total_paginas, step=1, key="pagina")
     
-    revisores = [
-        (5, 9.5),
-        (6, 8.7),
-        (7, 9.0),
-        (8, 7.5)
-    ]
+    with col_total:
+        if total is None:
+            st.caption("Total de linhas: calculando em segundo plano...")
+            st.button("Atualizar contagem")
+        else:
+            st.caption(f"Total de linhas: {total} | Página {pagina} de {total_paginas}")
     
-    cursor.executemany("""
-        INSERT INTO Revisor (ID_Usuario, Nota_Media) 
-        VALUES (?, ?)
-    """, revisores)
+    try:
+        with obter_pool().leitura() as conn:
+            colunas, linhas = buscar_pagina(conn, sql, int(pagina), tamanho_pagina, parametros_consulta, controle)
+    except Exception as e:
+        st.error(f"Erro na execução: {e}")
+        return
+    
+    st.subheader("Resultado da Consulta")
+    st.dataframe(
+        pd.DataFrame.from_records(linhas, columns=colunas, coerce_float=True),
+        use_container_width=True,
+        height=400
+    )
+
+def exibir_exportacao(controle):
+    sql = st.session_state["ultima_consulta"]
+    
+    st.subheader("Exportar Resultado")
+    col_formato, col_gerar = st.columns([2, 1])
+    
+    with col_formato:
+        formato = st.selectbox("Formato", formatos_disponiveis())
+    
+    with col_gerar:
+        st.markdown("")
+        gerar = st.button("Gerar arquivo", use_container_width=True)
+    
+    if gerar:
+        try:
+            with st.spinner("Exportando resultado..."):
+                with obter_pool().leitura() as conn:
+                    caminho, linhas = exportar_para_temporario(
+                        conn, sql, formato, parametros=st.session_state.get("ultimos_parametros", {}),
+                        controle=controle
+                    )
+        except Exception as e:
+            st.error(f"Erro na exportação: {e}")
+            return
+        
+        anterior = st.session_state.get("arquivo_exportado")
+        if anterior and os.path.exists(anterior["caminho"]):
+            os.remove(anterior["caminho"])
+        st.session_state["arquivo_exportado"] = {"caminho": caminho, "formato": formato, "linhas": linhas}
+    
+    exportado = st.session_state.get("arquivo_exportado")
+    if exportado and os.path.exists(exportado["caminho"]):
+        with open(exportado["caminho"], "rb") as arquivo:
+            st.download_button(
+                label=f"Download {exportado['formato']} ({exportado['linhas']} linhas)",
+                data=arquivo,
+                file_name="resultado_query" + FORMATOS[exportado["formato"]]["extensao"],
+                mime=FORMATOS[exportado["formato"]]["mime"]
+            )
+
+def exibir_tarefa(tarefa, principal):
+    if not tarefa.concluida:
+        progresso = tarefa.progresso()
+        st.info(
+            f"Consulta #{tarefa.id} {progresso['estado']}... {progresso['tempo_s']:.1f} s, "
+            f"~{progresso['passos_vm']:,} instruções da VM, {progresso['linhas']} linha(s) lida(s)"
+        )
+        st.button("Cancelar", key=f"cancelar_{tarefa.id}", on_click=tarefa.cancelar)
+        
+        colunas, linhas = tarefa.linhas_parciais()
+        if linhas:
+            st.caption("Primeiras linhas já lidas:")
+            st.dataframe(pd.DataFrame.from_records(linhas, columns=colunas), use_container_width=True)
+        return
+    
+    resultado, erro = tarefa.resultado()
+    
+    if erro:
+        st.error(f"Erro na execução: {erro}")
+    elif isinstance(resultado, ResultadoColunar):
+        st.success(f"Consulta executada com sucesso! {len(resultado)} linha(s) retornada(s).")
+        if resultado.truncado:
+            st.warning(
+                f"Resultado limitado às primeiras {len(resultado)} linhas. "
+                "Use o modo paginado para navegar pelo resultado completo."
+            )
+        
+        inicio = time.perf_counter()
+        df = resultado.para_dataframe()
+        if resultado.perfil and "dataframe_ms" not in resultado.perfil["tempos"]:
+            resultado.perfil["tempos"]["dataframe_ms"] = (time.perf_counter() - inicio) * 1000
+        
+        st.subheader("Resultado da Consulta")
+        st.dataframe(
+            df, 
+            use_container_width=True,
+            height=400
+        )
+        
+        if resultado.perfil:
+            exibir_perfil(resultado.perfil)
+        
+        if principal:
+            st.session_state["ultima_consulta"] = tarefa.sql
+            st.session_state["ultimos_parametros"] = tarefa.argumentos.get("parametros") or {}
+    elif isinstance(resultado, RelatorioScript):
+        if resultado.erros:
+            st.warning(f"Script executado com erros ignorados. {resultado.resumo()}")
+        else:
+            st.success(f"Script executado em uma única transação. {resultado.resumo()}")
+        st.dataframe(
+            pd.DataFrame.from_records(resultado.comandos),
+            use_container_width=True,
+            height=400
+        )
+    else:
+        st.success(resultado)
+
+def exibir_perfil(perfil):
+    st.subheader("Plano e Perfil")
+    st.caption(f"Tempos: {resumo_tempos(perfil)}")
+    
+    col_passos, col_retornadas, col_examinadas = st.columns(3)
+    col_passos.metric("Instruções da VM", f"~{perfil['passos_vm']:,}",
+                      help=f"Contadas pelo progress handler a cada {perfil['granularidade_vm']} instruções")
+    col_retornadas.metric("Linhas retornadas", f"{perfil['linhas_retornadas']:,}")
+    col_examinadas.metric("Linhas em varreduras completas", f"≥ {perfil['linhas_examinadas_estimadas']:,}",
+                          help="Soma do tamanho (≈ MAX(rowid)) das tabelas com SCAN no plano")
+    
+    st.code(perfil["arvore"] or "(sem plano)", language="text")
+    
+    indicadores = perfil["indicadores_plano"]
+    st.caption(
+        f"Varreduras completas: {indicadores['varreduras_completas']} · "
+        f"ordenações em B-tree temporária: {indicadores['ordenacoes']} · "
+        f"índices automáticos: {indicadores['indices_automaticos']} · "
+        f"programa com {perfil['tamanho_programa']} opcodes"
+    )
+    st.dataframe(
+        pd.DataFrame(perfil["opcodes"].most_common(), columns=["Opcode", "Ocorrências no programa"]),
+        use_container_width=True,
+        hide_index=True,
+        height=250
+    )
+
+def exibir_busca():
+    col_texto, col_alvo = st.columns([3, 1])
     
-    editores = [
-        (9, 'Editor Chefe', 1),
-        (10, 'Editor Associado', 1),
-        (11, 'Editor Convidado', 0),
-        (12, 'Editor Técnico', 1)
-    ]
+    with col_texto:
+        texto = st.text_input(
+            "Buscar em títulos, resumos e pareceres",
+            placeholder='redes neurais, "ray tracing", otimiz*'
+        )
     
-    cursor.executemany("""
-        INSERT INTO Editor (ID_Usuario, Cargo, Ativo) 
-        VALUES (?, ?, ?)
-    """, editores)
-    
-    areas = [
-        ('Inteligência Artificial', 'Estudo de agentes inteligentes e aprendizado de máquina.'),
-        ('Banco de Dados', 'Gerenciamento, modelagem e otimização de dados.'),
-        ('Engenharia de Software', 'Processos, métodos e ferramentas para desenvolvimento.'),
-        ('Redes de Computadores', 'Comunicação de dados e protocolos.'),
-        ('Segurança da Informação', 'Proteção de sistemas e dados.'),
-        ('Sistemas Operacionais', 'Gerenciamento de recursos de hardware e software.'),
-        ('Interação Humano-Computador', 'Design e avaliação de interfaces.'),
-        ('Computação Gráfica', 'Processamento de imagens e renderização.'),
-        ('Bioinformática', 'Aplicação de computação em biologia.'),
-        ('Internet das Coisas', 'Conectividade de dispositivos embarcados.')
-    ]
+    with col_alvo:
+        alvo = st.radio("Onde buscar", ["Artigos", "Pareceres"], horizontal=True)
     
-    cursor.executemany("""
-        INSERT INTO Area (Nome_Area, Descricao) 
-        VALUES (?, ?)
-    """, areas)
-    
-    edicoes = [
-        (2023, 'Fechada'),
-        (2023, 'Fechada'),
-        (2024, 'Publicada'),
-        (2024, 'Publicada'),
-        (2024, 'Em andamento'),
-        (2025, 'Aberta'),
-        (2025, 'Aberta'),
-        (2025, 'Planejada'),
-        (2025, 'Planejada'),
-        (2026, 'Planejada')
-    ]
+    if not texto.strip():
+        return
     
-    cursor.executemany("""
-        INSERT INTO Edicao (Ano, Status) 
-        VALUES (?, ?)
-    """, edicoes)
-    
-    edicoes_regulares = [
-        (1, 10, 1),
-        (2, 10, 2),
-        (3, 11, 1),
-        (4, 11, 2),
-        (5, 11, 3)
-    ]
+    try:
+        inicio = time.perf_counter()
+        with obter_pool().leitura() as conn:
+            if not busca_disponivel(conn):
+                st.warning("Índice de busca não encontrado. Recrie o banco ou rode `python busca_textual.py --reconstruir`.")
+                return
+            buscar = buscar_artigos if alvo == "Artigos" else buscar_pareceres
+            colunas, linhas = buscar(conn, texto, LIMITE_RESULTADOS_BUSCA)
+        tempo_ms = (time.perf_counter() - inicio) * 1000
+    except sqlite3.Error as e:
+        st.error(f"Busca inválida: {e}")
+        return
+    
+    st.caption(f"{len(linhas)} resultado(s) em {tempo_ms:.1f} ms, ordenados por relevância (BM25)")
+    for linha in linhas:
+        registro = dict(zip(colunas, linha))
+        if alvo == "Artigos":
+            detalhe = registro["Status"]
+        else:
+            detalhe = f"revisor {registro['Cod_Revisor']}, nota {registro['Nota']}"
+        st.markdown(f"**#{registro['Cod_Artigo']} {registro['Titulo']}** · {detalhe}  \n{registro['Trecho']}")
+
+def indice_revisores():
+    """Índice compartilhado entre as sessões, atualizado com as alterações do banco quando alguém gravou."""
+    indice = obter_indice_revisores()
+    versao = pool.versao_dados()
+    if indice.versao != versao:
+        with pool.leitura() as conn:
+            indice.atualizar(conn, versao)
+    return indice
+
+def exibir_recomendacao():
+    col_artigos, col_quantidade = st.columns([3, 1])
     
-    cursor.executemany("""
-        INSERT INTO Edicao_Regular (Cod_Edicao, Volume, Numero) 
-        VALUES (?, ?, ?)
-    """, edicoes_regulares)
-    
-    chamadas = [
-        (6, 'Avanços em IA Generativa', 'Foco em LLMs e difusão.', '2025-06-30'),
-        (7, 'Segurança em IoT', 'Desafios de privacidade em dispositivos conectados.', '2025-07-15'),
-        (8, 'Big Data na Saúde', 'Análise de grandes volumes de dados médicos.', '2025-09-01'),
-        (9, 'Computação Quântica', 'Algoritmos e arquiteturas quânticas.', '2025-10-20'),
-        (10, 'Cidades Inteligentes', 'Tecnologia aplicada ao urbanismo.', '2026-01-15')
-    ]
+    with col_artigos:
+        texto = st.text_input("Artigos (códigos ou intervalos)", placeholder="1, 5, 10-20")
     
-    cursor.executemany("""
-        INSERT INTO Chamada_Especial (Cod_Edicao, Titulo_Tematico, Descricao, Data_Limite) 
-        VALUES (?, ?, ?, ?)
-    """, chamadas)
-    
-    artigos = [
-        ('Uso de Redes Neurais em Finanças', 'Análise preditiva de mercado.', 'artigo1.pdf', 'Aceito', 1),
-        ('Otimização de Queries SQL', 'Novas técnicas de indexação.', 'artigo2.pdf', 'Publicado', 1),
-        ('Metodologias Ágeis em Startups', 'Estudo de caso.', 'artigo3.pdf', 'Rejeitado', 2),
-        ('Protocolos de Roteamento', 'Comparação entre OSPF e BGP.', 'artigo4.pdf', 'Publicado', 2),
-        ('Criptografia Pós-Quântica', 'Algoritmos resistentes a computadores quânticos.', 'artigo5.pdf', 'Em Revisão', 6),
-        ('Interface para Idosos', 'Acessibilidade digital.', 'artigo6.pdf', 'Submetido', 7),
-        ('Renderização em Tempo Real', 'Técnicas de Ray Tracing.', 'artigo7.pdf', 'Aceito', 3),
-        ('Genômica Computacional', 'Alinhamento de sequências.', 'artigo8.pdf', 'Em Revisão', 8),
-        ('Sensores em Agricultura', 'IoT no campo.', 'artigo9.pdf', 'Submetido', 9),
-        ('Virtualização de Servidores', 'Docker e Kubernetes.', 'artigo10.pdf', 'Publicado', 4)
-    ]
+    with col_quantidade:
+        por_artigo = st.number_input("Revisores por artigo", min_value=1, max_value=10, value=3)
     
-    cursor.executemany("""
-        INSERT INTO Artigo (Titulo, Resumo, Arquivo, Status, Cod_Edicao) 
-        VALUES (?, ?, ?, ?, ?)
-    """, artigos)
-    
-    artigo_areas = [
-        (1, 1),
-        (2, 2),
-        (3, 3),
-        (4, 4),
-        (5, 5),
-        (6, 7),
-        (7, 8),
-        (8, 9),
-        (9, 10),
-        (10, 6),
-        (1, 2),
-        (9, 4)
-    ]
+    col_recomendar, col_atribuir = st.columns(2)
+    with col_recomendar:
+        recomendar = st.button("Recomendar", use_container_width=True)
+    with col_atribuir:
+        atribuir = st.button("Recomendar e atribuir", use_container_width=True,
+                             help="Grava as recomendações em Revisao (sem parecer nem nota)")
     
-    cursor.executemany("""
-        INSERT INTO Artigo_Area (Cod_Artigo, Cod_Area) 
-        VALUES (?, ?)
-    """, artigo_areas)
-    
-    autorias = [
-        (1, 1, 1),
-        (2, 2, 1),
-        (3, 3, 1),
-        (4, 4, 1),
-        (1, 5, 1),
-        (2, 5, 2),
-        (3, 6, 1),
-        (4, 7, 1),
-        (1, 8, 1),
-        (2, 9, 1),
-        (3, 10, 1),
-        (4, 10, 2)
-    ]
+    if not (recomendar or atribuir) or not texto.strip():
+        return
     
-    cursor.executemany("""
-        INSERT INTO Autoria (Cod_Autor, Cod_Artigo, Ordem_Autoria) 
-        VALUES (?, ?, ?)
-    """, autorias)
-    
-    revisor_areas = [
-        (5, 1),
-        (5, 2),
-        (6, 3),
-        (6, 4),
-        (7, 5),
-        (7, 6),
-        (8, 7),
-        (8, 8),
-        (8, 9),
-        (5, 10)
-    ]
+    try:
+        cods_artigo = interpretar_intervalos(texto)
+    except ValueError:
+        st.error("Informe códigos inteiros separados por vírgula, ou intervalos como 10-20.")
+        return
     
-    cursor.executemany("""
-        INSERT INTO Revisor_Area (ID_Revisor, Cod_Area) 
-        VALUES (?, ?)
-    """, revisor_areas)
-    
-    revisoes = [
-        (1, 5, 'Excelente trabalho, metodologia sólida.', 9.5, '2023-02-10'),
-        (2, 5, 'Bom, mas precisa de revisão bibliográfica.', 7.0, '2023-02-12'),
-        (3, 6, 'Não atende aos requisitos da chamada.', 4.0, '2023-03-01'),
-        (4, 6, 'Muito relevante para a área.', 8.5, '2023-03-05'),
-        (5, 7, 'Inovador, recomendo publicação.', 9.0, '2025-01-10'),
-        (6, 8, 'Amostragem pequena.', 6.0, '2025-02-15'),
-        (7, 8, 'Visualmente impressionante.', 9.0, '2024-05-20'),
-        (8, 5, 'Análise estatística fraca.', 5.5, '2025-03-01'),
-        (9, 6, 'Aplicação prática interessante.', 8.0, '2025-04-10'),
-        (10, 7, 'Bem escrito e fundamentado.', 9.0, '2024-06-01')
+    try:
+        inicio = time.perf_counter()
+        indice = indice_revisores()
+        with indice.trava:
+            if atribuir:
+                with pool.escrita() as conn:
+                    recomendacoes = recomendar_lote(conn, indice, cods_artigo, por_artigo)
+                    try:
+                        inseridas = gravar_atribuicoes(conn, recomendacoes)
+                    except sqlite3.Error:
+                        desfazer_reserva(indice, recomendacoes)
+                        raise
+            else:
+                with pool.leitura() as conn:
+                    recomendacoes = recomendar_lote(conn, indice, cods_artigo, por_artigo)
+                desfazer_reserva(indice, recomendacoes)
+        tempo = time.perf_counter() - inicio
+    except sqlite3.Error as e:
+        st.error(f"Erro ao recomendar revisores: {e}")
+        return
+    
+    linhas = [
+        {"Cod_Artigo": cod, **escolhido}
+        for cod, escolhidos in recomendacoes.items()
+        for escolhido in escolhidos
     ]
+    sem_revisor = [cod for cod, escolhidos in recomendacoes.items() if not escolhidos]
+    
+    st.caption(f"{len(recomendacoes)} artigo(s) em {tempo:.2f} s")
+    if atribuir:
+        st.success(f"✓ {inseridas} atribuição(ões) gravadas em Revisao")
+    if sem_revisor:
+        st.warning(f"Sem revisor elegível (artigo inexistente, sem área ou só com conflitos): {sem_revisor[:20]}")
+    if linhas:
+        st.dataframe(pd.DataFrame(linhas), use_container_width=True, hide_index=True)
+
+def exibir_tarefas(tarefas):
+    *anteriores, atual = tarefas
     
-    cursor.executemany("""
-        INSERT INTO Revisao (Cod_Artigo, Cod_Revisor, Parecer, Nota, Data_Entrega) 
-        VALUES (?, ?, ?, ?, ?)
-    """, revisoes)
-    
-    conn.commit()
-    conn.close()
+    exibir_tarefa(atual, principal=True)
     
-    return "✅ Banco de dados criado e populado com sucesso!"
+    for tarefa in reversed(anteriores):
+        with st.expander(f"Consulta #{tarefa.id} ({tarefa.estado}): {tarefa.sql.strip()[:60]}"):
+            st.code(tarefa.sql, language="sql")
+            exibir_tarefa(tarefa, principal=False)
 
-def execute_query(query):
-    try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        query_upper = query.strip().upper()
-        is_write_command = any(query_upper.startswith(cmd) for cmd in ['INSERT', 'UPDATE', 'DELETE'])
-        
-        if is_write_command:
-            cursor.execute(query)
-            conn.commit()
-            rows_affected = cursor.rowcount
-            conn.close()
-            return f"Comando executado com sucesso! {rows_affected} linha(s) afetada(s).", None
-        else:
-            df = pd.read_sql_query(query, conn)
-            conn.close()
-            return df, None
-    except Exception as e:
-        return None, str(e)
-
-CONSULTAS_PRONTAS = {
-    "Selecione uma consulta...": "",
-    
-    "1. Listar Artigos e Anos de Edição": """
-SELECT A.Titulo, E.Ano, A.Status
-FROM Artigo A
-JOIN Edicao E ON A.Cod_Edicao = E.Cod_Edicao;
-""",
-    
-    "2. Autores e Seus Artigos": """
-SELECT U.Nome AS Autor, AR.Titulo
-FROM Usuario U
-JOIN Autoria AUT ON U.ID_Usuario = AUT.Cod_Autor
-JOIN Artigo AR ON AUT.Cod_Artigo = AR.Cod_Artigo;
-""",
-    
-    "3. Revisores e Suas Áreas de Conhecimento": """
-SELECT U.Nome AS Revisor, AREA.Nome_Area
-FROM Usuario U
-JOIN Revisor R ON U.ID_Usuario = R.ID_Usuario
-JOIN Revisor_Area RA ON R.ID_Usuario = RA.ID_Revisor
-JOIN Area AREA ON RA.Cod_Area = AREA.Cod_Area;
-""",
-    
-    "4. Artigos com Pareceres e Notas": """
-SELECT A.Titulo, U.Nome AS Revisor, R.Nota
-FROM Artigo A
-JOIN Revisao R ON A.Cod_Artigo = R.Cod_Artigo
-JOIN Usuario U ON R.Cod_Revisor = U.ID_Usuario;
-""",
-    
-    "5. Chamadas Especiais e Datas Limite": """
-SELECT CE.Titulo_Tematico, CE.Data_Limite, E.Status
-FROM Chamada_Especial CE
-JOIN Edicao E ON CE.Cod_Edicao = E.Cod_Edicao;
-""",
-    
-    "6. Usuários e Cargos de Editores (LEFT JOIN)": """
-SELECT U.Nome, E.Cargo
-FROM Usuario U
-LEFT JOIN Editor E ON U.ID_Usuario = E.ID_Usuario;
-""",
-    
-    "7. Áreas e Artigos Vinculados (LEFT JOIN)": """
-SELECT AREA.Nome_Area, AR.Titulo
-FROM Area AREA
-LEFT JOIN Artigo_Area AA ON AREA.Cod_Area = AA.Cod_Area
-LEFT JOIN Artigo AR ON AA.Cod_Artigo = AR.Cod_Artigo;
-""",
-    
-    "8. Quantidade de Artigos por Status (HAVING)": """
-SELECT Status, COUNT(*) AS Qtd_Artigos
-FROM Artigo
-GROUP BY Status
-HAVING COUNT(*) > 1
-ORDER BY Qtd_Artigos DESC;
-""",
-    
-    "9. Média de Notas por Revisor (HAVING)": """
-SELECT U.Nome AS Revisor, AVG(R.Nota) AS Media_Notas_Dadas
-FROM Usuario U
-JOIN Revisao R ON U.ID_Usuario = R.Cod_Revisor
-GROUP BY U.Nome
-HAVING AVG(R.Nota) > 7.0
-ORDER BY Media_Notas_Dadas DESC;
-""",
-    
-    "10. Áreas com 2+ Revisores": """
-SELECT A.Nome_Area, COUNT(RA.ID_Revisor) AS Qtd_Revisores
-FROM Area A
-JOIN Revisor_Area RA ON A.Cod_Area = RA.Cod_Area
-GROUP BY A.Nome_Area
-HAVING COUNT(RA.ID_Revisor) >= 2
-ORDER BY A.Nome_Area ASC;
-""",
-    
-    "11. Edições por Soma de Notas (HAVING)": """
-SELECT E.Ano, SUM(REV.Nota) AS Soma_Notas
-FROM Edicao E
-JOIN Artigo A ON E.Cod_Edicao = A.Cod_Edicao
-JOIN Revisao REV ON A.Cod_Artigo = REV.Cod_Artigo
-GROUP BY E.Ano
-HAVING SUM(REV.Nota) > 10
-ORDER BY Soma_Notas DESC;
-""",
-    
-    "12. Contagem de Artigos por Autor": """
-SELECT U.Nome AS Autor, COUNT(AUT.Cod_Artigo) AS Total_Artigos
-FROM Usuario U
-JOIN Autoria AUT ON U.ID_Usuario = AUT.Cod_Autor
-GROUP BY U.Nome
-HAVING COUNT(AUT.Cod_Artigo) >= 1
-ORDER BY Total_Artigos DESC;
-"""
-}
+CONSULTAS_PRONTAS = {"Selecione uma consulta...": None}
+CONSULTAS_PRONTAS.update({f"{num}. {consulta['nome']}": num for num, consulta in CONSULTAS.items()})
 
 st.title("Sistema de Submissão de Artigos em Periódicos")
 st.markdown("### SQL Runner - Trabalho Final de Banco de Dados")
@@ -476,10 +458,31 @@ st.divider()
 
 with st.sidebar:
     st.header("Configurações")
-    
+
+    with st.expander("Dados sintéticos"):
+        fator_escala = st.number_input(
+            "Fator de escala (SF)",
+            min_value=0.0,
+            value=0.0,
+            step=0.01,
+            format="%.3f",
+            help="0 usa os dados de exemplo. SF=1 gera 100 mil usuários, 1 milhão de artigos e 5 milhões de revisões."
+        )
+        semente = st.number_input("Semente", min_value=0, value=42, step=1)
+
+    preparar_modelo()
     if st.button("Resetar/Criar Banco", type="primary", use_container_width=True):
-        with st.spinner("Criando banco de dados..."):
-            mensagem = init_db()
+        try:
+            mensagem = resetar_banco(obter_pool().restaurar, fator_escala, int(semente), gerar=False)
+        except ModeloIndisponivel as erro:
+            preparo = preparar_modelo(fator_escala, int(semente))
+            if preparo.done() and preparo.exception() is not None:
+                st.error(f"Falha ao gerar o modelo: {preparo.exception()}")
+            else:
+                st.info(f"{erro} Ele está sendo gerado em segundo plano; clique de novo quando terminar "
+                        "(ou gere antes com `python modelos_banco.py --apenas-modelo --sf ...`).")
+        else:
+            cache.invalidar()
             st.success(mensagem)
             st.balloons()
     
@@ -491,6 +494,16 @@ with st.sidebar:
         options=list(CONSULTAS_PRONTAS.keys()),
         index=0
     )
+    num_consulta = CONSULTAS_PRONTAS[consulta_selecionada]
+    
+    valores_parametros = {}
+    for nome, padrao in (parametros(num_consulta) if num_consulta else {}).items():
+        chave = f"parametro_{num_consulta}_{nome}"
+        if padrao is None:
+            texto = st.text_input(nome, key=chave, help="Deixe vazio para não filtrar.")
+            valores_parametros[nome] = interpretar_valor(texto)
+        else:
+            valores_parametros[nome] = st.number_input(nome, value=padrao, key=chave)
     
     st.divider()
     
@@ -506,26 +519,109 @@ with st.sidebar:
     """)
     
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
+        with obter_pool().leitura() as conn:
+            contadores = ler_contadores(conn)
         
-        cursor.execute("SELECT COUNT(*) FROM Usuario")
-        num_usuarios = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM Artigo")
-        num_artigos = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM Revisao")
-        num_revisoes = cursor.fetchone()[0]
-        
-        conn.close()
-        
-        st.metric("Usuários", num_usuarios)
-        st.metric("Artigos", num_artigos)
-        st.metric("Revisões", num_revisoes)
+        st.metric("Usuários", contadores["Usuario"])
+        st.metric("Artigos", contadores["Artigo"])
+        st.metric("Revisões", contadores["Revisao"])
         
     except:
         st.warning("Banco ainda não inicializado")
+    
+    with st.expander("Pool de conexões"):
+        saude = obter_pool().saude()
+        if saude["ok"]:
+            st.caption(f"Saudável | journal_mode={saude['journal_mode']} | {saude['latencia_ms']:.1f} ms")
+        else:
+            st.error(f"Pool indisponível: {saude['erro']}")
+        st.json(obter_pool().metricas())
+        st.caption("Executor de consultas")
+        st.json(obter_executor().metricas())
+    
+    with st.expander("Backups"):
+        if st.button("Criar backup", use_container_width=True,
+                     help="Cópia online pela API de backup, em passos de páginas, comprimida com gzip"):
+            with st.spinner("Copiando o banco..."):
+                try:
+                    with obter_pool().leitura() as conn:
+                        relatorio = criar_backup(conn)
+                    st.success(
+                        f"✓ {relatorio['arquivo']}: {formatar_bytes(relatorio['bytes'])} → "
+                        f"{formatar_bytes(relatorio['bytes_comprimidos'])} em {relatorio['segundos']:.1f} s"
+                    )
+                except (OSError, sqlite3.Error) as e:
+                    st.error(f"Falha no backup: {e}")
+        
+        backups = listar_backups()
+        if backups:
+            escolhido = st.selectbox(
+                "Backups disponíveis",
+                options=[backup["caminho"] for backup in backups],
+                format_func=lambda caminho: next(
+                    f"{backup['criado_em']:%d/%m %H:%M:%S} ({formatar_bytes(backup['bytes'])})"
+                    for backup in backups if backup["caminho"] == caminho
+                )
+            )
+            if st.button("Restaurar backup", use_container_width=True):
+                with st.spinner("Restaurando..."):
+                    try:
+                        segundos = restaurar_backup(escolhido, obter_pool().restaurar)
+                        cache.invalidar()
+                        st.success(f"✓ Banco restaurado em {segundos:.1f} s")
+                    except (OSError, sqlite3.Error) as e:
+                        st.error(f"Falha na restauração: {e}")
+        else:
+            st.caption("Nenhum backup criado ainda.")
+    
+    with st.expander("Métricas das consultas"):
+        metricas = obter_metricas()
+        if metricas.servidor:
+            endereco, porta = metricas.servidor.server_address[:2]
+            st.caption(f"Formato Prometheus em http://{endereco}:{porta}/metrics")
+        else:
+            st.caption("Endpoint de métricas desativado (porta ocupada).")
+        st.caption(f"Consultas acima de {metricas.limite_lenta_ms} ms vão para `{os.path.relpath(metricas.caminho_log)}`")
+        resumo_metricas = metricas.resumo()
+        if resumo_metricas:
+            st.dataframe(
+                pd.DataFrame(resumo_metricas)[["consulta", "execucoes", "erros", "media_ms", "maximo_ms", "linhas"]],
+                use_container_width=True,
+                hide_index=True
+            )
+    
+    with st.expander("Cache de resultados"):
+        estatisticas_cache = obter_cache().estatisticas()
+        st.caption(
+            f"Taxa de acerto: {estatisticas_cache['taxa_acerto']:.0%} "
+            f"({estatisticas_cache['acertos']} acertos / {estatisticas_cache['falhas']} falhas)"
+        )
+        st.json(estatisticas_cache)
+        if st.button("Limpar cache", use_container_width=True):
+            obter_cache().invalidar()
+    
+    with st.expander("Limites de execução"):
+        tempo_limite = st.number_input(
+            "Tempo limite (s)",
+            min_value=0.0,
+            value=float(TEMPO_LIMITE_PADRAO_S),
+            step=5.0,
+            help="0 desativa o limite de tempo."
+        )
+        max_passos = st.number_input(
+            "Máximo de instruções da VM",
+            min_value=0,
+            value=0,
+            step=1_000_000,
+            help="Aproxima o volume de linhas examinadas. 0 desativa o limite."
+        )
+        limite_linhas = st.number_input(
+            "Máximo de linhas materializadas",
+            min_value=1,
+            value=LIMITE_LINHAS_MATERIALIZADAS,
+            step=10_000,
+            help="Consultas fora do modo paginado carregam no máximo este número de linhas."
+        )
 
 col1, col2 = st.columns([3, 1])
 
@@ -537,7 +633,7 @@ with col2:
 
 query_sql = st.text_area(
     "Digite ou edite seu comando SQL:",
-    value=CONSULTAS_PRONTAS.get(consulta_selecionada, ""),
+    value=sql_da_consulta(num_consulta) if num_consulta else "",
     height=200,
     placeholder="SELECT * FROM Usuario LIMIT 10;"
 )
@@ -550,37 +646,114 @@ with col_btn1:
 with col_btn2:
     limpar = st.button("Limpar", use_container_width=True)
 
-if executar and query_sql.strip():
-    with st.spinner("Executando consulta..."):
-        resultado, erro = execute_query(query_sql)
-        
-        if erro:
-            st.error(f"Erro na execução: {erro}")
+with col_btn3:
+    analisar = st.button("Analisar índices")
+
+col_opcao1, col_opcao2, col_opcao3, col_opcao4 = st.columns([1, 1, 1, 1])
+
+with col_opcao1:
+    modo_paginado = st.checkbox(
+        "Modo paginado",
+        help="Busca apenas a página visível com LIMIT/OFFSET e conta o total de linhas em segundo plano."
+    )
+
+with col_opcao2:
+    continuar_em_erro = st.checkbox(
+        "Continuar após erro em scripts",
+        help="Com vários comandos no editor, desfaz só o comando com erro (SAVEPOINT) em vez do script inteiro."
+    )
+
+with col_opcao3:
+    explicar = st.checkbox(
+        "Explicar/Perfilar",
+        help="Mostra o plano (EXPLAIN QUERY PLAN), os opcodes e o tempo de cada fase. Ignora o cache de resultados."
+    )
+
+with col_opcao4:
+    modo_analitico = st.checkbox(
+        "Modo analítico (NumPy)",
+        disabled=not numpy_disponivel() or num_consulta not in CONSULTAS_ANALITICAS,
+        help="Consultas 8 a 12 sem edições: agrega cópias colunares das tabelas em memória, "
+             "atualizadas só com as linhas novas quando possível. Requer o pacote numpy."
+    )
+
+if executar and query_sql.strip() and modo_paginado and e_consulta_leitura(query_sql):
+    st.session_state["consulta_paginada"] = query_sql
+    st.session_state["parametros_paginados"] = valores_parametros
+    st.session_state["contagem_paginada"] = contar_em_segundo_plano(
+        obter_pool(), query_sql, ControleExecucao(tempo_limite_s=tempo_limite or None), valores_parametros
+    )
+    st.session_state["pagina"] = 1
+    st.session_state["ultima_consulta"] = query_sql
+    st.session_state["ultimos_parametros"] = valores_parametros
+
+elif executar and query_sql.strip():
+    st.session_state.pop("consulta_paginada", None)
+    
+    controle = ControleExecucao(tempo_limite_s=tempo_limite or None, max_passos=int(max_passos) or None)
+    
+    try:
+        if (
+            modo_analitico and num_consulta in CONSULTAS_ANALITICAS
+            and normalizar_sql(query_sql) == normalizar_sql(sql_da_consulta(num_consulta))
+        ):
+            tarefa = obter_executor().submeter(
+                execute_analitico, query_sql, controle, num=num_consulta, parametros=valores_parametros
+            )
         else:
-            if isinstance(resultado, pd.DataFrame):
-                st.success(f"Consulta executada com sucesso! {len(resultado)} linha(s) retornada(s).")
-                
-                st.subheader("Resultado da Consulta")
-                st.dataframe(
-                    resultado, 
-                    use_container_width=True,
-                    height=400
-                )
-                
-                csv = resultado.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label="Download CSV",
-                    data=csv,
-                    file_name="resultado_query.csv",
-                    mime="text/csv"
-                )
-            else:
-                st.success(resultado)
+            tarefa = obter_executor().submeter(
+                execute_query, query_sql, controle, limite_linhas=int(limite_linhas), parametros=valores_parametros,
+                continuar_em_erro=continuar_em_erro, perfil=explicar
+            )
+        tarefas = st.session_state.setdefault("tarefas", [])
+        tarefas.append(tarefa)
+        del tarefas[:-MAX_TAREFAS_EXIBIDAS]
+    except FilaCheia as e:
+        st.warning(str(e))
 
 elif executar and not query_sql.strip():
     st.warning("Por favor, insira uma consulta SQL.")
 
+if st.session_state.get("tarefas") and "consulta_paginada" not in st.session_state:
+    exibir_tarefas(st.session_state["tarefas"])
+
+if modo_paginado and "consulta_paginada" in st.session_state:
+    exibir_resultado_paginado(
+        ControleExecucao(tempo_limite_s=tempo_limite or None, max_passos=int(max_passos) or None)
+    )
+
+if "ultima_consulta" in st.session_state:
+    exibir_exportacao(ControleExecucao(tempo_limite_s=tempo_limite or None, max_passos=int(max_passos) or None))
+
+if analisar and query_sql.strip():
+    alertas, erro = analisar_indices(query_sql, valores_parametros)
+    
+    st.subheader("Assistente de Índices")
+    if erro:
+        st.error(f"Erro ao analisar o plano: {erro}")
+    else:
+        exibir_alertas_indices(alertas)
+
+with st.expander("Busca textual"):
+    exibir_busca()
+
+with st.expander("Recomendação de revisores"):
+    exibir_recomendacao()
+
+with st.expander("Assistente de índices - consultas prontas"):
+    for nome, num in CONSULTAS_PRONTAS.items():
+        if not num:
+            continue
+        alertas, erro = analisar_indices(sql_da_consulta(num), parametros(num))
+        st.markdown(f"#### {nome}")
+        if erro:
+            st.warning(erro)
+        else:
+            exibir_alertas_indices(alertas)
+
 if limpar:
+    for chave in ["tarefas", "ultima_consulta", "ultimos_parametros", "consulta_paginada", "parametros_paginados"]:
+        st.session_state.pop(chave, None)
     st.rerun()
 
 st.divider()
@@ -589,3 +762,7 @@ st.markdown("""
     <small>Sistema desenvolvido para o Trabalho Final de Banco de Dados | 2025</small>
 </div>
 """, unsafe_allow_html=True)
+
+if any(not tarefa.concluida for tarefa in st.session_state.get("tarefas", [])):
+    time.sleep(0.5)
+    st.rerun()
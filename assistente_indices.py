@@ -0,0 +1,132 @@
+import re
+import sqlite3
+
+PALAVRAS_RESERVADAS = {
+    "ON", "WHERE", "JOIN", "LEFT", "RIGHT", "INNER", "OUTER", "CROSS", "NATURAL", "GROUP",
+    "ORDER", "HAVING", "LIMIT", "UNION", "USING", "AS", "SET", "VALUES", "SELECT"
+}
+
+PADRAO_TABELA = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", re.IGNORECASE)
+PADRAO_SCAN = re.compile(r"^SCAN (\w+)(?: USING (COVERING )?INDEX (\w+))?")
+PADRAO_AUTOMATICO = re.compile(r"^SEARCH (\w+) USING AUTOMATIC (?:PARTIAL )?(?:COVERING )?INDEX \(([^)]*)\)")
+PADRAO_BLOOM = re.compile(r"^BLOOM FILTER ON (\w+) \(([^)]*)\)")
+
+def mapear_aliases(sql):
+    aliases = {}
+    for tabela, alias in PADRAO_TABELA.findall(sql):
+        aliases[tabela] = tabela
+        if alias and alias.upper() not in PALAVRAS_RESERVADAS:
+            aliases[alias] = tabela
+    return aliases
+
+def colunas_filtradas(sql, alias, colunas_tabela=()):
+    """Colunas do alias usadas em comparações (ON/WHERE), na ordem em que aparecem."""
+    colunas = []
+    padrao = re.compile(
+        rf"\b{re.escape(alias)}\.(\w+)\s*(?:=|<|>|<=|>=|IN\b|LIKE\b|BETWEEN\b)"
+        rf"|(?:=|<|>|<=|>=)\s*{re.escape(alias)}\.(\w+)",
+        re.IGNORECASE
+    )
+    for esquerda, direita in padrao.findall(sql):
+        coluna = esquerda or direita
+        if coluna not in colunas:
+            colunas.append(coluna)
+
+    for coluna in colunas_tabela:
+        if coluna not in colunas and re.search(
+            rf"(?<![.\w]){re.escape(coluna)}\s*(?:=|<|>|IN\b|LIKE\b|BETWEEN\b)",
+            sql,
+            re.IGNORECASE
+        ):
+            colunas.append(coluna)
+    return colunas
+
+def sugerir_indice(tabela, colunas):
+    nome = "_".join([f"idx_{tabela}"] + colunas)
+    return f"CREATE INDEX IF NOT EXISTS {nome} ON {tabela} ({', '.join(colunas)});"
+
+def colunas_da_restricao(restricao):
+    return [parte.split("=")[0].strip() for parte in restricao.split(" AND ") if parte.strip()]
+
+def analisar_consulta(conn, sql, parametros=()):
+    """Executa EXPLAIN QUERY PLAN e aponta varreduras completas e índices automáticos."""
+    plano = conn.execute(f"EXPLAIN QUERY PLAN {sql.strip().rstrip(';')}", parametros).fetchall()
+    aliases = mapear_aliases(sql)
+    possui_filtro = re.search(r"\bWHERE\b", sql, re.IGNORECASE) is not None
+
+    alertas = []
+    primeiro_acesso = {}
+
+    for id_no, pai, _, detalhe in plano:
+        acesso = PADRAO_SCAN.match(detalhe) or PADRAO_AUTOMATICO.match(detalhe) or detalhe.startswith("SEARCH ")
+        if acesso and pai not in primeiro_acesso:
+            primeiro_acesso[pai] = id_no
+
+        automatico = PADRAO_AUTOMATICO.match(detalhe) or PADRAO_BLOOM.match(detalhe)
+        if automatico:
+            alias, restricao = automatico.groups()
+            tabela = aliases.get(alias, alias)
+            alertas.append({
+                "tipo": "AUTOMATIC INDEX" if detalhe.startswith("SEARCH") else "BLOOM FILTER",
+                "detalhe": detalhe,
+                "tabela": tabela,
+                "sugestao": sugerir_indice(tabela, colunas_da_restricao(restricao)),
+            })
+            continue
+
+        varredura = PADRAO_SCAN.match(detalhe)
+        if not varredura or varredura.group(1) not in aliases:
+            continue
+
+        alias = varredura.group(1)
+        tabela = aliases[alias]
+        laco_externo = primeiro_acesso.get(pai) == id_no
+        colunas_tabela = [linha[1] for linha in conn.execute(f"PRAGMA table_info({tabela})")]
+        trecho = re.split(r"\bWHERE\b", sql, maxsplit=1, flags=re.IGNORECASE)[-1] if laco_externo else sql
+        colunas = colunas_filtradas(trecho, alias, colunas_tabela if len(set(aliases.values())) == 1 else ())
+
+        if laco_externo and not possui_filtro:
+            sugestao = None
+            observacao = "Varredura do laço externo sem filtro: a consulta precisa ler todas as linhas."
+        elif colunas:
+            sugestao = sugerir_indice(tabela, colunas)
+            observacao = None
+        else:
+            sugestao = None
+            observacao = "Nenhuma coluna filtrada encontrada para indexar."
+
+        alertas.append({
+            "tipo": "SCAN",
+            "detalhe": detalhe,
+            "tabela": tabela,
+            "sugestao": sugestao,
+            "observacao": observacao,
+        })
+
+    return alertas
+
+def main():
+    import argparse
+    from banco_de_dados import DB_PATH
+    from catalogo import CONSULTAS, parametros, sql_para
+
+    parser = argparse.ArgumentParser(description="Analisa os planos das consultas e sugere índices.")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    for num in sorted(CONSULTAS.keys()):
+        alertas = analisar_consulta(conn, sql_para(conn, num), parametros(num))
+        print(f"\n--- {num}. {CONSULTAS[num]['nome']} ---")
+        if not alertas:
+            print("✓ Nenhuma varredura completa ou índice automático")
+        for alerta in alertas:
+            print(f"  [{alerta['tipo']}] {alerta['detalhe']}")
+            if alerta.get("sugestao"):
+                print(f"    Sugestão: {alerta['sugestao']}")
+            elif alerta.get("observacao"):
+                print(f"    {alerta['observacao']}")
+    conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import glob
+import gzip
+import os
+import shutil
+import sqlite3
+import time
+from datetime import datetime
+
+from banco_de_dados import DB_PATH
+
+DIRETORIO_BACKUPS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backups")
+
+PAGINAS_POR_PASSO = 1024
+
+BACKUPS_MANTIDOS = 7
+
+PREFIXO = "submissao_"
+
+EXTENSAO = ".db.gz"
+
+NIVEL_COMPRESSAO = 3
+
+def listar_backups(diretorio=DIRETORIO_BACKUPS):
+    """Backups do diretório, do mais recente para o mais antigo, com tamanho e data."""
+    backups = []
+    for caminho in glob.glob(os.path.join(diretorio, f"{PREFIXO}*{EXTENSAO}")):
+        estado = os.stat(caminho)
+        backups.append({
+            "arquivo": os.path.basename(caminho),
+            "caminho": caminho,
+            "bytes": estado.st_size,
+            "criado_em": datetime.fromtimestamp(estado.st_mtime),
+        })
+    return sorted(backups, key=lambda backup: backup["arquivo"], reverse=True)
+
+def rotacionar(diretorio=DIRETORIO_BACKUPS, manter=BACKUPS_MANTIDOS):
+    """Apaga os backups além dos `manter` mais recentes; devolve os nomes removidos."""
+    removidos = []
+    for backup in listar_backups(diretorio)[manter:]:
+        os.remove(backup["caminho"])
+        removidos.append(backup["arquivo"])
+    return removidos
+
+def _comprimir(origem, destino):
+    temporario = f"{destino}.tmp"
+    with open(origem, "rb") as entrada, gzip.open(temporario, "wb", compresslevel=NIVEL_COMPRESSAO) as saida:
+        shutil.copyfileobj(entrada, saida, 1024 * 1024)
+    os.replace(temporario, destino)
+
+def _remover(caminho):
+    """Apaga o arquivo do banco e os arquivos auxiliares (-wal, -shm, -journal) que o SQLite possa ter deixado."""
+    for arquivo in (caminho, f"{caminho}-wal", f"{caminho}-shm", f"{caminho}-journal"):
+        if os.path.exists(arquivo):
+            os.remove(arquivo)
+
+def _nome_livre(diretorio):
+    """Nome com data até os microssegundos; um sufixo desempata backups criados no mesmo instante."""
+    base = f"{PREFIXO}{datetime.now():%Y%m%d_%H%M%S_%f}"
+    nome, sufixo = base, 1
+    while os.path.exists(os.path.join(diretorio, nome + EXTENSAO)):
+        nome, sufixo = f"{base}_{sufixo}", sufixo + 1
+    return nome
+
+def criar_backup(origem, diretorio=DIRETORIO_BACKUPS, paginas=PAGINAS_POR_PASSO, pausa_s=0.0,
+                 manter=BACKUPS_MANTIDOS, progresso=None):
+    """Copia o banco aberto em `origem` para um snapshot comprimido, `paginas` páginas por passo.
+
+    Entre os passos o banco fica livre para outras conexões, então as consultas continuam rodando; se
+    outra conexão gravar no meio da cópia, o SQLite recomeça o backup para que o snapshot seja consistente.
+    `pausa_s` espaça os passos para diminuir a disputa de E/S com a aplicação. O arquivo só aparece
+    no diretório depois de verificado (PRAGMA quick_check) e comprimido.
+    """
+    os.makedirs(diretorio, exist_ok=True)
+    nome = _nome_livre(diretorio)
+    copia = os.path.join(diretorio, f".{nome}.db")
+    relatorio = {"passos": 0, "paginas": 0}
+
+    def a_cada_passo(status, restantes, total):
+        relatorio["passos"] += 1
+        relatorio["paginas"] = total
+        if progresso:
+            progresso(total - restantes, total)
+        if pausa_s and restantes:
+            time.sleep(pausa_s)
+
+    inicio = time.perf_counter()
+    try:
+        destino = sqlite3.connect(copia)
+        try:
+            origem.backup(destino, pages=paginas, progress=a_cada_passo)
+            destino.execute("PRAGMA journal_mode = DELETE")
+            verificacao = destino.execute("PRAGMA quick_check").fetchone()[0]
+        finally:
+            destino.close()
+        if verificacao != "ok":
+            raise sqlite3.DatabaseError(f"Backup corrompido: {verificacao}")
+        relatorio["copia_s"] = time.perf_counter() - inicio
+        relatorio["bytes"] = os.path.getsize(copia)
+
+        caminho = os.path.join(diretorio, nome + EXTENSAO)
+        _comprimir(copia, caminho)
+    finally:
+        _remover(copia)
+
+    relatorio["arquivo"] = os.path.basename(caminho)
+    relatorio["caminho"] = caminho
+    relatorio["bytes_comprimidos"] = os.path.getsize(caminho)
+    relatorio["segundos"] = time.perf_counter() - inicio
+    relatorio["removidos"] = rotacionar(diretorio, manter)
+    return relatorio
+
+def restaurar_backup(caminho, restaurar):
+    """Descomprime o snapshot, confere a integridade e chama `restaurar(origem)` (ex.: PoolConexoes.restaurar)."""
+    temporario = f"{caminho}.{os.getpid()}.restaurar.db"
+    try:
+        with gzip.open(caminho, "rb") as entrada, open(temporario, "wb") as saida:
+            shutil.copyfileobj(entrada, saida, 1024 * 1024)
+
+        origem = sqlite3.connect(f"file:{temporario}?mode=ro&immutable=1", uri=True)
+        try:
+            verificacao = origem.execute("PRAGMA quick_check").fetchone()[0]
+            if verificacao != "ok":
+                raise sqlite3.DatabaseError(f"Backup corrompido: {verificacao}")
+            inicio = time.perf_counter()
+            restaurar(origem)
+            return time.perf_counter() - inicio
+        finally:
+            origem.close()
+    finally:
+        _remover(temporario)
+
+def formatar_bytes(quantidade):
+    for unidade in ("B", "KB", "MB", "GB"):
+        if quantidade < 1024 or unidade == "GB":
+            return f"{quantidade:.0f} {unidade}" if unidade == "B" else f"{quantidade:.1f} {unidade}"
+        quantidade /= 1024
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Backup online (API de backup do SQLite) com snapshots comprimidos.")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    parser.add_argument("--dir", default=DIRETORIO_BACKUPS, help="Diretório dos backups")
+    parser.add_argument("--paginas", type=int, default=PAGINAS_POR_PASSO, help="Páginas copiadas por passo")
+    parser.add_argument("--pausa", type=float, default=0.0, help="Pausa entre os passos, em segundos")
+    parser.add_argument("--manter", type=int, default=BACKUPS_MANTIDOS, help="Quantidade de backups mantidos")
+    parser.add_argument("--listar", action="store_true", help="Lista os backups existentes")
+    parser.add_argument("--restaurar", metavar="ARQUIVO", help="Restaura o banco a partir de um backup")
+    args = parser.parse_args()
+
+    if args.listar:
+        for backup in listar_backups(args.dir):
+            print(f"{backup['arquivo']:<40} {formatar_bytes(backup['bytes']):>10}  {backup['criado_em']:%Y-%m-%d %H:%M:%S}")
+        return
+
+    conn = sqlite3.connect(args.db, timeout=30)
+    try:
+        if args.restaurar:
+            caminho = args.restaurar if os.path.exists(args.restaurar) else os.path.join(args.dir, args.restaurar)
+            segundos = restaurar_backup(caminho, lambda origem: origem.backup(conn))
+            print(f"✓ {args.db} restaurado de {os.path.basename(caminho)} em {segundos:.2f} s")
+            return
+
+        relatorio = criar_backup(conn, args.dir, args.paginas, args.pausa, args.manter)
+    finally:
+        conn.close()
+
+    print(f"✓ Backup {relatorio['arquivo']}: {relatorio['paginas']:,} páginas em {relatorio['passos']} passo(s), "
+          f"{formatar_bytes(relatorio['bytes'])} → {formatar_bytes(relatorio['bytes_comprimidos'])} "
+          f"em {relatorio['segundos']:.2f} s")
+    for arquivo in relatorio["removidos"]:
+        print(f"  removido (rotação): {arquivo}")
+
+if __name__ == "__main__":
+    main()
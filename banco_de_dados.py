@@ -0,0 +1,454 @@
+import sqlite3
+
+from agregados import TABELAS_RESUMO, criar_agregados
+from analitico_colunar import criar_alteracoes_colunares
+from busca_textual import TABELAS_BUSCA, criar_busca
+from recomendacao_revisores import criar_alteracoes_revisores
+
+DB_PATH = "submissao.db"
+
+PRAGMAS_ESCRITA = {
+    "recursive_triggers": "ON",
+}
+
+TABELAS_CONTADAS = ["Usuario", "Artigo", "Revisao"]
+
+def conectar(db_path=DB_PATH, **opcoes):
+    """sqlite3.connect para conexões que gravam, com os PRAGMAS_ESCRITA aplicados.
+
+    Sem recursive_triggers, REPLACE (e INSERT OR REPLACE) apaga a linha antiga sem disparar os triggers
+    de DELETE, e contadores, resumos materializados e índices de busca ficam com a linha antiga.
+    """
+    conn = sqlite3.connect(db_path, **opcoes)
+    for nome, valor in PRAGMAS_ESCRITA.items():
+        conn.execute(f"PRAGMA {nome} = {valor}")
+    return conn
+
+def criar_esquema(cursor):
+    cursor.executescript("".join(f"DROP TABLE IF EXISTS {tabela};" for tabela in [*TABELAS_BUSCA, *TABELAS_RESUMO, "Alteracoes_Colunares", "Alteracoes_Revisores"]))
+    cursor.executescript("""
+        DROP TABLE IF EXISTS Estatisticas;
+        DROP TABLE IF EXISTS Revisor_Area;
+        DROP TABLE IF EXISTS Revisao;
+        DROP TABLE IF EXISTS Autoria;
+        DROP TABLE IF EXISTS Artigo_Area;
+        DROP TABLE IF EXISTS Artigo;
+        DROP TABLE IF EXISTS Chamada_Especial;
+        DROP TABLE IF EXISTS Edicao_Regular;
+        DROP TABLE IF EXISTS Edicao;
+        DROP TABLE IF EXISTS Area;
+        DROP TABLE IF EXISTS Editor;
+        DROP TABLE IF EXISTS Revisor;
+        DROP TABLE IF EXISTS Autor;
+        DROP TABLE IF EXISTS Usuario;
+    """)
+    
+    cursor.executescript("""
+        CREATE TABLE Usuario (
+            ID_Usuario INTEGER PRIMARY KEY AUTOINCREMENT,
+            Nome TEXT NOT NULL,
+            Email TEXT NOT NULL,
+            Senha TEXT NOT NULL,
+            Instituicao TEXT,
+            Data_Cadastro DATE NOT NULL
+        );
+        
+        CREATE TABLE Autor (
+            ID_Usuario INTEGER PRIMARY KEY,
+            ORCID TEXT,
+            Bio_Resumida TEXT,
+            FOREIGN KEY (ID_Usuario) REFERENCES Usuario(ID_Usuario)
+        );
+        
+        CREATE TABLE Revisor (
+            ID_Usuario INTEGER PRIMARY KEY,
+            Nota_Media REAL,
+            FOREIGN KEY (ID_Usuario) REFERENCES Usuario(ID_Usuario)
+        );
+        
+        CREATE TABLE Editor (
+            ID_Usuario INTEGER PRIMARY KEY,
+            Cargo TEXT,
+            Ativo BOOLEAN DEFAULT 1,
+            FOREIGN KEY (ID_Usuario) REFERENCES Usuario(ID_Usuario)
+        );
+        
+        CREATE TABLE Area (
+            Cod_Area INTEGER PRIMARY KEY AUTOINCREMENT,
+            Nome_Area TEXT NOT NULL,
+            Descricao TEXT
+        );
+        
+        CREATE TABLE Edicao (
+            Cod_Edicao INTEGER PRIMARY KEY AUTOINCREMENT,
+            Ano INTEGER NOT NULL,
+            Status TEXT
+        );
+        
+        CREATE TABLE Edicao_Regular (
+            Cod_Edicao INTEGER PRIMARY KEY,
+            Volume INTEGER,
+            Numero INTEGER,
+            FOREIGN KEY (Cod_Edicao) REFERENCES Edicao(Cod_Edicao)
+        );
+        
+        CREATE TABLE Chamada_Especial (
+            Cod_Edicao INTEGER PRIMARY KEY,
+            Titulo_Tematico TEXT,
+            Descricao TEXT,
+            Data_Limite DATE,
+            FOREIGN KEY (Cod_Edicao) REFERENCES Edicao(Cod_Edicao)
+        );
+        
+        CREATE TABLE Artigo (
+            Cod_Artigo INTEGER PRIMARY KEY AUTOINCREMENT,
+            Titulo TEXT NOT NULL,
+            Resumo TEXT,
+            Arquivo TEXT,
+            Status TEXT,
+            Cod_Edicao INTEGER NOT NULL,
+            FOREIGN KEY (Cod_Edicao) REFERENCES Edicao(Cod_Edicao)
+        );
+        
+        CREATE TABLE Artigo_Area (
+            Cod_Artigo INTEGER,
+            Cod_Area INTEGER,
+            PRIMARY KEY (Cod_Artigo, Cod_Area),
+            FOREIGN KEY (Cod_Artigo) REFERENCES Artigo(Cod_Artigo),
+            FOREIGN KEY (Cod_Area) REFERENCES Area(Cod_Area)
+        );
+        
+        CREATE TABLE Autoria (
+            Cod_Autor INTEGER,
+            Cod_Artigo INTEGER,
+            Ordem_Autoria INTEGER,
+            PRIMARY KEY (Cod_Autor, Cod_Artigo),
+            FOREIGN KEY (Cod_Autor) REFERENCES Autor(ID_Usuario),
+            FOREIGN KEY (Cod_Artigo) REFERENCES Artigo(Cod_Artigo)
+        );
+        
+        CREATE TABLE Revisao (
+            ID_Revisao INTEGER PRIMARY KEY,
+            Cod_Artigo INTEGER,
+            Cod_Revisor INTEGER,
+            Parecer TEXT,
+            Nota REAL,
+            Data_Entrega DATE,
+            UNIQUE (Cod_Artigo, Cod_Revisor),
+            FOREIGN KEY (Cod_Artigo) REFERENCES Artigo(Cod_Artigo),
+            FOREIGN KEY (Cod_Revisor) REFERENCES Revisor(ID_Usuario)
+        );
+        
+        CREATE TABLE Revisor_Area (
+            ID_Revisor INTEGER,
+            Cod_Area INTEGER,
+            PRIMARY KEY (ID_Revisor, Cod_Area),
+            FOREIGN KEY (ID_Revisor) REFERENCES Revisor(ID_Usuario),
+            FOREIGN KEY (Cod_Area) REFERENCES Area(Cod_Area)
+        );
+    """)
+
+def criar_indices(cursor):
+    cursor.executescript("""
+        CREATE INDEX IF NOT EXISTS idx_Artigo_Edicao ON Artigo (Cod_Edicao);
+        CREATE INDEX IF NOT EXISTS idx_Autoria_Artigo ON Autoria (Cod_Artigo, Cod_Autor);
+        CREATE INDEX IF NOT EXISTS idx_Revisao_Revisor ON Revisao (Cod_Revisor, Nota);
+        CREATE INDEX IF NOT EXISTS idx_Revisor_Area_Area ON Revisor_Area (Cod_Area, ID_Revisor);
+        CREATE INDEX IF NOT EXISTS idx_Artigo_Area_Area ON Artigo_Area (Cod_Area, Cod_Artigo);
+    """)
+
+def atualizar_contadores(cursor):
+    for tabela in TABELAS_CONTADAS:
+        cursor.execute(f"INSERT OR REPLACE INTO Estatisticas (Tabela, Total) SELECT '{tabela}', COUNT(*) FROM {tabela}")
+
+def criar_contadores(cursor):
+    cursor.executescript("""
+        CREATE TABLE IF NOT EXISTS Estatisticas (
+            Tabela TEXT PRIMARY KEY,
+            Total INTEGER NOT NULL
+        );
+    """)
+    
+    atualizar_contadores(cursor)
+    
+    for tabela in TABELAS_CONTADAS:
+        cursor.executescript(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_contador_insert AFTER INSERT ON {tabela}
+            BEGIN
+                UPDATE Estatisticas SET Total = Total + 1 WHERE Tabela = '{tabela}';
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_contador_delete AFTER DELETE ON {tabela}
+            BEGIN
+                UPDATE Estatisticas SET Total = Total - 1 WHERE Tabela = '{tabela}';
+            END;
+        """)
+
+def ler_contadores(conn):
+    try:
+        return dict(conn.execute("SELECT Tabela, Total FROM Estatisticas").fetchall())
+    except sqlite3.OperationalError:
+        return {tabela: conn.execute(f"SELECT COUNT(*) FROM {tabela}").fetchone()[0] for tabela in TABELAS_CONTADAS}
+
+def popular_dados_exemplo(cursor):
+    usuarios = [
+        ('João Silva', 'joao.silva@univ.edu.br', 'senha123', 'Universidade A', '2023-01-15'),
+        ('Maria Santos', 'maria.santos@inst.org', 'senha456', 'Instituto B', '2023-02-20'),
+        ('Pedro Souza', 'pedro.souza@tech.com', 'senha789', 'Tech Solutions', '2023-03-10'),
+        ('Ana Oliveira', 'ana.oliveira@univ.edu.br', 'senhaabc', 'Universidade A', '2023-03-15'),
+        ('Carlos Pereira', 'carlos.pereira@univ.c', 'senhadef', 'Universidade C', '2023-01-10'),
+        ('Fernanda Costa', 'fernanda.costa@lab.net', 'senhaghi', 'Laboratório X', '2023-02-28'),
+        ('Lucas Almeida', 'lucas.almeida@univ.edu.br', 'senhajkl', 'Universidade A', '2023-04-05'),
+        ('Julia Lima', 'julia.lima@inst.org', 'senhamno', 'Instituto B', '2023-04-20'),
+        ('Marcos Rocha', 'marcos.rocha@editora.com', 'senhapqr', 'Editora Global', '2022-11-01'),
+        ('Patricia Gomes', 'patricia.gomes@univ.c', 'senhastu', 'Universidade C', '2022-12-15'),
+        ('Rafael Mendes', 'rafael.mendes@univ.edu.br', 'senhavwx', 'Universidade A', '2022-10-30'),
+        ('Sofia Martins', 'sofia.martins@tech.com', 'senhayz1', 'Tech Solutions', '2023-01-05')
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Usuario (Nome, Email, Senha, Instituicao, Data_Cadastro) 
+        VALUES (?, ?, ?, ?, ?)
+    """, usuarios)
+    
+    autores = [
+        (1, '0000-0001-2345-6789', 'Pesquisador em IA.'),
+        (2, '0000-0002-3456-7890', 'Especialista em Banco de Dados.'),
+        (3, '0000-0003-4567-8901', 'Engenheiro de Software Sênior.'),
+        (4, '0000-0004-5678-9012', 'Doutoranda em Redes.')
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Autor (ID_Usuario, ORCID, Bio_Resumida) 
+        VALUES (?, ?, ?)
+    """, autores)
+    
+    revisores = [
+        (5, 9.5),
+        (6, 8.7),
+        (7, 9.0),
+        (8, 7.5)
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Revisor (ID_Usuario, Nota_Media) 
+        VALUES (?, ?)
+    """, revisores)
+    
+    editores = [
+        (9, 'Editor Chefe', 1),
+        (10, 'Editor Associado', 1),
+        (11, 'Editor Convidado', 0),
+        (12, 'Editor Técnico', 1)
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Editor (ID_Usuario, Cargo, Ativo) 
+        VALUES (?, ?, ?)
+    """, editores)
+    
+    areas = [
+        ('Inteligência Artificial', 'Estudo de agentes inteligentes e aprendizado de máquina.'),
+        ('Banco de Dados', 'Gerenciamento, modelagem e otimização de dados.'),
+        ('Engenharia de Software', 'Processos, métodos e ferramentas para desenvolvimento.'),
+        ('Redes de Computadores', 'Comunicação de dados e protocolos.'),
+        ('Segurança da Informação', 'Proteção de sistemas e dados.'),
+        ('Sistemas Operacionais', 'Gerenciamento de recursos de hardware e software.'),
+        ('Interação Humano-Computador', 'Design e avaliação de interfaces.'),
+        ('Computação Gráfica', 'Processamento de imagens e renderização.'),
+        ('Bioinformática', 'Aplicação de computação em biologia.'),
+        ('Internet das Coisas', 'Conectividade de dispositivos embarcados.')
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Area (Nome_Area, Descricao) 
+        VALUES (?, ?)
+    """, areas)
+    
+    edicoes = [
+        (2023, 'Fechada'),
+        (2023, 'Fechada'),
+        (2024, 'Publicada'),
+        (2024, 'Publicada'),
+        (2024, 'Em andamento'),
+        (2025, 'Aberta'),
+        (2025, 'Aberta'),
+        (2025, 'Planejada'),
+        (2025, 'Planejada'),
+        (2026, 'Planejada')
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Edicao (Ano, Status) 
+        VALUES (?, ?)
+    """, edicoes)
+    
+    edicoes_regulares = [
+        (1, 10, 1),
+        (2, 10, 2),
+        (3, 11, 1),
+        (4, 11, 2),
+        (5, 11, 3)
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Edicao_Regular (Cod_Edicao, Volume, Numero) 
+        VALUES (?, ?, ?)
+    """, edicoes_regulares)
+    
+    chamadas = [
+        (6, 'Avanços em IA Generativa', 'Foco em LLMs e difusão.', '2025-06-30'),
+        (7, 'Segurança em IoT', 'Desafios de privacidade em dispositivos conectados.', '2025-07-15'),
+        (8, 'Big Data na Saúde', 'Análise de grandes volumes de dados médicos.', '2025-09-01'),
+        (9, 'Computação Quântica', 'Algoritmos e arquiteturas quânticas.', '2025-10-20'),
+        (10, 'Cidades Inteligentes', 'Tecnologia aplicada ao urbanismo.', '2026-01-15')
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Chamada_Especial (Cod_Edicao, Titulo_Tematico, Descricao, Data_Limite) 
+        VALUES (?, ?, ?, ?)
+    """, chamadas)
+    
+    artigos = [
+        ('Uso de Redes Neurais em Finanças', 'Análise preditiva de mercado.', 'artigo1.pdf', 'Aceito', 1),
+        ('Otimização de Queries SQL', 'Novas técnicas de indexação.', 'artigo2.pdf', 'Publicado', 1),
+        ('Metodologias Ágeis em Startups', 'Estudo de caso.', 'artigo3.pdf', 'Rejeitado', 2),
+        ('Protocolos de Roteamento', 'Comparação entre OSPF e BGP.', 'artigo4.pdf', 'Publicado', 2),
+        ('Criptografia Pós-Quântica', 'Algoritmos resistentes a computadores quânticos.', 'artigo5.pdf', 'Em Revisão', 6),
+        ('Interface para Idosos', 'Acessibilidade digital.', 'artigo6.pdf', 'Submetido', 7),
+        ('Renderização em Tempo Real', 'Técnicas de Ray Tracing.', 'artigo7.pdf', 'Aceito', 3),
+        ('Genômica Computacional', 'Alinhamento de sequências.', 'artigo8.pdf', 'Em Revisão', 8),
+        ('Sensores em Agricultura', 'IoT no campo.', 'artigo9.pdf', 'Submetido', 9),
+        ('Virtualização de Servidores', 'Docker e Kubernetes.', 'artigo10.pdf', 'Publicado', 4)
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Artigo (Titulo, Resumo, Arquivo, Status, Cod_Edicao) 
+        VALUES (?, ?, ?, ?, ?)
+    """, artigos)
+    
+    artigo_areas = [
+        (1, 1),
+        (2, 2),
+        (3, 3),
+        (4, 4),
+        (5, 5),
+        (6, 7),
+        (7, 8),
+        (8, 9),
+        (9, 10),
+        (10, 6),
+        (1, 2),
+        (9, 4)
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Artigo_Area (Cod_Artigo, Cod_Area) 
+        VALUES (?, ?)
+    """, artigo_areas)
+    
+    autorias = [
+        (1, 1, 1),
+        (2, 2, 1),
+        (3, 3, 1),
+        (4, 4, 1),
+        (1, 5, 1),
+        (2, 5, 2),
+        (3, 6, 1),
+        (4, 7, 1),
+        (1, 8, 1),
+        (2, 9, 1),
+        (3, 10, 1),
+        (4, 10, 2)
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Autoria (Cod_Autor, Cod_Artigo, Ordem_Autoria) 
+        VALUES (?, ?, ?)
+    """, autorias)
+    
+    revisor_areas = [
+        (5, 1),
+        (5, 2),
+        (6, 3),
+        (6, 4),
+        (7, 5),
+        (7, 6),
+        (8, 7),
+        (8, 8),
+        (8, 9),
+        (5, 10)
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Revisor_Area (ID_Revisor, Cod_Area) 
+        VALUES (?, ?)
+    """, revisor_areas)
+    
+    revisoes = [
+        (1, 5, 'Excelente trabalho, metodologia sólida.', 9.5, '2023-02-10'),
+        (2, 5, 'Bom, mas precisa de revisão bibliográfica.', 7.0, '2023-02-12'),
+        (3, 6, 'Não atende aos requisitos da chamada.', 4.0, '2023-03-01'),
+        (4, 6, 'Muito relevante para a área.', 8.5, '2023-03-05'),
+        (5, 7, 'Inovador, recomendo publicação.', 9.0, '2025-01-10'),
+        (6, 8, 'Amostragem pequena.', 6.0, '2025-02-15'),
+        (7, 8, 'Visualmente impressionante.', 9.0, '2024-05-20'),
+        (8, 5, 'Análise estatística fraca.', 5.5, '2025-03-01'),
+        (9, 6, 'Aplicação prática interessante.', 8.0, '2025-04-10'),
+        (10, 7, 'Bem escrito e fundamentado.', 9.0, '2024-06-01')
+    ]
+    
+    cursor.executemany("""
+        INSERT INTO Revisao (Cod_Artigo, Cod_Revisor, Parecer, Nota, Data_Entrega) 
+        VALUES (?, ?, ?, ?, ?)
+    """, revisoes)
+
+def init_db(db_path=DB_PATH, fator_escala=0, semente=42):
+    conn = conectar(db_path)
+    cursor = conn.cursor()
+    
+    criar_esquema(cursor)
+    
+    if fator_escala > 0:
+        from gerar_dados import popular_sintetico
+        
+        volumes = popular_sintetico(conn, fator_escala, semente)
+        criar_indices(cursor)
+        criar_contadores(cursor)
+        criar_agregados(cursor)
+        criar_busca(cursor)
+        criar_alteracoes_colunares(cursor)
+        criar_alteracoes_revisores(cursor)
+        conn.close()
+        
+        return (
+            f"✅ Banco de dados criado com dados sintéticos (SF={fator_escala:g}, semente={semente}): "
+            f"{volumes['Usuario']:,} usuários, {volumes['Artigo']:,} artigos e {volumes['Revisao']:,} revisões."
+        )
+    
+    popular_dados_exemplo(cursor)
+    
+    conn.commit()
+    criar_indices(cursor)
+    criar_contadores(cursor)
+    criar_agregados(cursor)
+    criar_busca(cursor)
+    criar_alteracoes_colunares(cursor)
+    criar_alteracoes_revisores(cursor)
+    conn.close()
+    
+    return "✅ Banco de dados criado e populado com sucesso!"
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Cria e popula o banco de dados de submissões.")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    parser.add_argument("--sf", type=float, default=0, help="Fator de escala dos dados sintéticos (0 usa os dados de exemplo)")
+    parser.add_argument("--seed", type=int, default=42, help="Semente do gerador de dados sintéticos")
+    args = parser.parse_args()
+    
+    print(init_db(args.db, args.sf, args.seed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from banco_de_dados import init_db
+from catalogo import CONSULTAS, parametros, sql_para
+
+ESCALAS_PADRAO = [0.001, 0.01, 0.1]
+
+def pico_alocado_kb(conn, sql, parametros=()):
+    """Pico de memória alocada pelo Python (tracemalloc) durante uma execução com fetchall, em KB.
+
+    Mede a materialização do resultado, não o cache de páginas do SQLite; roda fora das execuções cronometradas.
+    """
+    ja_rastreando = tracemalloc.is_tracing()
+    if not ja_rastreando:
+        tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        conn.execute(sql, parametros).fetchall()
+        return (tracemalloc.get_traced_memory()[1] - antes) // 1024
+    finally:
+        if not ja_rastreando:
+            tracemalloc.stop()
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    posicao = (len(ordenados) - 1) * p / 100
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+def preparar_banco(diretorio, fator_escala, semente, reusar=True):
+    caminho = os.path.join(diretorio, f"bench_sf{fator_escala:g}_s{semente}.db")
+    if not (reusar and os.path.exists(caminho)):
+        if os.path.exists(caminho):
+            os.remove(caminho)
+        init_db(caminho, fator_escala, semente)
+    return caminho
+
+def medir_consulta(conn, sql, repeticoes, aquecimento=1, parametros=()):
+    for _ in range(aquecimento):
+        conn.execute(sql, parametros).fetchall()
+
+    tempos = []
+    linhas = 0
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        linhas = len(conn.execute(sql, parametros).fetchall())
+        tempos.append(time.perf_counter() - inicio)
+
+    p50 = percentil(tempos, 50)
+    return {
+        "linhas": linhas,
+        "p50_ms": p50 * 1000,
+        "p95_ms": percentil(tempos, 95) * 1000,
+        "p99_ms": percentil(tempos, 99) * 1000,
+        "linhas_por_segundo": linhas / p50 if p50 > 0 else None,
+        "pico_alocado_python_kb": pico_alocado_kb(conn, sql, parametros),
+    }
+
+def executar_benchmark(escalas, repeticoes, semente, diretorio, reusar=True, consultas=None):
+    resultado = {
+        "gerado_em": datetime.now().isoformat(timespec="seconds"),
+        "semente": semente,
+        "repeticoes": repeticoes,
+        "sqlite": sqlite3.sqlite_version,
+        "escalas": {},
+    }
+
+    for fator_escala in escalas:
+        caminho = preparar_banco(diretorio, fator_escala, semente, reusar)
+        conn = sqlite3.connect(caminho)
+        medicoes = {}
+
+        for num in sorted(consultas or CONSULTAS.keys()):
+            sql = sql_para(conn, num)
+            medicao = medir_consulta(conn, sql, repeticoes, parametros=parametros(num))
+            medicao["nome"] = CONSULTAS[num]["nome"]
+            medicao["materializado"] = sql != CONSULTAS[num]["sql"]
+            medicoes[str(num)] = medicao
+            print(f"SF={fator_escala:g} | {num:>2}. {medicao['nome']:<45} "
+                  f"p50={medicao['p50_ms']:9.2f} ms  p95={medicao['p95_ms']:9.2f} ms  linhas={medicao['linhas']}")
+
+        conn.close()
+        resultado["escalas"][f"{fator_escala:g}"] = medicoes
+
+    return resultado
+
+def comparar_com_baseline(atual, baseline, limite):
+    """Retorna as consultas cujo p50 ficou mais de `limite` vezes mais lento que no baseline."""
+    regressoes = []
+    for escala, medicoes in atual["escalas"].items():
+        for num, medicao in medicoes.items():
+            anterior = baseline.get("escalas", {}).get(escala, {}).get(num)
+            if not anterior or anterior["p50_ms"] <= 0:
+                continue
+            razao = medicao["p50_ms"] / anterior["p50_ms"]
+            if razao > limite:
+                regressoes.append({
+                    "escala": escala,
+                    "consulta": num,
+                    "nome": medicao["nome"],
+                    "p50_ms_baseline": anterior["p50_ms"],
+                    "p50_ms_atual": medicao["p50_ms"],
+                    "razao": razao,
+                })
+    return regressoes
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark das 12 consultas em bancos de escala crescente.")
+    parser.add_argument("--escalas", default=",".join(f"{e:g}" for e in ESCALAS_PADRAO),
+                        help="Fatores de escala separados por vírgula")
+    parser.add_argument("--repeticoes", type=int, default=10, help="Execuções medidas por consulta")
+    parser.add_argument("--seed", type=int, default=42, help="Semente dos dados sintéticos")
+    parser.add_argument("--consultas", default=None, help="Números das consultas separados por vírgula (padrão: todas)")
+    parser.add_argument("--dir", default=".", help="Diretório dos bancos de benchmark")
+    parser.add_argument("--regerar", action="store_true", help="Recria os bancos mesmo que já existam")
+    parser.add_argument("--saida", default=None, help="Arquivo JSON de saída")
+    parser.add_argument("--baseline", default=None, help="Arquivo JSON de uma execução anterior para comparação")
+    parser.add_argument("--limite", type=float, default=1.5,
+                        help="Razão máxima de p50 atual/baseline antes de considerar regressão")
+    args = parser.parse_args()
+
+    escalas = [float(e) for e in args.escalas.split(",")]
+    consultas = [int(n) for n in args.consultas.split(",")] if args.consultas else None
+
+    resultado = executar_benchmark(escalas, args.repeticoes, args.seed, args.dir, not args.regerar, consultas)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+        print(f"\n✓ Resultados salvos em {args.saida}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as arquivo:
+            baseline = json.load(arquivo)
+
+        regressoes = comparar_com_baseline(resultado, baseline, args.limite)
+        if regressoes:
+            print(f"\n❌ {len(regressoes)} regressão(ões) acima de {args.limite:g}x:")
+            for r in regressoes:
+                print(f"  SF={r['escala']} | {r['consulta']}. {r['nome']}: "
+                      f"{r['p50_ms_baseline']:.2f} ms -> {r['p50_ms_atual']:.2f} ms ({r['razao']:.2f}x)")
+            sys.exit(1)
+        print(f"\n✓ Nenhuma regressão acima de {args.limite:g}x em relação a {args.baseline}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import re
+
+TABELAS_BUSCA = {
+    "Busca_Artigo": {
+        "tabela": "Artigo",
+        "chave": "Cod_Artigo",
+        "colunas": ["Titulo", "Resumo"],
+        "pesos": "bm25(10.0, 1.0)",
+    },
+    "Busca_Revisao": {
+        "tabela": "Revisao",
+        "chave": "ID_Revisao",
+        "colunas": ["Parecer"],
+        "pesos": "bm25()",
+    },
+}
+
+MARCADORES_TRECHO = ("**", "**")
+
+PADRAO_OPERADORES = re.compile(r'"|\bAND\b|\bOR\b|\bNOT\b|\bNEAR\b|[()^:]')
+
+def criar_busca(cursor):
+    """Cria os índices FTS5 de conteúdo externo sobre Artigo e Revisao, preenche e instala os triggers de sincronia.
+
+    Cada índice aponta para uma INTEGER PRIMARY KEY (Revisao.ID_Revisao), que VACUUM e recargas não renumeram.
+    Em REPLACE, o trigger de DELETE só tira os termos da linha antiga com recursive_triggers ligado
+    (banco_de_dados.conectar e PoolConexoes ligam).
+    """
+    for busca, definicao in TABELAS_BUSCA.items():
+        tabela, chave, colunas = definicao["tabela"], definicao["chave"], definicao["colunas"]
+        novos = ", ".join(f"NEW.{coluna}" for coluna in colunas)
+        antigos = ", ".join(f"OLD.{coluna}" for coluna in colunas)
+        cursor.executescript(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {busca} USING fts5(
+                {', '.join(colunas)},
+                content='{tabela}',
+                content_rowid='{chave}',
+                tokenize='unicode61 remove_diacritics 2'
+            );
+
+            INSERT INTO {busca} ({busca}, rank) VALUES ('rank', '{definicao["pesos"]}');
+            INSERT INTO {busca} ({busca}) VALUES ('rebuild');
+
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_busca_insert AFTER INSERT ON {tabela}
+            BEGIN
+                INSERT INTO {busca} (rowid, {', '.join(colunas)}) VALUES (NEW.{chave}, {novos});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_busca_delete AFTER DELETE ON {tabela}
+            BEGIN
+                INSERT INTO {busca} ({busca}, rowid, {', '.join(colunas)}) VALUES ('delete', OLD.{chave}, {antigos});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_busca_update
+            AFTER UPDATE OF {', '.join(colunas + [chave])} ON {tabela}
+            BEGIN
+                INSERT INTO {busca} ({busca}, rowid, {', '.join(colunas)}) VALUES ('delete', OLD.{chave}, {antigos});
+                INSERT INTO {busca} (rowid, {', '.join(colunas)}) VALUES (NEW.{chave}, {novos});
+            END;
+        """)
+
+def reconstruir_busca(cursor):
+    """Refaz os índices a partir das tabelas de conteúdo (após cargas em lote sem triggers)."""
+    for busca in TABELAS_BUSCA:
+        cursor.execute(f"INSERT INTO {busca} ({busca}) VALUES ('rebuild')")
+
+def busca_disponivel(conn):
+    encontrados = conn.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name IN ({', '.join('?' * len(TABELAS_BUSCA))})",
+        list(TABELAS_BUSCA)
+    ).fetchone()[0]
+    return encontrados == len(TABELAS_BUSCA)
+
+def preparar_termos(texto):
+    """Converte a busca digitada numa expressão FTS5.
+
+    Texto com operadores FTS5 (aspas, AND/OR/NOT, NEAR, parênteses) passa como está; senão cada palavra vira
+    um termo entre aspas (todas obrigatórias), preservando o '*' final de busca por prefixo.
+    """
+    texto = texto.strip()
+    if PADRAO_OPERADORES.search(texto):
+        return texto
+    termos = []
+    for palavra in texto.split():
+        prefixo = palavra.endswith("*")
+        palavra = palavra.rstrip("*")
+        if palavra:
+            termos.append(f'"{palavra}"' + ("*" if prefixo else ""))
+    return " ".join(termos)
+
+def _trecho(busca, coluna, tokens=12):
+    inicio, fim = MARCADORES_TRECHO
+    return f"snippet({busca}, {coluna}, '{inicio}', '{fim}', '…', {tokens})"
+
+def buscar_artigos(conn, texto, limite=20):
+    """Artigos cujo título ou resumo casam com a busca, ordenados por BM25 (título pesa 10x)."""
+    cursor = conn.execute(f"""
+        SELECT A.Cod_Artigo, A.Titulo, A.Status, B.Trecho, B.Relevancia
+        FROM (
+            SELECT rowid, {_trecho("Busca_Artigo", -1)} AS Trecho, rank AS Relevancia
+            FROM Busca_Artigo
+            WHERE Busca_Artigo MATCH :termos
+            ORDER BY rank
+            LIMIT :limite
+        ) B
+        JOIN Artigo A ON A.Cod_Artigo = B.rowid
+        ORDER BY B.Relevancia
+    """, {"termos": preparar_termos(texto), "limite": limite})
+    colunas = [descricao[0] for descricao in cursor.description]
+    return colunas, cursor.fetchall()
+
+def buscar_pareceres(conn, texto, limite=20):
+    """Revisões cujo parecer casa com a busca, com o título do artigo revisado."""
+    cursor = conn.execute(f"""
+        SELECT R.Cod_Artigo, A.Titulo, R.Cod_Revisor, R.Nota, B.Trecho, B.Relevancia
+        FROM (
+            SELECT rowid, {_trecho("Busca_Revisao", 0)} AS Trecho, rank AS Relevancia
+            FROM Busca_Revisao
+            WHERE Busca_Revisao MATCH :termos
+            ORDER BY rank
+            LIMIT :limite
+        ) B
+        JOIN Revisao R ON R.ID_Revisao = B.rowid
+        LEFT JOIN Artigo A ON A.Cod_Artigo = R.Cod_Artigo
+        ORDER BY B.Relevancia
+    """, {"termos": preparar_termos(texto), "limite": limite})
+    colunas = [descricao[0] for descricao in cursor.description]
+    return colunas, cursor.fetchall()
+
+def main():
+    import argparse
+    import time
+    from banco_de_dados import DB_PATH, conectar
+
+    parser = argparse.ArgumentParser(description="Busca textual (FTS5) em artigos e pareceres.")
+    parser.add_argument("termos", nargs="?", help="Texto a buscar")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    parser.add_argument("--pareceres", action="store_true", help="Busca nos pareceres das revisões")
+    parser.add_argument("--limite", type=int, default=20, help="Máximo de resultados")
+    parser.add_argument("--reconstruir", action="store_true", help="Cria ou reconstrói os índices de busca")
+    args = parser.parse_args()
+
+    conn = conectar(args.db, isolation_level=None)
+    if args.reconstruir:
+        criar_busca(conn.cursor())
+        print(f"✓ Índices de busca reconstruídos em {args.db}")
+    if args.termos:
+        inicio = time.perf_counter()
+        buscar = buscar_pareceres if args.pareceres else buscar_artigos
+        colunas, linhas = buscar(conn, args.termos, args.limite)
+        print(" | ".join(colunas))
+        print("-" * 70)
+        for linha in linhas:
+            print(linha)
+        print(f"\n{len(linhas)} resultado(s) em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+    conn.close()
+
+if __name__ == "__main__":
+    main()
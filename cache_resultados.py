@@ -0,0 +1,94 @@
+import re
+import sys
+import threading
+from collections import OrderedDict
+
+PADRAO_LITERAIS = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+
+FUNCOES_NAO_DETERMINISTICAS = ("RANDOM(", "RANDOMBLOB(", "'NOW'", "CURRENT_DATE", "CURRENT_TIME", "CHANGES(", "LAST_INSERT_ROWID(")
+
+def normalizar_sql(sql):
+    """Remove comentários, colapsa espaços fora de literais e tira o ';' final, preservando as strings."""
+    partes = PADRAO_LITERAIS.split(sql.strip().rstrip(";").strip())
+    for i in range(0, len(partes), 2):
+        partes[i] = re.sub(r"--[^\n]*|/\*.*?\*/", " ", partes[i], flags=re.DOTALL)
+        partes[i] = re.sub(r"\s+", " ", partes[i])
+    return "".join(partes).strip().rstrip(";").strip()
+
+def tamanho_bytes(resultado):
+    if hasattr(resultado, "tamanho_bytes"):
+        return resultado.tamanho_bytes()
+    if hasattr(resultado, "memory_usage"):
+        return int(resultado.memory_usage(index=True, deep=True).sum())
+    return sys.getsizeof(resultado)
+
+class CacheResultados:
+    """Cache LRU de resultados de SELECT limitado em bytes e invalidado pela versão do banco."""
+
+    def __init__(self, limite_bytes=64 * 1024 * 1024):
+        self.limite_bytes = limite_bytes
+        self._entradas = OrderedDict()
+        self._bytes = 0
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.invalidacoes = 0
+
+    def pode_armazenar(self, sql):
+        sql_upper = sql.upper()
+        return not any(funcao in sql_upper for funcao in FUNCOES_NAO_DETERMINISTICAS)
+
+    def obter(self, sql, versao, variante=None):
+        chave = (normalizar_sql(sql), variante)
+        with self._trava:
+            entrada = self._entradas.get(chave)
+            if entrada is None or entrada[0] != versao:
+                if entrada is not None:
+                    self._remover(chave)
+                self.falhas += 1
+                return None
+
+            self._entradas.move_to_end(chave)
+            self.acertos += 1
+            return entrada[1]
+
+    def guardar(self, sql, versao, resultado, variante=None):
+        if not self.pode_armazenar(sql):
+            return
+
+        tamanho = tamanho_bytes(resultado)
+        if tamanho > self.limite_bytes:
+            return
+
+        chave = (normalizar_sql(sql), variante)
+        with self._trava:
+            if chave in self._entradas:
+                self._remover(chave)
+            self._entradas[chave] = (versao, resultado, tamanho)
+            self._bytes += tamanho
+
+            while self._bytes > self.limite_bytes:
+                self._remover(next(iter(self._entradas)))
+
+    def _remover(self, chave):
+        _, _, tamanho = self._entradas.pop(chave)
+        self._bytes -= tamanho
+
+    def invalidar(self):
+        with self._trava:
+            self._entradas.clear()
+            self._bytes = 0
+            self.invalidacoes += 1
+
+    def estatisticas(self):
+        with self._trava:
+            total = self.acertos + self.falhas
+            return {
+                "entradas": len(self._entradas),
+                "bytes": self._bytes,
+                "limite_bytes": self.limite_bytes,
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "taxa_acerto": self.acertos / total if total else 0.0,
+                "invalidacoes": self.invalidacoes,
+            }
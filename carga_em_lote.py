@@ -0,0 +1,232 @@
+import csv
+import itertools
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+from agregados import agregados_disponiveis, reconstruir_agregados
+from analitico_colunar import marcar_alteradas
+from banco_de_dados import DB_PATH, atualizar_contadores, conectar
+from busca_textual import busca_disponivel, reconstruir_busca
+from gerar_dados import PRAGMAS_CARGA, TAMANHO_LOTE, inserir_em_lotes
+from recomendacao_revisores import marcar_recarga
+
+ORDEM_TABELAS = [
+    "Usuario", "Autor", "Revisor", "Editor", "Area", "Edicao", "Edicao_Regular", "Chamada_Especial",
+    "Artigo", "Artigo_Area", "Autoria", "Revisor_Area", "Revisao",
+]
+
+EXTENSOES = (".csv", ".jsonl")
+
+CONFLITOS = ["ABORT", "IGNORE", "REPLACE"]
+
+class ViolacaoChaveEstrangeira(Exception):
+    def __init__(self, violacoes):
+        self.violacoes = violacoes
+        exemplos = "; ".join(
+            f"{tabela} (rowid {rowid}) -> {pai}" for tabela, rowid, pai, _ in violacoes[:5]
+        )
+        super().__init__(f"{len(violacoes)} violação(ões) de chave estrangeira, carga desfeita. Ex.: {exemplos}")
+
+def _linhas_csv(leitor):
+    for linha in leitor:
+        yield tuple(valor if valor != "" else None for valor in linha)
+
+def _linhas_jsonl(registros, colunas):
+    for registro in registros:
+        yield tuple(registro.get(coluna) for coluna in colunas)
+
+@contextmanager
+def ler_arquivo(caminho):
+    """Abre um CSV com cabeçalho ou um JSONL e entrega (colunas, gerador de tuplas), sem ler o arquivo inteiro.
+
+    No CSV, campo vazio vira NULL; no JSONL, as colunas são as chaves do primeiro registro. O arquivo é
+    fechado na saída do `with`, inclusive quando a validação ou a carga falham.
+    """
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        if caminho.endswith(".jsonl"):
+            registros = (json.loads(linha) for linha in arquivo if linha.strip())
+            primeiro = next(registros, None)
+            if primeiro is None:
+                yield [], iter(())
+                return
+            colunas = list(primeiro)
+            yield colunas, _linhas_jsonl(itertools.chain([primeiro], registros), colunas)
+            return
+
+        leitor = csv.reader(arquivo)
+        colunas = next(leitor, None)
+        if colunas is None:
+            yield [], iter(())
+            return
+        yield [coluna.strip() for coluna in colunas], _linhas_csv(leitor)
+
+def arquivos_do_diretorio(diretorio):
+    """Mapeia `<Tabela>.csv` / `<Tabela>.jsonl` do diretório para as tabelas do esquema."""
+    arquivos = {}
+    for nome in sorted(os.listdir(diretorio)):
+        tabela, extensao = os.path.splitext(nome)
+        if extensao in EXTENSOES and tabela in ORDEM_TABELAS:
+            arquivos[tabela] = os.path.join(diretorio, nome)
+    return arquivos
+
+def _validar_colunas(cursor, tabela, colunas):
+    existentes = {linha[1] for linha in cursor.execute(f"PRAGMA table_info({tabela})")}
+    desconhecidas = [coluna for coluna in colunas if coluna not in existentes]
+    if not colunas or desconhecidas:
+        raise ValueError(f"Colunas inválidas para {tabela}: {desconhecidas or 'arquivo sem cabeçalho'}")
+
+def _remover_indices_e_triggers(cursor, tabelas):
+    """Remove índices secundários e triggers das tabelas carregadas e devolve o SQL para recriá-los."""
+    adiados = cursor.execute(f"""
+        SELECT type, name, sql FROM sqlite_master
+        WHERE type IN ('index', 'trigger') AND sql IS NOT NULL
+          AND tbl_name IN ({', '.join('?' * len(tabelas))})
+        ORDER BY type
+    """, tabelas).fetchall()
+    for tipo, nome, _ in adiados:
+        cursor.execute(f'DROP {tipo.upper()} "{nome}"')
+    return [sql for _, _, sql in adiados]
+
+def _tabela_existe(cursor, nome):
+    return cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (nome,)).fetchone() is not None
+
+def carregar(conn, arquivos, adiar_indices=True, validar_fk=True, conflito="ABORT", tamanho_lote=TAMANHO_LOTE):
+    """Carrega {tabela: caminho} numa única transação, na ordem das chaves estrangeiras.
+
+    Com `adiar_indices`, índices secundários e triggers das tabelas carregadas são removidos antes da carga
+    e recriados no fim, e contadores, resumos materializados e índices de busca são recalculados uma vez só.
+    Com `validar_fk`, roda PRAGMA foreign_key_check nas tabelas carregadas e desfaz tudo se houver violações.
+    """
+    desconhecidas = set(arquivos) - set(ORDEM_TABELAS)
+    if desconhecidas:
+        raise ValueError(f"Tabelas desconhecidas: {', '.join(sorted(desconhecidas))}")
+    if conflito not in CONFLITOS:
+        raise ValueError(f"Modo de conflito inválido: {conflito}")
+
+    tabelas = [tabela for tabela in ORDEM_TABELAS if tabela in arquivos]
+    cursor = conn.cursor()
+    relatorio = {"tabelas": {}, "indices_s": 0.0, "validacao_s": 0.0}
+
+    pragmas_originais = {nome: cursor.execute(f"PRAGMA {nome}").fetchone()[0] for nome in PRAGMAS_CARGA}
+    for nome, valor in PRAGMAS_CARGA.items():
+        cursor.execute(f"PRAGMA {nome} = {valor}")
+
+    inicio = time.perf_counter()
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+        adiados = _remover_indices_e_triggers(cursor, tabelas) if adiar_indices else []
+
+        for tabela in tabelas:
+            with ler_arquivo(arquivos[tabela]) as (colunas, linhas):
+                _validar_colunas(cursor, tabela, colunas)
+
+                inicio_tabela = time.perf_counter()
+                total = inserir_em_lotes(cursor, f"""
+                    INSERT OR {conflito} INTO {tabela} ({', '.join(colunas)})
+                    VALUES ({', '.join('?' * len(colunas))})
+                """, linhas, tamanho_lote)
+            segundos = time.perf_counter() - inicio_tabela
+            relatorio["tabelas"][tabela] = {
+                "linhas": total,
+                "segundos": segundos,
+                "linhas_por_segundo": total / segundos if segundos > 0 else None,
+            }
+
+        if adiados:
+            inicio_indices = time.perf_counter()
+            for sql in adiados:
+                cursor.execute(sql)
+            if _tabela_existe(cursor, "Estatisticas"):
+                atualizar_contadores(cursor)
+            if agregados_disponiveis(conn):
+                reconstruir_agregados(cursor)
+            if busca_disponivel(conn) and {"Artigo", "Revisao"} & set(tabelas):
+                reconstruir_busca(cursor)
+            if _tabela_existe(cursor, "Alteracoes_Colunares"):
+                marcar_alteradas(cursor, tabelas)
+            if _tabela_existe(cursor, "Alteracoes_Revisores"):
+                marcar_recarga(cursor)
+            relatorio["indices_s"] = time.perf_counter() - inicio_indices
+
+        if validar_fk:
+            inicio_validacao = time.perf_counter()
+            violacoes = [
+                violacao for tabela in tabelas
+                for violacao in cursor.execute(f"PRAGMA foreign_key_check({tabela})").fetchall()
+            ]
+            relatorio["validacao_s"] = time.perf_counter() - inicio_validacao
+            if violacoes:
+                raise ViolacaoChaveEstrangeira(violacoes)
+
+        conn.commit()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    finally:
+        for nome, valor in pragmas_originais.items():
+            cursor.execute(f"PRAGMA {nome} = {valor}")
+
+    total_linhas = sum(medicao["linhas"] for medicao in relatorio["tabelas"].values())
+    relatorio["total_linhas"] = total_linhas
+    relatorio["total_s"] = time.perf_counter() - inicio
+    relatorio["linhas_por_segundo"] = total_linhas / relatorio["total_s"] if relatorio["total_s"] > 0 else None
+    return relatorio
+
+def imprimir_relatorio(relatorio):
+    for tabela, medicao in relatorio["tabelas"].items():
+        taxa = f"{medicao['linhas_por_segundo']:,.0f} linhas/s" if medicao["linhas_por_segundo"] else "-"
+        print(f"  ✓ {tabela:<17} {medicao['linhas']:>12,} linhas  {medicao['segundos']:8.2f} s  {taxa}")
+    print(f"\n  Índices, triggers e resumos recriados em {relatorio['indices_s']:.2f} s")
+    print(f"  Chaves estrangeiras validadas em {relatorio['validacao_s']:.2f} s")
+    taxa = f"{relatorio['linhas_por_segundo']:,.0f}" if relatorio["linhas_por_segundo"] else "-"
+    print(f"\n✓ {relatorio['total_linhas']:,} linhas em {relatorio['total_s']:.2f} s ({taxa} linhas/s)")
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Importa CSV/JSONL em lote para as tabelas do banco.")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    parser.add_argument("--dir", default=None, help="Diretório com arquivos <Tabela>.csv ou <Tabela>.jsonl")
+    parser.add_argument("--arquivo", action="append", default=[], metavar="TABELA=CAMINHO",
+                        help="Arquivo de uma tabela específica; pode repetir")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE, help="Linhas por executemany")
+    parser.add_argument("--conflito", choices=CONFLITOS, default="ABORT",
+                        help="O que fazer com chaves primárias repetidas (INSERT OR ...)")
+    parser.add_argument("--manter-indices", action="store_true",
+                        help="Não remove índices e triggers durante a carga")
+    parser.add_argument("--sem-validar-fk", action="store_true", help="Não roda PRAGMA foreign_key_check no fim")
+    args = parser.parse_args()
+
+    arquivos = arquivos_do_diretorio(args.dir) if args.dir else {}
+    for atribuicao in args.arquivo:
+        tabela, separador, caminho = atribuicao.partition("=")
+        if not separador:
+            parser.error(f"--arquivo espera TABELA=CAMINHO, recebido: {atribuicao}")
+        arquivos[tabela.strip()] = caminho
+    if not arquivos:
+        parser.error("Nenhum arquivo para importar: use --dir ou --arquivo")
+
+    conn = conectar(args.db, timeout=30)
+    try:
+        relatorio = carregar(
+            conn, arquivos,
+            adiar_indices=not args.manter_indices,
+            validar_fk=not args.sem_validar_fk,
+            conflito=args.conflito,
+            tamanho_lote=args.lote,
+        )
+    except (ViolacaoChaveEstrangeira, ValueError, sqlite3.Error) as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+    finally:
+        conn.close()
+
+    print(f"Importação em {args.db}:")
+    imprimir_relatorio(relatorio)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+from agregados import agregados_disponiveis
+
+CONSULTAS = {
+    1: {
+        "nome": "Listar Artigos e Anos de Edição",
+        "sql": """
+SELECT A.Titulo, E.Ano, A.Status
+FROM Artigo A
+JOIN Edicao E ON A.Cod_Edicao = E.Cod_Edicao
+WHERE (:ano IS NULL OR E.Ano = :ano)
+  AND (:status IS NULL OR A.Status = :status);
+""",
+        "parametros": {"ano": None, "status": None}
+    },
+    
+    2: {
+        "nome": "Autores e Seus Artigos",
+        "sql": """
+SELECT U.Nome AS Autor, AR.Titulo
+FROM Usuario U
+JOIN Autoria AUT ON U.ID_Usuario = AUT.Cod_Autor
+JOIN Artigo AR ON AUT.Cod_Artigo = AR.Cod_Artigo;
+"""
+    },
+    
+    3: {
+        "nome": "Revisores e Suas Áreas de Conhecimento",
+        "sql": """
+SELECT U.Nome AS Revisor, AREA.Nome_Area
+FROM Usuario U
+JOIN Revisor R ON U.ID_Usuario = R.ID_Usuario
+JOIN Revisor_Area RA ON R.ID_Usuario = RA.ID_Revisor
+JOIN Area AREA ON RA.Cod_Area = AREA.Cod_Area;
+"""
+    },
+    
+    4: {
+        "nome": "Artigos com Pareceres e Notas",
+        "sql": """
+SELECT A.Titulo, U.Nome AS Revisor, R.Nota
+FROM Artigo A
+JOIN Revisao R ON A.Cod_Artigo = R.Cod_Artigo
+JOIN Usuario U ON R.Cod_Revisor = U.ID_Usuario;
+"""
+    },
+    
+    5: {
+        "nome": "Chamadas Especiais e Datas Limite",
+        "sql": """
+SELECT CE.Titulo_Tematico, CE.Data_Limite, E.Status
+FROM Chamada_Especial CE
+JOIN Edicao E ON CE.Cod_Edicao = E.Cod_Edicao;
+"""
+    },
+    
+    6: {
+        "nome": "Usuários e Cargos de Editores (LEFT JOIN)",
+        "sql": """
+SELECT U.Nome, E.Cargo
+FROM Usuario U
+LEFT JOIN Editor E ON U.ID_Usuario = E.ID_Usuario;
+"""
+    },
+    
+    7: {
+        "nome": "Áreas e Artigos Vinculados (LEFT JOIN)",
+        "sql": """
+SELECT AREA.Nome_Area, AR.Titulo
+FROM Area AREA
+LEFT JOIN Artigo_Area AA ON AREA.Cod_Area = AA.Cod_Area
+LEFT JOIN Artigo AR ON AA.Cod_Artigo = AR.Cod_Artigo;
+"""
+    },
+    
+    8: {
+        "nome": "Quantidade de Artigos por Status (HAVING)",
+        "sql": """
+SELECT Status, COUNT(*) AS Qtd_Artigos
+FROM Artigo
+GROUP BY Status
+HAVING COUNT(*) > 1
+ORDER BY Qtd_Artigos DESC;
+""",
+        "sql_materializado": """
+SELECT Status, Qtd_Linhas AS Qtd_Artigos
+FROM Resumo_Status
+WHERE Qtd_Linhas > 1
+ORDER BY Qtd_Artigos DESC;
+"""
+    },
+    
+    9: {
+        "nome": "Média de Notas por Revisor (HAVING)",
+        "sql": """
+SELECT U.Nome AS Revisor, AVG(R.Nota) AS Media_Notas_Dadas
+FROM Usuario U
+JOIN Revisao R ON U.ID_Usuario = R.Cod_Revisor
+GROUP BY U.Nome
+HAVING AVG(R.Nota) > :nota_minima
+ORDER BY Media_Notas_Dadas DESC;
+""",
+        "sql_materializado": """
+SELECT U.Nome AS Revisor, SUM(S.Soma_Notas) / SUM(S.Qtd_Notas) AS Media_Notas_Dadas
+FROM Usuario U
+JOIN Resumo_Revisor S ON U.ID_Usuario = S.Cod_Revisor
+GROUP BY U.Nome
+HAVING SUM(S.Soma_Notas) / SUM(S.Qtd_Notas) > :nota_minima
+ORDER BY Media_Notas_Dadas DESC;
+""",
+        "parametros": {"nota_minima": 7.0}
+    },
+    
+    10: {
+        "nome": "Áreas com 2+ Revisores",
+        "sql": """
+SELECT A.Nome_Area, COUNT(RA.ID_Revisor) AS Qtd_Revisores
+FROM Area A
+JOIN Revisor_Area RA ON A.Cod_Area = RA.Cod_Area
+GROUP BY A.Nome_Area
+HAVING COUNT(RA.ID_Revisor) >= :minimo_revisores
+ORDER BY A.Nome_Area ASC;
+""",
+        "sql_materializado": """
+SELECT A.Nome_Area, SUM(S.Qtd_Revisores) AS Qtd_Revisores
+FROM Area A
+JOIN Resumo_Area S ON A.Cod_Area = S.Cod_Area
+GROUP BY A.Nome_Area
+HAVING SUM(S.Qtd_Revisores) >= :minimo_revisores
+ORDER BY A.Nome_Area ASC;
+""",
+        "parametros": {"minimo_revisores": 2}
+    },
+    
+    11: {
+        "nome": "Edições por Soma de Notas (HAVING)",
+        "sql": """
+SELECT E.Ano, SUM(REV.Nota) AS Soma_Notas
+FROM Edicao E
+JOIN Artigo A ON E.Cod_Edicao = A.Cod_Edicao
+JOIN Revisao REV ON A.Cod_Artigo = REV.Cod_Artigo
+GROUP BY E.Ano
+HAVING SUM(REV.Nota) > :soma_minima
+ORDER BY Soma_Notas DESC;
+""",
+        "sql_materializado": """
+SELECT E.Ano, SUM(CASE WHEN S.Qtd_Notas > 0 THEN S.Soma_Notas END) AS Soma_Notas
+FROM Edicao E
+JOIN Resumo_Edicao S ON E.Cod_Edicao = S.Cod_Edicao
+GROUP BY E.Ano
+HAVING SUM(CASE WHEN S.Qtd_Notas > 0 THEN S.Soma_Notas END) > :soma_minima
+ORDER BY Soma_Notas DESC;
+""",
+        "parametros": {"soma_minima": 10}
+    },
+    
+    12: {
+        "nome": "Contagem de Artigos por Autor",
+        "sql": """
+SELECT U.Nome AS Autor, COUNT(AUT.Cod_Artigo) AS Total_Artigos
+FROM Usuario U
+JOIN Autoria AUT ON U.ID_Usuario = AUT.Cod_Autor
+GROUP BY U.Nome
+HAVING COUNT(AUT.Cod_Artigo) >= 1
+ORDER BY Total_Artigos DESC;
+""",
+        "sql_materializado": """
+SELECT U.Nome AS Autor, SUM(S.Qtd_Artigos) AS Total_Artigos
+FROM Usuario U
+JOIN Resumo_Autor S ON U.ID_Usuario = S.Cod_Autor
+GROUP BY U.Nome
+HAVING SUM(S.Qtd_Artigos) >= 1
+ORDER BY Total_Artigos DESC;
+"""
+    }
+}
+
+def sql_para(conn, num):
+    """Texto da consulta `num` para `conn`: a versão sobre os resumos materializados quando o banco os possui."""
+    consulta = CONSULTAS[num]
+    if "sql_materializado" in consulta and agregados_disponiveis(conn):
+        return consulta["sql_materializado"]
+    return consulta["sql"]
+
+def parametros(num, valores=None):
+    """Parâmetros nomeados da consulta `num`: os padrões do catálogo com os `valores` informados por cima."""
+    valores = valores or {}
+    return {nome: valores.get(nome, padrao) for nome, padrao in CONSULTAS[num].get("parametros", {}).items()}
+
+def interpretar_valor(texto):
+    """Converte o texto digitado (CLI ou formulário) em int, float ou str; vazio vira None."""
+    texto = texto.strip()
+    if not texto:
+        return None
+    for tipo in (int, float):
+        try:
+            return tipo(texto)
+        except ValueError:
+            pass
+    return texto
+
+def executar(conn, num, valores=None):
+    """Executa a consulta com os parâmetros ligados ao texto fixo do catálogo.
+
+    Como o texto não muda entre execuções, o cache de statements da conexão (`cached_statements`)
+    reaproveita a compilação e só os valores são religados.
+    """
+    return conn.execute(sql_para(conn, num), parametros(num, valores))
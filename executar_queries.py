@@ -1,198 +1,255 @@
-import sqlite3
-import pandas as pd
+import time
+
+INICIO_PROCESSO = time.perf_counter()
+
+import importlib
+import itertools
+import sys
+
+TEMPOS_IMPORTACAO = {}
+
+def importar(nome):
+    """Importa sob demanda, registrando o tempo gasto para o relatório de --profile-startup."""
+    modulo = sys.modules.get(nome)
+    if modulo is None:
+        inicio = time.perf_counter()
+        modulo = importlib.import_module(nome)
+        TEMPOS_IMPORTACAO[nome] = time.perf_counter() - inicio
+    return modulo
+
+sqlite3 = importar("sqlite3")
+ResultadoColunar = importar("resultado_colunar").ResultadoColunar
+catalogo = importar("catalogo")
+CONSULTAS = catalogo.CONSULTAS
 
 DB_PATH = "submissao.db"
 
-CONSULTAS = {
-    1: {
-        "nome": "Listar Artigos e Anos de Edição",
-        "sql": """
-SELECT A.Titulo, E.Ano, A.Status
-FROM Artigo A
-JOIN Edicao E ON A.Cod_Edicao = E.Cod_Edicao;
-"""
-    },
-    
-    2: {
-        "nome": "Autores e Seus Artigos",
-        "sql": """
-SELECT U.Nome AS Autor, AR.Titulo
-FROM Usuario U
-JOIN Autoria AUT ON U.ID_Usuario = AUT.Cod_Autor
-JOIN Artigo AR ON AUT.Cod_Artigo = AR.Cod_Artigo;
-"""
-    },
-    
-    3: {
-        "nome": "Revisores e Suas Áreas de Conhecimento",
-        "sql": """
-SELECT U.Nome AS Revisor, AREA.Nome_Area
-FROM Usuario U
-JOIN Revisor R ON U.ID_Usuario = R.ID_Usuario
-JOIN Revisor_Area RA ON R.ID_Usuario = RA.ID_Revisor
-JOIN Area AREA ON RA.Cod_Area = AREA.Cod_Area;
-"""
-    },
-    
-    4: {
-        "nome": "Artigos com Pareceres e Notas",
-        "sql": """
-SELECT A.Titulo, U.Nome AS Revisor, R.Nota
-FROM Artigo A
-JOIN Revisao R ON A.Cod_Artigo = R.Cod_Artigo
-JOIN Usuario U ON R.Cod_Revisor = U.ID_Usuario;
-"""
-    },
-    
-    5: {
-        "nome": "Chamadas Especiais e Datas Limite",
-        "sql": """
-SELECT CE.Titulo_Tematico, CE.Data_Limite, E.Status
-FROM Chamada_Especial CE
-JOIN Edicao E ON CE.Cod_Edicao = E.Cod_Edicao;
-"""
-    },
-    
-    6: {
-        "nome": "Usuários e Cargos de Editores (LEFT JOIN)",
-        "sql": """
-SELECT U.Nome, E.Cargo
-FROM Usuario U
-LEFT JOIN Editor E ON U.ID_Usuario = E.ID_Usuario;
-"""
-    },
-    
-    7: {
-        "nome": "Áreas e Artigos Vinculados (LEFT JOIN)",
-        "sql": """
-SELECT AREA.Nome_Area, AR.Titulo
-FROM Area AREA
-LEFT JOIN Artigo_Area AA ON AREA.Cod_Area = AA.Cod_Area
-LEFT JOIN Artigo AR ON AA.Cod_Artigo = AR.Cod_Artigo;
-"""
-    },
-    
-    8: {
-        "nome": "Quantidade de Artigos por Status (HAVING)",
-        "sql": """
-SELECT Status, COUNT(*) AS Qtd_Artigos
-FROM Artigo
-GROUP BY Status
-HAVING COUNT(*) > 1
-ORDER BY Qtd_Artigos DESC;
-"""
-    },
-    
-    9: {
-        "nome": "Média de Notas por Revisor (HAVING)",
-        "sql": """
-SELECT U.Nome AS Revisor, AVG(R.Nota) AS Media_Notas_Dadas
-FROM Usuario U
-JOIN Revisao R ON U.ID_Usuario = R.Cod_Revisor
-GROUP BY U.Nome
-HAVING AVG(R.Nota) > 7.0
-ORDER BY Media_Notas_Dadas DESC;
-"""
-    },
-    
-    10: {
-        "nome": "Áreas com 2+ Revisores",
-        "sql": """
-SELECT A.Nome_Area, COUNT(RA.ID_Revisor) AS Qtd_Revisores
-FROM Area A
-JOIN Revisor_Area RA ON A.Cod_Area = RA.Cod_Area
-GROUP BY A.Nome_Area
-HAVING COUNT(RA.ID_Revisor) >= 2
-ORDER BY A.Nome_Area ASC;
-"""
-    },
-    
-    11: {
-        "nome": "Edições por Soma de Notas (HAVING)",
-        "sql": """
-SELECT E.Ano, SUM(REV.Nota) AS Soma_Notas
-FROM Edicao E
-JOIN Artigo A ON E.Cod_Edicao = A.Cod_Edicao
-JOIN Revisao REV ON A.Cod_Artigo = REV.Cod_Artigo
-GROUP BY E.Ano
-HAVING SUM(REV.Nota) > 10
-ORDER BY Soma_Notas DESC;
-"""
-    },
-    
-    12: {
-        "nome": "Contagem de Artigos por Autor",
-        "sql": """
-SELECT U.Nome AS Autor, COUNT(AUT.Cod_Artigo) AS Total_Artigos
-FROM Usuario U
-JOIN Autoria AUT ON U.ID_Usuario = AUT.Cod_Autor
-GROUP BY U.Nome
-HAVING COUNT(AUT.Cod_Artigo) >= 1
-ORDER BY Total_Artigos DESC;
-"""
-    }
-}
-
-def executar_query(conn, sql):
+TAMANHO_BLOCO_IMPRESSAO = 1000
+
+def executar_query(conn, sql, parametros=(), metricas=None):
+    inicio = time.perf_counter()
     try:
-        df = pd.read_sql_query(sql, conn)
-        return df, None
+        cursor = conn.execute(sql, parametros)
+        colunas = [descricao[0] for descricao in cursor.description]
+        resultado, erro = ResultadoColunar.do_cursor(colunas, cursor.fetchall()), None
     except Exception as e:
-        return None, str(e)
+        resultado, erro = None, str(e)
+    if metricas is not None:
+        registrar_metricas(metricas, sql, time.perf_counter() - inicio, resultado, erro, parametros)
+    return resultado, erro
+
+def registrar_metricas(metricas, sql, segundos, resultado, erro, parametros=None):
+    linhas = len(resultado) if resultado is not None else None
+    bytes_resultado = resultado.tamanho_bytes() if resultado is not None else None
+    metricas.registrar(sql, segundos, linhas, bytes_resultado, erro, "cli", parametros)
+
+def contar_linhas(linhas, medicao):
+    """Repassa as linhas de um cursor contando-as na medição, sem materializar o resultado."""
+    medicao.linhas = 0
+    for linha in linhas:
+        medicao.linhas += 1
+        yield linha
 
-def imprimir_resultado(num, nome, sql, df, erro=None):
-    print(f"\n{'=' * 70}")
-    print(f"--- {num}. {nome} ---")
-    print(f"\nSQL:{sql}")
+def abrir_somente_leitura(db_path):
+    caminho = importar("pathlib").Path(db_path).resolve()
+    return sqlite3.connect(f"{caminho.as_uri()}?mode=ro", uri=True)
+
+def executar_no_processo(db_path, num, valores=None):
+    inicio = time.perf_counter()
+    try:
+        conn = abrir_somente_leitura(db_path)
+        try:
+            sql = catalogo.sql_para(conn, num)
+            resultado, erro = executar_query(conn, sql, catalogo.parametros(num, valores))
+            return num, sql, resultado, erro, time.perf_counter() - inicio
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        return num, CONSULTAS[num]["sql"], None, str(e), time.perf_counter() - inicio
+
+def imprimir_resultado(num, nome, sql, colunas, linhas, erro=None, saida=sys.stdout, parametros=None):
+    saida.write(f"\n{'=' * 70}\n")
+    saida.write(f"--- {num}. {nome} ---\n")
+    saida.write(f"\nSQL:{sql}\n")
+    if parametros:
+        saida.write("Parâmetros: " + ", ".join(f"{nome}={valor!r}" for nome, valor in parametros.items()) + "\n")
+    
+    if not isinstance(linhas, ResultadoColunar):
+        linhas = iter(linhas)
+        primeiro_bloco = list(itertools.islice(linhas, TAMANHO_BLOCO_IMPRESSAO))
     
     if erro:
-        print(f"\n❌ ERRO: {erro}")
-    elif df is not None and not df.empty:
-        print(f"\nRESULTADO:")
-        colunas = " | ".join(df.columns)
-        print(colunas)
-        print("-" * 70)
+        saida.write(f"\n❌ ERRO: {erro}\n")
+    elif isinstance(linhas, ResultadoColunar) and len(linhas):
+        saida.write(f"\nRESULTADO:\n")
+        linhas.imprimir(saida)
+        saida.write(f"\nTotal de linhas: {len(linhas)}\n")
+    elif not isinstance(linhas, ResultadoColunar) and primeiro_bloco:
+        saida.write(f"\nRESULTADO:\n")
+        saida.write(" | ".join(colunas) + "\n")
+        saida.write("-" * 70 + "\n")
         
-        for idx, row in df.iterrows():
-            valores = tuple(row)
-            print(valores)
+        total = 0
+        bloco = primeiro_bloco
+        while bloco:
+            saida.write("\n".join(map(repr, map(tuple, bloco))) + "\n")
+            total += len(bloco)
+            bloco = list(itertools.islice(linhas, TAMANHO_BLOCO_IMPRESSAO))
         
-        print(f"\nTotal de linhas: {len(df)}")
+        saida.write(f"\nTotal de linhas: {total}\n")
     else:
-        print(f"\nRESULTADO: Nenhum registro encontrado")
+        saida.write(f"\nRESULTADO: Nenhum registro encontrado\n")
     
-    print(f"{'=' * 70}\n")
+    saida.write(f"{'=' * 70}\n\n")
+
+def escrever_csv(num, nome, sql, colunas, linhas, erro=None, saida=sys.stdout):
+    escritor = importar("csv").writer(saida)
+    escritor.writerow([f"# {num}. {nome}"])
+    if erro:
+        escritor.writerow([f"# ERRO: {erro}"])
+    else:
+        escritor.writerow(colunas)
+        escritor.writerows(linhas)
+    saida.write("\n")
+
+def escrever_json(num, nome, sql, colunas, linhas, erro=None, saida=sys.stdout, primeira_consulta=True):
+    """O erro vai por último: se a leitura falhar no meio, o objeto fecha com as linhas já escritas e o erro."""
+    json = importar("json")
+    if not primeira_consulta:
+        saida.write(",\n")
+    cabecalho = json.dumps({"num": num, "nome": nome, "colunas": colunas}, ensure_ascii=False)
+    saida.write(cabecalho[:-1] + ', "linhas": [')
+    try:
+        for i, valores in enumerate(linhas):
+            saida.write(("," if i else "") + json.dumps(list(valores), ensure_ascii=False))
+    except BaseException as e:
+        erro = str(e) or type(e).__name__
+        raise
+    finally:
+        saida.write('], "erro": ' + json.dumps(erro, ensure_ascii=False) + "}")
+
+def imprimir_perfil_inicializacao(inicio_consultas, saida=sys.stderr):
+    saida.write("\nPERFIL DE INICIALIZAÇÃO\n")
+    saida.write("-" * 50 + "\n")
+    for nome, tempo in sorted(TEMPOS_IMPORTACAO.items(), key=lambda item: item[1], reverse=True):
+        saida.write(f"  import {nome:<30} {tempo * 1000:8.2f} ms\n")
+    saida.write(f"  {'total em imports':<37} {sum(TEMPOS_IMPORTACAO.values()) * 1000:8.2f} ms\n")
+    saida.write(f"  {'até a primeira consulta':<37} {(inicio_consultas - INICIO_PROCESSO) * 1000:8.2f} ms\n")
+    saida.write(f"  {'execução completa':<37} {(time.perf_counter() - INICIO_PROCESSO) * 1000:8.2f} ms\n")
 
 def main():
-    print("\n" + "=" * 70)
-    print("EXECUÇÃO DE TODAS AS QUERIES - TRABALHO FINAL DE BANCO DE DADOS")
-    print("=" * 70)
+    argparse = importar("argparse")
+    parser = argparse.ArgumentParser(description="Executa as 12 consultas obrigatórias.")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    parser.add_argument("--parallel", type=int, default=1, metavar="N",
+                        help="Executa as consultas em N processos, cada um com sua conexão somente leitura")
+    parser.add_argument("--format", choices=["table", "json", "csv"], default="table", help="Formato da saída")
+    parser.add_argument("--consultas", default=None, help="Números das consultas separados por vírgula (padrão: todas)")
+    parser.add_argument("--param", action="append", default=[], metavar="NOME=VALOR",
+                        help="Valor de um parâmetro das consultas do catálogo (ex.: --param nota_minima=8); pode repetir")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Mostra no stderr o tempo gasto em cada import e até a primeira consulta")
+    parser.add_argument("--metricas", default=None, metavar="ARQUIVO",
+                        help="Grava as métricas das consultas no formato texto do Prometheus ao terminar")
+    parser.add_argument("--limite-lenta-ms", type=float, default=None,
+                        help="Consultas acima deste tempo vão para o log de consultas lentas (JSONL)")
+    args = parser.parse_args()
+    
+    modulo_metricas = importar("metricas")
+    metricas = modulo_metricas.MetricasConsultas(
+        limite_lenta_ms=args.limite_lenta_ms if args.limite_lenta_ms is not None
+        else modulo_metricas.LIMITE_CONSULTA_LENTA_MS
+    )
+    
+    numeros = [int(n) for n in args.consultas.split(",")] if args.consultas else sorted(CONSULTAS.keys())
+    escrever = {"table": imprimir_resultado, "csv": escrever_csv, "json": escrever_json}[args.format]
+    tabela = args.format == "table"
+    
+    valores = {}
+    for atribuicao in args.param:
+        nome, separador, texto = atribuicao.partition("=")
+        if not separador:
+            parser.error(f"--param espera NOME=VALOR, recebido: {atribuicao}")
+        valores[nome.strip()] = catalogo.interpretar_valor(texto)
+    
+    def opcoes(i, num):
+        if args.format == "json":
+            return {"primeira_consulta": i == 0}
+        if tabela:
+            return {"parametros": catalogo.parametros(num, valores)}
+        return {}
+    
+    if tabela:
+        print("\n" + "=" * 70)
+        print("EXECUÇÃO DE TODAS AS QUERIES - TRABALHO FINAL DE BANCO DE DADOS")
+        print("=" * 70)
+    elif args.format == "json":
+        sys.stdout.write("[\n")
+    
+    inicio_consultas = time.perf_counter()
     
     try:
-        conn = sqlite3.connect(DB_PATH)
-        print(f"\n✓ Conectado ao banco: {DB_PATH}")
-        
-        for num in sorted(CONSULTAS.keys()):
-            consulta = CONSULTAS[num]
-            nome = consulta["nome"]
-            sql = consulta["sql"]
+        if args.parallel > 1:
+            ProcessPoolExecutor = importar("concurrent.futures").ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=args.parallel) as executor:
+                resultados = executor.map(executar_no_processo, itertools.repeat(args.db), numeros, itertools.repeat(valores))
+                if tabela:
+                    print(f"\n✓ {args.parallel} processos conectados ao banco: {args.db} (somente leitura)")
+                
+                for i, (num, sql, resultado, erro, segundos) in enumerate(resultados):
+                    registrar_metricas(metricas, sql, segundos, resultado, erro, catalogo.parametros(num, valores))
+                    consulta = CONSULTAS[num]
+                    extra = opcoes(i, num)
+                    colunas = resultado.colunas if resultado is not None else []
+                    linhas = (resultado if tabela else resultado.linhas()) if resultado is not None else []
+                    escrever(num, consulta["nome"], sql, colunas, linhas, erro, **extra)
             
-            df, erro = executar_query(conn, sql)
-            imprimir_resultado(num, nome, sql, df, erro)
-        
-        conn.close()
-        print(f"\n✓ Conexão fechada")
+            if tabela:
+                print(f"\n✓ Processos finalizados")
+        else:
+            conn = abrir_somente_leitura(args.db)
+            if tabela:
+                print(f"\n✓ Conectado ao banco: {args.db}")
+            
+            for i, num in enumerate(numeros):
+                consulta = CONSULTAS[num]
+                extra = opcoes(i, num)
+                sql = consulta["sql"]
+                colunas = None
+                try:
+                    sql = catalogo.sql_para(conn, num)
+                    parametros = catalogo.parametros(num, valores)
+                    with metricas.medir(sql, "cli", parametros) as medicao:
+                        cursor = conn.execute(sql, parametros)
+                        colunas = [descricao[0] for descricao in cursor.description]
+                        escrever(num, consulta["nome"], sql, colunas, contar_linhas(cursor, medicao), None, **extra)
+                except sqlite3.Error as e:
+                    if colunas is None or args.format != "json":
+                        escrever(num, consulta["nome"], sql, [], [], str(e), **extra)
+            
+            conn.close()
+            if tabela:
+                print(f"\n✓ Conexão fechada")
         
     except sqlite3.Error as e:
-        print(f"\n❌ Erro ao conectar ao banco de dados: {e}")
-        print(f"Certifique-se de que o arquivo '{DB_PATH}' existe.")
-        print(f"Execute o app.py e clique em 'Resetar/Criar Banco' primeiro.")
+        print(f"\n❌ Erro ao conectar ao banco de dados: {e}", file=sys.stderr)
+        print(f"Certifique-se de que o arquivo '{args.db}' existe.", file=sys.stderr)
+        print(f"Execute o app.py e clique em 'Resetar/Criar Banco' primeiro.", file=sys.stderr)
     except Exception as e:
-        print(f"\n❌ Erro inesperado: {e}")
+        print(f"\n❌ Erro inesperado: {e}", file=sys.stderr)
+    finally:
+        if tabela:
+            print("\n" + "=" * 70)
+            print("FIM DA EXECUÇÃO")
+            print("=" * 70 + "\n")
+        elif args.format == "json":
+            sys.stdout.write("\n]\n")
+    
+    if args.metricas:
+        metricas.gravar(args.metricas)
     
-    print("\n" + "=" * 70)
-    print("FIM DA EXECUÇÃO")
-    print("=" * 70 + "\n")
+    if args.profile_startup:
+        imprimir_perfil_inicializacao(inicio_consultas)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,97 @@
+import itertools
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+class FilaCheia(Exception):
+    pass
+
+class TarefaConsulta:
+    """Handle de uma consulta submetida ao executor: estado, progresso, linhas parciais e cancelamento."""
+
+    def __init__(self, id_tarefa, sql, controle, futuro, argumentos=None):
+        self.id = id_tarefa
+        self.sql = sql
+        self.argumentos = argumentos or {}
+        self.controle = controle
+        self.futuro = futuro
+        self.submetida_em = time.time()
+
+    @property
+    def concluida(self):
+        return self.futuro.done()
+
+    @property
+    def estado(self):
+        if self.futuro.cancelled():
+            return "cancelada"
+        if self.futuro.done():
+            resultado, erro = self.resultado()
+            if erro:
+                return "cancelada" if self.controle.cancelado else "erro"
+            return "concluída"
+        if self.controle.inicio is None:
+            return "na fila"
+        return "executando"
+
+    def cancelar(self):
+        self.futuro.cancel()
+        self.controle.cancelar()
+
+    def resultado(self):
+        try:
+            return self.futuro.result()
+        except CancelledError:
+            return None, "Consulta cancelada antes de iniciar."
+
+    def linhas_parciais(self, quantidade=50):
+        return self.controle.colunas, self.controle.parcial[:quantidade]
+
+    def progresso(self):
+        return {
+            "estado": self.estado,
+            "tempo_s": self.controle.tempo_decorrido(),
+            "passos_vm": self.controle.passos,
+            "linhas": self.controle.linhas,
+        }
+
+class ExecutorConsultas:
+    """Pool limitado de threads de consulta; cada tarefa usa uma conexão de leitura própria do pool."""
+
+    def __init__(self, max_trabalhadores=4, max_pendentes=16):
+        self.max_trabalhadores = max_trabalhadores
+        self.max_pendentes = max_pendentes
+        self._executor = ThreadPoolExecutor(max_workers=max_trabalhadores, thread_name_prefix="consulta")
+        self._vagas = threading.BoundedSemaphore(max_pendentes)
+        self._ids = itertools.count(1)
+        self._ativas = {}
+        self._trava = threading.Lock()
+
+    def submeter(self, funcao, sql, controle, **kwargs):
+        """Agenda funcao(sql, controle=controle, **kwargs) e devolve o handle da tarefa."""
+        if not self._vagas.acquire(blocking=False):
+            raise FilaCheia(f"Limite de {self.max_pendentes} consultas pendentes atingido. Aguarde ou cancele alguma.")
+
+        id_tarefa = next(self._ids)
+        futuro = self._executor.submit(funcao, sql, controle=controle, **kwargs)
+        tarefa = TarefaConsulta(id_tarefa, sql, controle, futuro, kwargs)
+
+        with self._trava:
+            self._ativas[id_tarefa] = tarefa
+        futuro.add_done_callback(lambda _: self._finalizar(id_tarefa))
+        return tarefa
+
+    def _finalizar(self, id_tarefa):
+        with self._trava:
+            self._ativas.pop(id_tarefa, None)
+        self._vagas.release()
+
+    def metricas(self):
+        with self._trava:
+            estados = [tarefa.estado for tarefa in self._ativas.values()]
+        return {
+            "max_trabalhadores": self.max_trabalhadores,
+            "max_pendentes": self.max_pendentes,
+            "executando": estados.count("executando"),
+            "na_fila": estados.count("na fila"),
+        }
@@ -0,0 +1,124 @@
+import csv
+import gzip
+import importlib.util
+import os
+import tempfile
+
+from limites_execucao import ControleExecucao
+from paginacao import como_subconsulta
+
+TAMANHO_BLOCO = 10_000
+
+FORMATOS = {
+    "CSV": {"extensao": ".csv", "mime": "text/csv", "pyarrow": False},
+    "CSV (gzip)": {"extensao": ".csv.gz", "mime": "application/gzip", "pyarrow": False},
+    "Parquet": {"extensao": ".parquet", "mime": "application/vnd.apache.parquet", "pyarrow": True},
+    "Arrow IPC": {"extensao": ".arrow", "mime": "application/vnd.apache.arrow.file", "pyarrow": True},
+}
+
+def formatos_disponiveis():
+    possui_pyarrow = importlib.util.find_spec("pyarrow") is not None
+    return [nome for nome, formato in FORMATOS.items() if possui_pyarrow or not formato["pyarrow"]]
+
+def iterar_blocos(cursor, tamanho_bloco=TAMANHO_BLOCO):
+    while True:
+        bloco = cursor.fetchmany(tamanho_bloco)
+        if not bloco:
+            return
+        yield bloco
+
+def _escrever_csv(cursor, arquivo, tamanho_bloco):
+    escritor = csv.writer(arquivo)
+    escritor.writerow([descricao[0] for descricao in cursor.description])
+    linhas = 0
+    for bloco in iterar_blocos(cursor, tamanho_bloco):
+        escritor.writerows(bloco)
+        linhas += len(bloco)
+    return linhas
+
+def classes_das_colunas(conn, sql, quantidade, parametros=()):
+    """Classes de armazenamento (typeof) que cada coluna assume no resultado inteiro, numa passada agregada."""
+    nomes = [f"c{i}" for i in range(quantidade)]
+    linha = conn.execute(
+        f"WITH resultado ({', '.join(nomes)}) AS {como_subconsulta(sql)} "
+        f"SELECT {', '.join(f'group_concat(DISTINCT typeof({nome}))' for nome in nomes)} FROM resultado",
+        parametros
+    ).fetchone()
+    return [set(classes.split(",")) - {"null"} if classes else set() for classes in linha]
+
+def _tipo_arrow(pa, classes):
+    if classes and classes <= {"integer"}:
+        return pa.int64()
+    if classes and classes <= {"integer", "real"}:
+        return pa.float64()
+    if classes == {"blob"}:
+        return pa.binary()
+    return pa.string()
+
+def _lote_arrow(pa, bloco, esquema):
+    arrays = []
+    for valores, campo in zip(zip(*bloco), esquema):
+        if pa.types.is_string(campo.type):
+            valores = [valor if valor is None or isinstance(valor, str) else str(valor) for valor in valores]
+        arrays.append(pa.array(valores, type=campo.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=esquema)
+
+def _escrever_arrow(cursor, caminho, formato, tamanho_bloco, classes):
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    colunas = [descricao[0] for descricao in cursor.description]
+    esquema = pa.schema([(coluna, _tipo_arrow(pa, classes_coluna)) for coluna, classes_coluna in zip(colunas, classes)])
+    if formato == "Parquet":
+        escritor = pyarrow.parquet.ParquetWriter(caminho, esquema)
+    else:
+        escritor = pyarrow.ipc.new_file(caminho, esquema)
+    linhas = 0
+
+    try:
+        for bloco in iterar_blocos(cursor, tamanho_bloco):
+            lote = _lote_arrow(pa, bloco, esquema)
+            if formato == "Parquet":
+                escritor.write_table(pa.Table.from_batches([lote]))
+            else:
+                escritor.write_batch(lote)
+            linhas += len(bloco)
+    finally:
+        escritor.close()
+
+    return linhas
+
+def exportar(conn, sql, formato, caminho, tamanho_bloco=TAMANHO_BLOCO, parametros=(), controle=None):
+    """Exporta o resultado de `sql` para `caminho` lendo o cursor em blocos, sob os limites de `controle`.
+
+    Parquet e Arrow IPC fazem antes uma passada com typeof() para fixar o tipo de cada coluna no resultado
+    inteiro (inteiro, real, texto ou binário; mistura de texto com outra classe vira texto). Retorna o número de linhas.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de exportação desconhecido: {formato}")
+
+    controle = controle or ControleExecucao(tempo_limite_s=None)
+    with controle.aplicar(conn):
+        cursor = conn.execute(sql, parametros)
+        try:
+            if formato == "CSV":
+                with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+                    return _escrever_csv(cursor, arquivo, tamanho_bloco)
+            if formato == "CSV (gzip)":
+                with gzip.open(caminho, "wt", newline="", encoding="utf-8") as arquivo:
+                    return _escrever_csv(cursor, arquivo, tamanho_bloco)
+            classes = classes_das_colunas(conn, sql, len(cursor.description), parametros)
+            return _escrever_arrow(cursor, caminho, formato, tamanho_bloco, classes)
+        finally:
+            cursor.close()
+
+def exportar_para_temporario(conn, sql, formato, tamanho_bloco=TAMANHO_BLOCO, parametros=(), controle=None):
+    descritor, caminho = tempfile.mkstemp(prefix="resultado_query_", suffix=FORMATOS[formato]["extensao"])
+    os.close(descritor)
+    try:
+        linhas = exportar(conn, sql, formato, caminho, tamanho_bloco, parametros, controle)
+    except Exception:
+        os.remove(caminho)
+        raise
+    return caminho, linhas
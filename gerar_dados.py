@@ -0,0 +1,266 @@
+import random
+from datetime import date
+from itertools import islice
+
+TAMANHO_LOTE = 50_000
+
+VOLUMES_SF1 = {
+    "Usuario": 100_000,
+    "Artigo": 1_000_000,
+    "Edicao": 1_000,
+    "Area": 100,
+}
+
+REVISOES_POR_ARTIGO = 5
+
+PRAGMAS_CARGA = {
+    "synchronous": "OFF",
+    "cache_size": -262144,
+    "temp_store": "MEMORY",
+    "foreign_keys": "OFF",
+    "recursive_triggers": "ON",
+}
+
+NOMES = [
+    'João', 'Maria', 'Pedro', 'Ana', 'Carlos', 'Fernanda', 'Lucas', 'Julia',
+    'Marcos', 'Patricia', 'Rafael', 'Sofia', 'Bruno', 'Camila', 'Diego', 'Larissa'
+]
+
+SOBRENOMES = [
+    'Silva', 'Santos', 'Souza', 'Oliveira', 'Pereira', 'Costa', 'Almeida', 'Lima',
+    'Rocha', 'Gomes', 'Mendes', 'Martins', 'Ribeiro', 'Carvalho', 'Barbosa', 'Teixeira'
+]
+
+INSTITUICOES = [
+    ('Universidade A', 'univ.edu.br'),
+    ('Instituto B', 'inst.org'),
+    ('Tech Solutions', 'tech.com'),
+    ('Universidade C', 'univ.c'),
+    ('Laboratório X', 'lab.net'),
+    ('Editora Global', 'editora.com')
+]
+
+AREAS_BASE = [
+    ('Inteligência Artificial', 'Estudo de agentes inteligentes e aprendizado de máquina.'),
+    ('Banco de Dados', 'Gerenciamento, modelagem e otimização de dados.'),
+    ('Engenharia de Software', 'Processos, métodos e ferramentas para desenvolvimento.'),
+    ('Redes de Computadores', 'Comunicação de dados e protocolos.'),
+    ('Segurança da Informação', 'Proteção de sistemas e dados.'),
+    ('Sistemas Operacionais', 'Gerenciamento de recursos de hardware e software.'),
+    ('Interação Humano-Computador', 'Design e avaliação de interfaces.'),
+    ('Computação Gráfica', 'Processamento de imagens e renderização.'),
+    ('Bioinformática', 'Aplicação de computação em biologia.'),
+    ('Internet das Coisas', 'Conectividade de dispositivos embarcados.')
+]
+
+TEMAS = [
+    'Redes Neurais', 'Otimização de Queries', 'Metodologias Ágeis', 'Protocolos de Roteamento',
+    'Criptografia Pós-Quântica', 'Acessibilidade Digital', 'Ray Tracing', 'Genômica Computacional',
+    'Sensores Agrícolas', 'Virtualização de Servidores', 'Aprendizado Federado', 'Indexação Espacial'
+]
+
+ABORDAGENS = ['Uma Análise de', 'Avanços em', 'Estudo de Caso sobre', 'Revisão Sistemática de', 'Aplicações de']
+
+STATUS_ARTIGO = ['Submetido', 'Em Revisão', 'Aceito', 'Rejeitado', 'Publicado']
+
+STATUS_EDICAO = ['Fechada', 'Publicada', 'Em andamento', 'Aberta', 'Planejada']
+
+PARECERES = [
+    'Excelente trabalho, metodologia sólida.',
+    'Bom, mas precisa de revisão bibliográfica.',
+    'Não atende aos requisitos da chamada.',
+    'Muito relevante para a área.',
+    'Inovador, recomendo publicação.',
+    'Amostragem pequena.',
+    'Análise estatística fraca.',
+    'Bem escrito e fundamentado.'
+]
+
+CARGOS = ['Editor Chefe', 'Editor Associado', 'Editor Convidado', 'Editor Técnico']
+
+def calcular_volumes(fator_escala):
+    usuarios = max(20, round(VOLUMES_SF1["Usuario"] * fator_escala))
+    artigos = max(10, round(VOLUMES_SF1["Artigo"] * fator_escala))
+
+    return {
+        "Usuario": usuarios,
+        "Autor": int(usuarios * 0.6),
+        "Revisor": int(usuarios * 0.3),
+        "Editor": usuarios - int(usuarios * 0.6) - int(usuarios * 0.3),
+        "Area": max(len(AREAS_BASE), round(VOLUMES_SF1["Area"] * fator_escala)),
+        "Edicao": max(10, round(VOLUMES_SF1["Edicao"] * fator_escala)),
+        "Artigo": artigos,
+        "Revisao": artigos * REVISOES_POR_ARTIGO,
+    }
+
+def inserir_em_lotes(cursor, sql, linhas, tamanho_lote=TAMANHO_LOTE):
+    linhas = iter(linhas)
+    total = 0
+
+    while True:
+        lote = list(islice(linhas, tamanho_lote))
+        if not lote:
+            return total
+        cursor.executemany(sql, lote)
+        total += len(lote)
+
+def _datas(inicio, fim):
+    primeiro, ultimo = date(inicio, 1, 1).toordinal(), date(fim, 12, 31).toordinal()
+    return [date.fromordinal(d).isoformat() for d in range(primeiro, ultimo + 1)]
+
+def _gerar_usuarios(rng, volumes):
+    datas = _datas(2015, 2025)
+    for i in range(1, volumes["Usuario"] + 1):
+        nome, sobrenome = rng.choice(NOMES), rng.choice(SOBRENOMES)
+        instituicao, dominio = rng.choice(INSTITUICOES)
+        yield (
+            f"{nome} {sobrenome}",
+            f"usuario{i}@{dominio}",
+            f"senha{i}",
+            instituicao,
+            rng.choice(datas)
+        )
+
+def _gerar_areas(volumes):
+    yield from AREAS_BASE
+    for i in range(len(AREAS_BASE) + 1, volumes["Area"] + 1):
+        yield (f"Área {i}", f"Área sintética de pesquisa número {i}.")
+
+def _gerar_edicoes(rng, volumes):
+    for _ in range(volumes["Edicao"]):
+        yield (rng.randint(2015, 2026), rng.choice(STATUS_EDICAO))
+
+def _gerar_artigos(rng, volumes):
+    for i in range(1, volumes["Artigo"] + 1):
+        tema = rng.choice(TEMAS)
+        yield (
+            f"{rng.choice(ABORDAGENS)} {tema} {i}",
+            f"Investigação sobre {tema.lower()} com foco em resultados experimentais.",
+            f"artigo{i}.pdf",
+            rng.choice(STATUS_ARTIGO),
+            rng.randint(1, volumes["Edicao"])
+        )
+
+def _gerar_autorias(rng, volumes):
+    for artigo in range(1, volumes["Artigo"] + 1):
+        autores = rng.sample(range(1, volumes["Autor"] + 1), rng.randint(1, 3))
+        for ordem, autor in enumerate(autores, start=1):
+            yield (autor, artigo, ordem)
+
+def _gerar_artigo_areas(rng, volumes):
+    for artigo in range(1, volumes["Artigo"] + 1):
+        for area in rng.sample(range(1, volumes["Area"] + 1), rng.randint(1, 2)):
+            yield (artigo, area)
+
+def _gerar_revisor_areas(rng, volumes, primeiro_revisor):
+    for revisor in range(primeiro_revisor, primeiro_revisor + volumes["Revisor"]):
+        for area in rng.sample(range(1, volumes["Area"] + 1), rng.randint(1, 3)):
+            yield (revisor, area)
+
+def _gerar_revisoes(rng, volumes, primeiro_revisor):
+    datas = _datas(2015, 2026)
+    revisores = range(primeiro_revisor, primeiro_revisor + volumes["Revisor"])
+    for artigo in range(1, volumes["Artigo"] + 1):
+        for revisor in rng.sample(revisores, REVISOES_POR_ARTIGO):
+            yield (
+                artigo,
+                revisor,
+                rng.choice(PARECERES),
+                round(rng.uniform(0, 10), 1),
+                rng.choice(datas)
+            )
+
+def popular_sintetico(conn, fator_escala=1.0, semente=42):
+    """Popula um esquema vazio com dados sintéticos determinísticos para o fator de escala dado."""
+    volumes = calcular_volumes(fator_escala)
+    rng = random.Random(semente)
+    cursor = conn.cursor()
+
+    primeiro_revisor = volumes["Autor"] + 1
+    primeiro_editor = primeiro_revisor + volumes["Revisor"]
+
+    pragmas_originais = {nome: cursor.execute(f"PRAGMA {nome}").fetchone()[0] for nome in PRAGMAS_CARGA}
+    for nome, valor in PRAGMAS_CARGA.items():
+        cursor.execute(f"PRAGMA {nome} = {valor}")
+
+    try:
+        cursor.execute("BEGIN")
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Usuario (Nome, Email, Senha, Instituicao, Data_Cadastro)
+            VALUES (?, ?, ?, ?, ?)
+        """, _gerar_usuarios(rng, volumes))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Autor (ID_Usuario, ORCID, Bio_Resumida)
+            VALUES (?, ?, ?)
+        """, ((i, f"0000-{i // 10000 % 10000:04d}-{i % 10000:04d}-{rng.randint(0, 9999):04d}", 'Pesquisador.')
+              for i in range(1, primeiro_revisor)))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Revisor (ID_Usuario, Nota_Media)
+            VALUES (?, ?)
+        """, ((i, round(rng.uniform(5, 10), 1)) for i in range(primeiro_revisor, primeiro_editor)))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Editor (ID_Usuario, Cargo, Ativo)
+            VALUES (?, ?, ?)
+        """, ((i, rng.choice(CARGOS), rng.randint(0, 1)) for i in range(primeiro_editor, volumes["Usuario"] + 1)))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Area (Nome_Area, Descricao)
+            VALUES (?, ?)
+        """, _gerar_areas(volumes))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Edicao (Ano, Status)
+            VALUES (?, ?)
+        """, _gerar_edicoes(rng, volumes))
+
+        edicoes_regulares = int(volumes["Edicao"] * 0.7)
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Edicao_Regular (Cod_Edicao, Volume, Numero)
+            VALUES (?, ?, ?)
+        """, ((i, 1 + (i - 1) // 4, 1 + (i - 1) % 4) for i in range(1, edicoes_regulares + 1)))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Chamada_Especial (Cod_Edicao, Titulo_Tematico, Descricao, Data_Limite)
+            VALUES (?, ?, ?, ?)
+        """, ((i, f"Chamada Especial em {rng.choice(TEMAS)}", 'Chamada temática sintética.', f"{rng.randint(2015, 2026)}-{rng.randint(1, 12):02d}-15")
+              for i in range(edicoes_regulares + 1, volumes["Edicao"] + 1)))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Artigo (Titulo, Resumo, Arquivo, Status, Cod_Edicao)
+            VALUES (?, ?, ?, ?, ?)
+        """, _gerar_artigos(rng, volumes))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Artigo_Area (Cod_Artigo, Cod_Area)
+            VALUES (?, ?)
+        """, _gerar_artigo_areas(rng, volumes))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Autoria (Cod_Autor, Cod_Artigo, Ordem_Autoria)
+            VALUES (?, ?, ?)
+        """, _gerar_autorias(rng, volumes))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Revisor_Area (ID_Revisor, Cod_Area)
+            VALUES (?, ?)
+        """, _gerar_revisor_areas(rng, volumes, primeiro_revisor))
+
+        inserir_em_lotes(cursor, """
+            INSERT INTO Revisao (Cod_Artigo, Cod_Revisor, Parecer, Nota, Data_Entrega)
+            VALUES (?, ?, ?, ?, ?)
+        """, _gerar_revisoes(rng, volumes, primeiro_revisor))
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        for nome, valor in pragmas_originais.items():
+            cursor.execute(f"PRAGMA {nome} = {valor}")
+
+    return volumes
@@ -0,0 +1,108 @@
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+TEMPO_LIMITE_PADRAO_S = 30
+
+INTERVALO_PROGRESSO = 1000
+
+class ConsultaAbortada(Exception):
+    def __init__(self, motivo, tempo_s, passos_vm, linhas):
+        self.motivo = motivo
+        self.tempo_s = tempo_s
+        self.passos_vm = passos_vm
+        self.linhas = linhas
+        super().__init__(
+            f"{motivo} após {tempo_s:.2f} s, ~{passos_vm:,} instruções da VM executadas "
+            f"e {linhas} linha(s) lida(s)."
+        )
+
+class ControleExecucao:
+    """Limites de uma execução: tempo de parede, instruções da VM, linhas lidas e cancelamento externo."""
+
+    def __init__(self, tempo_limite_s=TEMPO_LIMITE_PADRAO_S, max_passos=None, max_linhas=None,
+                 intervalo=INTERVALO_PROGRESSO):
+        self.tempo_limite_s = tempo_limite_s
+        self.max_passos = max_passos
+        self.max_linhas = max_linhas
+        self.intervalo = intervalo
+
+        self.passos = 0
+        self.linhas = 0
+        self.colunas = []
+        self.parcial = []
+        self.motivo = None
+        self.inicio = None
+        self._cancelado = threading.Event()
+        self._conn = None
+        self._trava_conn = threading.Lock()
+
+    def cancelar(self):
+        """Marca o cancelamento e interrompe a consulta em andamento.
+
+        A trava impede que o interrupt chegue depois de `aplicar` devolver a conexão (ao pool, por exemplo).
+        """
+        self._cancelado.set()
+        with self._trava_conn:
+            if self._conn is not None:
+                self._conn.interrupt()
+
+    @property
+    def cancelado(self):
+        return self._cancelado.is_set()
+
+    def tempo_decorrido(self):
+        return time.perf_counter() - self.inicio if self.inicio else 0.0
+
+    def _verificar(self):
+        self.passos += self.intervalo
+        if self._cancelado.is_set():
+            self.motivo = "Consulta cancelada pelo usuário"
+        elif self.tempo_limite_s and self.tempo_decorrido() > self.tempo_limite_s:
+            self.motivo = f"Tempo limite de {self.tempo_limite_s:g} s excedido"
+        elif self.max_passos and self.passos > self.max_passos:
+            self.motivo = f"Limite de {self.max_passos:,} instruções da VM excedido"
+        return 1 if self.motivo else 0
+
+    def abortar(self):
+        return ConsultaAbortada(self.motivo, self.tempo_decorrido(), self.passos, self.linhas)
+
+    @contextmanager
+    def aplicar(self, conn):
+        """Instala o progress handler na conexão e converte a interrupção em ConsultaAbortada."""
+        self.inicio = self.inicio or time.perf_counter()
+        with self._trava_conn:
+            self._conn = conn
+        conn.set_progress_handler(self._verificar, self.intervalo)
+        try:
+            if self.cancelado:
+                self.motivo = "Consulta cancelada pelo usuário"
+                raise self.abortar()
+            yield self
+        except sqlite3.OperationalError as e:
+            if self.motivo is None and self.cancelado:
+                self.motivo = "Consulta cancelada pelo usuário"
+            if self.motivo is not None:
+                raise self.abortar() from e
+            raise
+        finally:
+            with self._trava_conn:
+                self._conn = None
+            conn.set_progress_handler(None, 0)
+
+    def buscar(self, cursor, tamanho_bloco=1000):
+        """Lê o cursor em blocos, respeitando max_linhas; retorna (linhas, truncado).
+
+        As linhas já lidas ficam visíveis em `parcial` enquanto a leitura acontece.
+        """
+        self.colunas = [descricao[0] for descricao in cursor.description or []]
+        linhas = self.parcial = []
+        while True:
+            bloco = cursor.fetchmany(tamanho_bloco)
+            if not bloco:
+                return linhas, False
+            linhas.extend(bloco)
+            self.linhas = len(linhas)
+            if self.max_linhas and len(linhas) > self.max_linhas:
+                return linhas[:self.max_linhas], True
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from cache_resultados import PADRAO_LITERAIS, normalizar_sql
+
+LIMITES_HISTOGRAMA_S = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LIMITE_CONSULTA_LENTA_MS = 500
+
+MAX_IMPRESSOES = 500
+
+IMPRESSAO_EXCEDENTE = "outras"
+
+CAMINHO_LOG_LENTAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs", "consultas_lentas.jsonl")
+
+MAX_BYTES_LOG = 10 * 1024 * 1024
+
+PORTA_METRICAS = 9464
+
+PADRAO_NUMEROS = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+
+PADRAO_LISTAS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+def impressao_digital(sql):
+    """Forma canônica da consulta (literais e números viram '?') e um identificador curto dela.
+
+    Consultas que só mudam nos valores caem na mesma impressão, então o histograma agrupa execuções comparáveis.
+    """
+    partes = PADRAO_LITERAIS.split(normalizar_sql(sql))
+    texto = "".join(
+        ("?" if parte.startswith("'") else parte) if i % 2 else PADRAO_NUMEROS.sub("?", parte)
+        for i, parte in enumerate(partes)
+    )
+    texto = PADRAO_LISTAS.sub("(?)", texto).upper()
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()[:12], texto
+
+def _escapar_rotulo(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+class Medicao:
+    def __init__(self):
+        self.linhas = None
+        self.bytes = None
+        self.erro = None
+
+class MetricasConsultas:
+    """Latência (histograma), linhas, bytes e erros por impressão digital, com log JSONL das consultas lentas."""
+
+    def __init__(self, limite_lenta_ms=LIMITE_CONSULTA_LENTA_MS, caminho_log=CAMINHO_LOG_LENTAS,
+                 max_impressoes=MAX_IMPRESSOES):
+        self.limite_lenta_ms = limite_lenta_ms
+        self.caminho_log = caminho_log
+        self.max_impressoes = max_impressoes
+        self.servidor = None
+        self._consultas = {}
+        self._trava = threading.Lock()
+        self._trava_log = threading.Lock()
+
+    def _entrada(self, impressao, texto):
+        entrada = self._consultas.get(impressao)
+        if entrada is None:
+            if len(self._consultas) >= self.max_impressoes:
+                impressao, texto = IMPRESSAO_EXCEDENTE, "(demais consultas)"
+                entrada = self._consultas.get(impressao)
+            if entrada is None:
+                entrada = self._consultas[impressao] = {
+                    "impressao": impressao,
+                    "consulta": texto,
+                    "origens": set(),
+                    "execucoes": 0,
+                    "erros": 0,
+                    "soma_s": 0.0,
+                    "maximo_s": 0.0,
+                    "baldes": [0] * len(LIMITES_HISTOGRAMA_S),
+                    "linhas": 0,
+                    "bytes": 0,
+                }
+        return entrada
+
+    def registrar(self, sql, segundos, linhas=None, bytes_resultado=None, erro=None, origem="app", parametros=None):
+        impressao, texto = impressao_digital(sql)
+        with self._trava:
+            entrada = self._entrada(impressao, texto)
+            entrada["origens"].add(origem)
+            entrada["execucoes"] += 1
+            entrada["erros"] += erro is not None
+            entrada["soma_s"] += segundos
+            entrada["maximo_s"] = max(entrada["maximo_s"], segundos)
+            entrada["linhas"] += linhas or 0
+            entrada["bytes"] += bytes_resultado or 0
+            for i, limite in enumerate(LIMITES_HISTOGRAMA_S):
+                if segundos <= limite:
+                    entrada["baldes"][i] += 1
+                    break
+
+        if self.caminho_log and segundos * 1000 >= self.limite_lenta_ms:
+            self._registrar_lenta({
+                "momento": datetime.now().isoformat(timespec="milliseconds"),
+                "origem": origem,
+                "impressao": impressao,
+                "tempo_ms": round(segundos * 1000, 3),
+                "linhas": linhas,
+                "bytes": bytes_resultado,
+                "erro": erro,
+                "sql": sql.strip(),
+                "parametros": parametros or None,
+            })
+
+    def _registrar_lenta(self, registro):
+        linha = json.dumps(registro, ensure_ascii=False, default=str) + "\n"
+        with self._trava_log:
+            os.makedirs(os.path.dirname(self.caminho_log), exist_ok=True)
+            if os.path.exists(self.caminho_log) and os.path.getsize(self.caminho_log) > MAX_BYTES_LOG:
+                os.replace(self.caminho_log, self.caminho_log + ".1")
+            with open(self.caminho_log, "a", encoding="utf-8") as arquivo:
+                arquivo.write(linha)
+
+    @contextmanager
+    def medir(self, sql, origem="app", parametros=None):
+        """Mede o bloco; quem chama preenche linhas, bytes e erro na Medicao. Exceções contam como erro."""
+        medicao = Medicao()
+        inicio = time.perf_counter()
+        try:
+            yield medicao
+        except Exception as e:
+            medicao.erro = str(e)
+            raise
+        finally:
+            self.registrar(sql, time.perf_counter() - inicio, medicao.linhas, medicao.bytes, medicao.erro,
+                           origem, parametros)
+
+    def resumo(self):
+        """Uma linha por impressão digital, das que mais somam tempo para as que menos somam."""
+        with self._trava:
+            entradas = [dict(entrada, origens=sorted(entrada["origens"])) for entrada in self._consultas.values()]
+        for entrada in entradas:
+            entrada["media_ms"] = entrada["soma_s"] / entrada["execucoes"] * 1000
+            entrada["maximo_ms"] = entrada["maximo_s"] * 1000
+        return sorted(entradas, key=lambda entrada: entrada["soma_s"], reverse=True)
+
+    def exposicao(self):
+        """Métricas no formato texto de exposição do Prometheus."""
+        linhas = [
+            "# HELP consultas_duracao_segundos Latência das consultas por impressão digital.",
+            "# TYPE consultas_duracao_segundos histogram",
+        ]
+        contadores = {
+            "consultas_erros_total": ("erros", "Execuções que terminaram em erro."),
+            "consultas_linhas_total": ("linhas", "Linhas retornadas ou afetadas."),
+            "consultas_bytes_total": ("bytes", "Bytes dos resultados materializados."),
+        }
+        entradas = self.resumo()
+        for entrada in entradas:
+            rotulos = f'impressao="{entrada["impressao"]}",consulta="{_escapar_rotulo(entrada["consulta"][:120])}"'
+            acumulado = 0
+            for limite, quantidade in zip(LIMITES_HISTOGRAMA_S, entrada["baldes"]):
+                acumulado += quantidade
+                linhas.append(f'consultas_duracao_segundos_bucket{{{rotulos},le="{limite}"}} {acumulado}')
+            linhas.append(f'consultas_duracao_segundos_bucket{{{rotulos},le="+Inf"}} {entrada["execucoes"]}')
+            linhas.append(f"consultas_duracao_segundos_sum{{{rotulos}}} {entrada['soma_s']:.6f}")
+            linhas.append(f"consultas_duracao_segundos_count{{{rotulos}}} {entrada['execucoes']}")
+
+        for nome, (campo, descricao) in contadores.items():
+            linhas.append(f"# HELP {nome} {descricao}")
+            linhas.append(f"# TYPE {nome} counter")
+            for entrada in entradas:
+                linhas.append(f'{nome}{{impressao="{entrada["impressao"]}"}} {entrada[campo]}')
+        return "\n".join(linhas) + "\n"
+
+    def servir(self, porta=PORTA_METRICAS, endereco="127.0.0.1"):
+        """Serve /metrics numa thread daemon; devolve o servidor (OSError se a porta estiver ocupada)."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metricas = self
+
+        class Tratador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                corpo = metricas.exposicao().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, formato, *argumentos):
+                pass
+
+        servidor = ThreadingHTTPServer((endereco, porta), Tratador)
+        servidor.daemon_threads = True
+        threading.Thread(target=servidor.serve_forever, name="metricas", daemon=True).start()
+        self.servidor = servidor
+        return servidor
+
+    def gravar(self, caminho):
+        """Grava a exposição num arquivo (para o textfile collector), trocando o arquivo de forma atômica."""
+        temporario = f"{caminho}.tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            arquivo.write(self.exposicao())
+        os.replace(temporario, caminho)
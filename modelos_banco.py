@@ -0,0 +1,145 @@
+import glob
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from banco_de_dados import DB_PATH, init_db
+
+DIRETORIO_MODELOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modelos")
+
+ARQUIVOS_ESQUEMA = ["banco_de_dados.py", "gerar_dados.py", "agregados.py", "busca_textual.py",
+                    "analitico_colunar.py", "recomendacao_revisores.py"]
+
+_travas_modelos = {}
+_trava_travas = threading.Lock()
+_preparador = ThreadPoolExecutor(max_workers=1, thread_name_prefix="modelo")
+_preparos = {}
+
+class ModeloIndisponivel(Exception):
+    pass
+
+def assinatura_esquema():
+    """Hash dos módulos que definem esquema e dados: muda quando o código muda, invalidando os modelos antigos."""
+    resumo = hashlib.sha1()
+    diretorio = os.path.dirname(os.path.abspath(__file__))
+    for nome in ARQUIVOS_ESQUEMA:
+        with open(os.path.join(diretorio, nome), "rb") as arquivo:
+            resumo.update(arquivo.read())
+    return resumo.hexdigest()[:10]
+
+def _prefixo_modelo(fator_escala, semente):
+    nome = "exemplo" if fator_escala <= 0 else f"sf{fator_escala:g}_semente{semente}"
+    return os.path.join(DIRETORIO_MODELOS, f"submissao_{nome}_")
+
+def caminho_modelo(fator_escala=0, semente=42):
+    return _prefixo_modelo(fator_escala, semente) + f"{assinatura_esquema()}.db"
+
+def _trava_do_modelo(caminho):
+    with _trava_travas:
+        return _travas_modelos.setdefault(caminho, threading.Lock())
+
+def garantir_modelo(fator_escala=0, semente=42):
+    """Devolve (caminho, criado): gera o modelo com init_db num arquivo temporário só se ele ainda não existir.
+
+    O temporário tem nome único (mkstemp) e o arquivo final aparece com os.replace, então um modelo pela metade
+    nunca é usado; no mesmo processo, quem chega depois espera a geração em andamento em vez de repeti-la.
+    Modelos da mesma escala e semente gerados por versões anteriores do esquema são apagados.
+    """
+    caminho = caminho_modelo(fator_escala, semente)
+    if os.path.exists(caminho):
+        return caminho, False
+
+    with _trava_do_modelo(caminho):
+        if os.path.exists(caminho):
+            return caminho, False
+
+        os.makedirs(DIRETORIO_MODELOS, exist_ok=True)
+        descritor, temporario = tempfile.mkstemp(
+            prefix=os.path.basename(caminho) + ".", suffix=".tmp", dir=DIRETORIO_MODELOS
+        )
+        os.close(descritor)
+        try:
+            init_db(temporario, fator_escala, semente)
+            conn = sqlite3.connect(temporario)
+            conn.execute("VACUUM")
+            conn.close()
+            os.replace(temporario, caminho)
+        finally:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+
+    for antigo in glob.glob(_prefixo_modelo(fator_escala, semente) + "*.db"):
+        if antigo != caminho:
+            os.remove(antigo)
+    return caminho, True
+
+def preparar_modelo(fator_escala=0, semente=42):
+    """Gera o modelo numa thread própria, se preciso; devolve o Future de garantir_modelo (um por modelo).
+
+    Um Future que falhou é devolvido uma vez, para a falha aparecer, e a chamada seguinte tenta de novo.
+    """
+    caminho = caminho_modelo(fator_escala, semente)
+    with _trava_travas:
+        futuro = _preparos.get(caminho)
+        if futuro is None:
+            futuro = _preparos[caminho] = _preparador.submit(garantir_modelo, fator_escala, semente)
+        elif futuro.done() and futuro.exception() is not None:
+            del _preparos[caminho]
+    return futuro
+
+def restaurar_modelo(restaurar, fator_escala=0, semente=42, gerar=True):
+    """Restaura o banco a partir do modelo; `restaurar(origem)` faz a cópia (ex.: PoolConexoes.restaurar).
+
+    Sem `gerar`, um modelo inexistente levanta ModeloIndisponivel em vez de rodar init_db (ver `preparar_modelo`).
+    Devolve (criado, segundos): se o modelo precisou ser gerado e quanto tempo levou a cópia.
+    """
+    if gerar:
+        caminho, criado = garantir_modelo(fator_escala, semente)
+    else:
+        caminho, criado = caminho_modelo(fator_escala, semente), False
+        if not os.path.exists(caminho):
+            raise ModeloIndisponivel(f"Ainda não há modelo para SF={fator_escala:g}, semente={semente}.")
+    origem = sqlite3.connect(f"file:{caminho}?mode=ro", uri=True)
+    try:
+        inicio = time.perf_counter()
+        restaurar(origem)
+        return criado, time.perf_counter() - inicio
+    finally:
+        origem.close()
+
+def resetar_banco(restaurar, fator_escala=0, semente=42, gerar=True):
+    """Restaura o banco a partir do modelo e devolve uma mensagem no formato da de init_db."""
+    inicio = time.perf_counter()
+    criado, copia = restaurar_modelo(restaurar, fator_escala, semente, gerar)
+    total = time.perf_counter() - inicio
+    dados = "dados de exemplo" if fator_escala <= 0 else f"dados sintéticos (SF={fator_escala:g}, semente={semente})"
+    origem = ", modelo gerado agora" if criado else ""
+    return f"✅ Banco restaurado com {dados} em {total:.2f} s (cópia do modelo: {copia:.2f} s{origem})."
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Restaura o banco a partir de um modelo pronto (API de backup).")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    parser.add_argument("--sf", type=float, default=0, help="Fator de escala dos dados sintéticos (0 usa os dados de exemplo)")
+    parser.add_argument("--seed", type=int, default=42, help="Semente do gerador de dados sintéticos")
+    parser.add_argument("--apenas-modelo", action="store_true", help="Só gera o modelo, sem tocar no banco")
+    args = parser.parse_args()
+
+    if args.apenas_modelo:
+        caminho, criado = garantir_modelo(args.sf, args.seed)
+        print(f"✓ Modelo {'gerado' if criado else 'já existente'}: {caminho}")
+        return
+
+    destino = sqlite3.connect(args.db, timeout=30)
+    try:
+        print(resetar_banco(lambda origem: origem.backup(destino), args.sf, args.seed))
+    finally:
+        destino.close()
+
+if __name__ == "__main__":
+    main()
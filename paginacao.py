@@ -0,0 +1,48 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from limites_execucao import ControleExecucao
+
+LIMITE_LINHAS_MATERIALIZADAS = 100_000
+
+TAMANHOS_PAGINA = [50, 100, 500, 1000]
+
+_executor_contagem = ThreadPoolExecutor(max_workers=2, thread_name_prefix="contagem")
+
+def como_subconsulta(sql):
+    return f"(\n{sql.strip().rstrip(';')}\n)"
+
+def e_consulta_leitura(sql):
+    sem_comentarios = re.sub(r"--[^\n]*|/\*.*?\*/", " ", sql, flags=re.DOTALL).strip().upper()
+    return sem_comentarios.startswith(("SELECT", "WITH", "VALUES"))
+
+def buscar_linhas(conn, sql, limite=LIMITE_LINHAS_MATERIALIZADAS, controle=None, parametros=()):
+    """Lê no máximo `limite` linhas do cursor; indica se havia mais linhas além do limite."""
+    controle = controle or ControleExecucao(tempo_limite_s=None)
+    controle.max_linhas = limite
+    with controle.aplicar(conn):
+        cursor = conn.execute(sql, parametros)
+        colunas = [descricao[0] for descricao in cursor.description or []]
+        linhas, truncado = controle.buscar(cursor)
+        cursor.close()
+    return colunas, linhas, truncado
+
+def buscar_pagina(conn, sql, pagina, tamanho_pagina, parametros=None, controle=None):
+    """Busca só a janela LIMIT/OFFSET da página pedida (páginas começam em 1), sob os limites de `controle`."""
+    controle = controle or ControleExecucao(tempo_limite_s=None)
+    with controle.aplicar(conn):
+        cursor = conn.execute(
+            f"SELECT * FROM {como_subconsulta(sql)} LIMIT :_tamanho_pagina OFFSET :_deslocamento_pagina",
+            {**(parametros or {}), "_tamanho_pagina": tamanho_pagina, "_deslocamento_pagina": (pagina - 1) * tamanho_pagina}
+        )
+        colunas = [descricao[0] for descricao in cursor.description]
+        linhas, _ = controle.buscar(cursor)
+        cursor.close()
+    return colunas, linhas
+
+def _contar(pool, sql, controle, parametros):
+    with pool.leitura() as conn, controle.aplicar(conn):
+        return conn.execute(f"SELECT COUNT(*) FROM {como_subconsulta(sql)}", parametros).fetchone()[0]
+
+def contar_em_segundo_plano(pool, sql, controle=None, parametros=()):
+    return _executor_contagem.submit(_contar, pool, sql, controle or ControleExecucao(tempo_limite_s=None), parametros)
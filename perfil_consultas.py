@@ -0,0 +1,188 @@
+import re
+import time
+from collections import Counter
+
+from assistente_indices import mapear_aliases
+from limites_execucao import ControleExecucao
+
+INTERVALO_PERFIL = 100
+
+PADRAO_VARREDURA = re.compile(r"^SCAN (\w+)")
+
+OPCODES_INDICADORES = {
+    "Laços de varredura": ("Rewind", "Last", "Next", "Prev"),
+    "Buscas por índice": ("SeekGE", "SeekGT", "SeekLE", "SeekLT", "SeekRowid", "NotExists", "Found", "NotFound"),
+    "Ordenações": ("SorterOpen", "SorterSort", "SorterInsert"),
+    "Índices automáticos": ("OpenAutoindex",),
+    "Tabelas temporárias": ("OpenEphemeral",),
+    "Agregações": ("AggStep", "AggFinal"),
+}
+
+ROTULOS_TEMPOS = {
+    "preparacao_ms": "preparação",
+    "execucao_ms": "execução",
+    "leitura_ms": "leitura",
+    "colunar_ms": "colunas",
+    "dataframe_ms": "DataFrame",
+}
+
+def arvore_plano(plano):
+    """Formata as linhas (id, pai, _, detalhe) do EXPLAIN QUERY PLAN como árvore indentada."""
+    filhos = {}
+    for id_no, pai, _, detalhe in plano:
+        filhos.setdefault(pai, []).append((id_no, detalhe))
+
+    linhas = []
+    def descer(pai, nivel):
+        for id_no, detalhe in filhos.get(pai, []):
+            linhas.append("   " * nivel + "└─ " + detalhe)
+            descer(id_no, nivel + 1)
+    descer(0, 0)
+    return "\n".join(linhas)
+
+def indicadores_plano(plano):
+    detalhes = [detalhe for _, _, _, detalhe in plano]
+    return {
+        "varreduras_completas": sum(1 for detalhe in detalhes if PADRAO_VARREDURA.match(detalhe)),
+        "ordenacoes": sum(1 for detalhe in detalhes if "USE TEMP B-TREE" in detalhe),
+        "indices_automaticos": sum(1 for detalhe in detalhes if "AUTOMATIC" in detalhe),
+    }
+
+def estatisticas_opcodes(programa):
+    """Conta os opcodes do programa (EXPLAIN) e agrupa os que indicam varredura, ordenação e índices automáticos.
+
+    São contagens estáticas do bytecode: mostram o formato do plano, não quantas vezes cada opcode rodou.
+    """
+    opcodes = Counter(linha[1] for linha in programa)
+    indicadores = {
+        nome: sum(opcodes[opcode] for opcode in grupo)
+        for nome, grupo in OPCODES_INDICADORES.items()
+    }
+    return opcodes, indicadores
+
+def estimar_linhas_examinadas(conn, sql, plano):
+    """Soma o tamanho das tabelas varridas por completo no plano (≈ MAX(rowid), sem contar linha a linha).
+
+    É um piso: varreduras dentro de laços aninhados leem a tabela mais de uma vez. CTEs, subconsultas e
+    tabelas virtuais também aparecem como SCAN e ficam de fora (só entram tabelas comuns do sqlite_master).
+    """
+    aliases = mapear_aliases(sql)
+    existentes = {
+        nome.lower(): nome for (nome,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND sql NOT LIKE 'CREATE VIRTUAL TABLE%'"
+        )
+    }
+    tabelas = {}
+    for _, _, _, detalhe in plano:
+        varredura = PADRAO_VARREDURA.match(detalhe)
+        if varredura and varredura.group(1) in aliases:
+            tabela = existentes.get(aliases[varredura.group(1)].lower())
+            if tabela and tabela not in tabelas:
+                tabelas[tabela] = conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {tabela}").fetchone()[0]
+    return tabelas
+
+def perfilar(conn, sql, parametros=(), controle=None, limite=None):
+    """Executa a consulta medindo cada fase e devolve (colunas, linhas, truncado, perfil).
+
+    O módulo sqlite3 não expõe sqlite3_stmt_status nem separa o prepare do primeiro step, então:
+    a preparação é medida compilando o mesmo SQL com EXPLAIN (que também fornece os opcodes); "execução"
+    é o `execute()` (prepare em cache + primeiro step, onde ORDER BY/GROUP BY fazem quase todo o trabalho);
+    "leitura" são os steps seguintes com a conversão em tuplas; as instruções da VM vêm do progress handler.
+    """
+    sql = sql.strip().rstrip(";")
+    controle = controle or ControleExecucao(tempo_limite_s=None)
+    controle.intervalo = min(controle.intervalo, INTERVALO_PERFIL)
+    controle.max_linhas = limite
+    tempos = {}
+
+    inicio = time.perf_counter()
+    cursor = conn.execute(f"EXPLAIN {sql}", parametros)
+    tempos["preparacao_ms"] = (time.perf_counter() - inicio) * 1000
+    programa = cursor.fetchall()
+    plano = conn.execute(f"EXPLAIN QUERY PLAN {sql}", parametros).fetchall()
+
+    with controle.aplicar(conn):
+        inicio = time.perf_counter()
+        cursor = conn.execute(sql, parametros)
+        tempos["execucao_ms"] = (time.perf_counter() - inicio) * 1000
+        colunas = [descricao[0] for descricao in cursor.description or []]
+
+        inicio = time.perf_counter()
+        linhas, truncado = controle.buscar(cursor)
+        cursor.close()
+        tempos["leitura_ms"] = (time.perf_counter() - inicio) * 1000
+
+    opcodes, indicadores_vm = estatisticas_opcodes(programa)
+    tabelas_varridas = estimar_linhas_examinadas(conn, sql, plano)
+    perfil = {
+        "plano": plano,
+        "arvore": arvore_plano(plano),
+        "indicadores_plano": indicadores_plano(plano),
+        "opcodes": opcodes,
+        "indicadores_vm": indicadores_vm,
+        "tamanho_programa": len(programa),
+        "passos_vm": controle.passos,
+        "granularidade_vm": controle.intervalo,
+        "tempos": tempos,
+        "linhas_retornadas": len(linhas),
+        "tabelas_varridas": tabelas_varridas,
+        "linhas_examinadas_estimadas": sum(tabelas_varridas.values()),
+    }
+    return colunas, linhas, truncado, perfil
+
+def resumo_tempos(perfil):
+    return " · ".join(
+        f"{ROTULOS_TEMPOS.get(nome, nome)} {valor:.1f} ms" for nome, valor in perfil["tempos"].items()
+    )
+
+def imprimir_perfil(perfil):
+    print("Plano (EXPLAIN QUERY PLAN):")
+    print(perfil["arvore"] or "  (sem plano)")
+
+    print(f"\nTempos: {resumo_tempos(perfil)}")
+    print(f"Instruções da VM executadas: ~{perfil['passos_vm']:,} (medidas a cada {perfil['granularidade_vm']})")
+    print(f"Linhas retornadas: {perfil['linhas_retornadas']:,}; "
+          f"examinadas em varreduras completas: ≥ {perfil['linhas_examinadas_estimadas']:,}")
+    for tabela, linhas in perfil["tabelas_varridas"].items():
+        print(f"  SCAN {tabela}: ~{linhas:,} linhas")
+
+    indicadores = perfil["indicadores_plano"]
+    print(f"\nVarreduras completas: {indicadores['varreduras_completas']}, ordenações em B-tree temporária: "
+          f"{indicadores['ordenacoes']}, índices automáticos: {indicadores['indices_automaticos']}")
+    print(f"Programa com {perfil['tamanho_programa']} opcodes:")
+    for nome, quantidade in perfil["indicadores_vm"].items():
+        print(f"  {nome:<22} {quantidade}")
+
+def main():
+    import argparse
+    import sqlite3
+    from banco_de_dados import DB_PATH
+    from catalogo import CONSULTAS, interpretar_valor, parametros, sql_para
+
+    parser = argparse.ArgumentParser(description="Mostra o plano, os opcodes e os tempos de uma consulta.")
+    parser.add_argument("sql", nargs="?", help="Consulta SQL (ou use --consulta)")
+    parser.add_argument("--consulta", type=int, choices=sorted(CONSULTAS), help="Número da consulta do catálogo")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    parser.add_argument("--param", action="append", default=[], metavar="NOME=VALOR",
+                        help="Parâmetro nomeado; pode repetir")
+    args = parser.parse_args()
+    if not args.sql and not args.consulta:
+        parser.error("Informe uma consulta SQL ou --consulta N")
+
+    valores = {}
+    for atribuicao in args.param:
+        nome, _, valor = atribuicao.partition("=")
+        valores[nome.strip()] = interpretar_valor(valor)
+
+    conn = sqlite3.connect(args.db)
+    if args.consulta:
+        sql, valores = sql_para(conn, args.consulta), parametros(args.consulta, valores)
+    else:
+        sql = args.sql
+
+    _, _, _, perfil = perfilar(conn, sql, valores)
+    imprimir_perfil(perfil)
+    conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+class PoolConexoes:
+    """Pool de conexões SQLite: várias conexões de leitura reaproveitadas e um único escritor serializado."""
+
+    def __init__(self, db_path, max_leitores=8, mmap_size=268435456, cache_size=-65536,
+                 synchronous="NORMAL", busy_timeout_ms=5000, cached_statements=256):
+        self.db_path = db_path
+        self.max_leitores = max_leitores
+        self.pragmas = {
+            "journal_mode": "WAL",
+            "mmap_size": mmap_size,
+            "cache_size": cache_size,
+            "synchronous": synchronous,
+            "busy_timeout": busy_timeout_ms,
+            "recursive_triggers": "ON",
+        }
+        self.cached_statements = cached_statements
+
+        self._livres = queue.LifoQueue()
+        self._leitores = []
+        self._escritor = None
+        self._sentinela = None
+        self._trava_sentinela = threading.Lock()
+        self._trava = threading.Lock()
+        self._trava_escrita = threading.Lock()
+        self._contadores = {
+            "leituras": 0,
+            "escritas": 0,
+            "erros_escrita": 0,
+            "espera_leitura_ms": 0.0,
+            "espera_escrita_ms": 0.0,
+        }
+
+    def _abrir(self, somente_leitura):
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        for nome, valor in self.pragmas.items():
+            conn.execute(f"PRAGMA {nome} = {valor}")
+        if somente_leitura:
+            conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def _obter_leitor(self, timeout):
+        try:
+            return self._livres.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._trava:
+            if len(self._leitores) < self.max_leitores:
+                conn = self._abrir(somente_leitura=True)
+                self._leitores.append(conn)
+                return conn
+
+        return self._livres.get(timeout=timeout)
+
+    @contextmanager
+    def leitura(self, timeout=30):
+        inicio = time.perf_counter()
+        conn = self._obter_leitor(timeout)
+        with self._trava:
+            self._contadores["leituras"] += 1
+            self._contadores["espera_leitura_ms"] += (time.perf_counter() - inicio) * 1000
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._livres.put(conn)
+
+    @contextmanager
+    def escrita(self):
+        inicio = time.perf_counter()
+        with self._trava_escrita:
+            self._contadores["espera_escrita_ms"] += (time.perf_counter() - inicio) * 1000
+            if self._escritor is None:
+                self._escritor = self._abrir(somente_leitura=False)
+
+            conn = self._escritor
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+                self._contadores["escritas"] += 1
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                self._contadores["erros_escrita"] += 1
+                raise
+
+    def restaurar(self, origem, paginas=-1):
+        """Copia o banco aberto em `origem` sobre este banco pela API de backup, usando o escritor.
+
+        A cópia é gravada numa única transação pelo WAL: leitores continuam vendo a versão anterior até o fim.
+        """
+        inicio = time.perf_counter()
+        with self._trava_escrita:
+            self._contadores["espera_escrita_ms"] += (time.perf_counter() - inicio) * 1000
+            if self._escritor is None:
+                self._escritor = self._abrir(somente_leitura=False)
+            origem.backup(self._escritor, pages=paginas)
+            self._contadores["escritas"] += 1
+
+    def versao_dados(self):
+        """Valor de PRAGMA data_version numa conexão que nunca escreve: muda a cada commit de outra conexão."""
+        with self._trava_sentinela:
+            if self._sentinela is None:
+                self._sentinela = self._abrir(somente_leitura=True)
+            return self._sentinela.execute("PRAGMA data_version").fetchone()[0]
+
+    def saude(self):
+        inicio = time.perf_counter()
+        try:
+            with self.leitura(timeout=5) as conn:
+                conn.execute("SELECT 1").fetchone()
+                journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            return {
+                "ok": True,
+                "journal_mode": journal_mode,
+                "latencia_ms": (time.perf_counter() - inicio) * 1000,
+            }
+        except Exception as e:
+            return {"ok": False, "erro": str(e)}
+
+    def metricas(self):
+        with self._trava:
+            abertos = len(self._leitores)
+            contadores = dict(self._contadores)
+        livres = self._livres.qsize()
+        return {
+            "max_leitores": self.max_leitores,
+            "leitores_abertos": abertos,
+            "leitores_livres": livres,
+            "leitores_em_uso": abertos - livres,
+            "escritor_aberto": self._escritor is not None,
+            **contadores,
+        }
+
+    def fechar(self):
+        with self._trava_escrita, self._trava:
+            for conn in self._leitores:
+                conn.close()
+            self._leitores.clear()
+            self._livres = queue.LifoQueue()
+            if self._escritor is not None:
+                self._escritor.close()
+                self._escritor = None
+        with self._trava_sentinela:
+            if self._sentinela is not None:
+                self._sentinela.close()
+                self._sentinela = None
@@ -0,0 +1,391 @@
+import heapq
+import json
+import threading
+from collections import Counter, defaultdict
+
+from agregados import agregados_disponiveis
+
+TAMANHO_LOTE_ARTIGOS = 5_000
+
+LIMITE_ALTERACOES = 100_000
+
+def criar_alteracoes_revisores(cursor):
+    """Log dos revisores afetados por cada escrita, mantido por triggers, para o índice se atualizar por revisor.
+
+    Guarda só os últimos LIMITE_ALTERACOES registros; ID_Revisor NULL pede a remontagem completa
+    (ver `marcar_recarga`). Em Autoria, entram todos os revisores do artigo, cujas coautorias mudam juntas.
+    """
+    cursor.executescript(f"""
+        CREATE TABLE IF NOT EXISTS Alteracoes_Revisores (
+            Seq INTEGER PRIMARY KEY,
+            ID_Revisor INTEGER
+        );
+
+        CREATE TRIGGER IF NOT EXISTS trg_Alteracoes_Revisores_poda AFTER INSERT ON Alteracoes_Revisores
+        BEGIN
+            DELETE FROM Alteracoes_Revisores WHERE Seq <= NEW.Seq - {LIMITE_ALTERACOES};
+        END;
+    """)
+    revisores_do_artigo = """
+        INSERT INTO Alteracoes_Revisores (ID_Revisor)
+        SELECT Cod_Autor FROM Autoria
+        WHERE Cod_Artigo = {linha}.Cod_Artigo AND Cod_Autor IN (SELECT ID_Usuario FROM Revisor)
+        UNION SELECT {linha}.Cod_Autor WHERE {linha}.Cod_Autor IN (SELECT ID_Usuario FROM Revisor);
+    """
+    for tabela, coluna in (("Revisor", "ID_Usuario"), ("Revisor_Area", "ID_Revisor"), ("Revisao", "Cod_Revisor")):
+        cursor.executescript(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_revisores_insert AFTER INSERT ON {tabela}
+            BEGIN
+                INSERT INTO Alteracoes_Revisores (ID_Revisor) VALUES (NEW.{coluna});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_revisores_delete AFTER DELETE ON {tabela}
+            BEGIN
+                INSERT INTO Alteracoes_Revisores (ID_Revisor) VALUES (OLD.{coluna});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_{tabela}_revisores_update AFTER UPDATE ON {tabela}
+            BEGIN
+                INSERT INTO Alteracoes_Revisores (ID_Revisor) VALUES (OLD.{coluna});
+                INSERT INTO Alteracoes_Revisores (ID_Revisor) SELECT NEW.{coluna} WHERE NEW.{coluna} IS NOT OLD.{coluna};
+            END;
+        """)
+    cursor.executescript(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_Usuario_revisores_update AFTER UPDATE OF ID_Usuario, Nome, Instituicao ON Usuario
+        WHEN EXISTS (SELECT 1 FROM Revisor WHERE ID_Usuario IN (OLD.ID_Usuario, NEW.ID_Usuario))
+        BEGIN
+            INSERT INTO Alteracoes_Revisores (ID_Revisor)
+            SELECT ID_Usuario FROM Revisor WHERE ID_Usuario IN (OLD.ID_Usuario, NEW.ID_Usuario);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_Autoria_revisores_insert AFTER INSERT ON Autoria
+        BEGIN
+            {revisores_do_artigo.format(linha="NEW")}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_Autoria_revisores_delete AFTER DELETE ON Autoria
+        BEGIN
+            {revisores_do_artigo.format(linha="OLD")}
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS trg_Autoria_revisores_update AFTER UPDATE ON Autoria
+        BEGIN
+            {revisores_do_artigo.format(linha="OLD")}
+            {revisores_do_artigo.format(linha="NEW")}
+        END;
+    """)
+
+def marcar_recarga(cursor):
+    """Faz o índice se remontar por inteiro (ex.: após uma carga em lote com os triggers removidos)."""
+    cursor.execute("INSERT INTO Alteracoes_Revisores (ID_Revisor) VALUES (NULL)")
+
+def alteracoes_disponiveis(conn):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'Alteracoes_Revisores'"
+    ).fetchone() is not None
+
+class IndiceRevisores:
+    """Índices invertidos em memória para recomendar revisores: área -> revisores, autor -> revisores coautores,
+    carga de revisões, Nota_Media e instituição.
+
+    `atualizar` relê só os revisores que aparecem em Alteracoes_Revisores desde a última leitura; a remontagem
+    completa (`recarregar`) fica para mudança de esquema, restauração de backup, carga em lote ou log podado.
+    As escolhas de um lote ficam reservadas na carga até serem gravadas ou desfeitas (`desfazer_reserva`).
+    """
+
+    def __init__(self):
+        self.revisores_por_area = defaultdict(set)
+        self.areas_do_revisor = defaultdict(set)
+        self.carga = Counter()
+        self.nota_media = {}
+        self.nome = {}
+        self.instituicao = {}
+        self.coautores_revisores = defaultdict(set)
+        self.coautores_do_revisor = defaultdict(set)
+        self.versao = None
+        self.versao_esquema = None
+        self.seq = None
+        self.trava = threading.RLock()
+
+    @classmethod
+    def do_banco(cls, conn, versao=None):
+        indice = cls()
+        indice.recarregar(conn, versao)
+        return indice
+
+    def recarregar(self, conn, versao=None):
+        """Remonta todos os índices a partir do banco."""
+        versao_esquema, seq = self._posicao(conn)
+        novo = IndiceRevisores()
+        novo._ler(conn)
+        with self.trava:
+            for atributo in ("revisores_por_area", "areas_do_revisor", "carga", "nota_media", "nome",
+                             "instituicao", "coautores_revisores", "coautores_do_revisor"):
+                setattr(self, atributo, getattr(novo, atributo))
+            self.versao, self.versao_esquema, self.seq = versao, versao_esquema, seq
+
+    def atualizar(self, conn, versao=None):
+        """Aplica as alterações registradas desde a última leitura, relendo só os revisores afetados."""
+        versao_esquema, _ = self._posicao(conn)
+        if self.seq is None or versao_esquema != self.versao_esquema:
+            return self.recarregar(conn, versao)
+        alteracoes = conn.execute(
+            "SELECT Seq, ID_Revisor FROM Alteracoes_Revisores WHERE Seq > ? ORDER BY Seq", (self.seq,)
+        ).fetchall()
+        primeiro = conn.execute("SELECT MIN(Seq) FROM Alteracoes_Revisores").fetchone()[0]
+        if alteracoes and (primeiro > self.seq + 1 or any(id_revisor is None for _, id_revisor in alteracoes)):
+            return self.recarregar(conn, versao)
+        with self.trava:
+            for id_revisor in dict.fromkeys(id_revisor for _, id_revisor in alteracoes):
+                self._reler_revisor(conn, id_revisor)
+            if alteracoes:
+                self.seq = alteracoes[-1][0]
+            self.versao = versao
+
+    def _ler(self, conn):
+        for id_revisor, nome, instituicao, nota_media in conn.execute("""
+            SELECT R.ID_Usuario, U.Nome, U.Instituicao, R.Nota_Media
+            FROM Revisor R
+            JOIN Usuario U ON U.ID_Usuario = R.ID_Usuario
+        """):
+            self.adicionar_revisor(id_revisor, nome, instituicao, nota_media)
+
+        for id_revisor, cod_area in conn.execute("SELECT ID_Revisor, Cod_Area FROM Revisor_Area"):
+            self.adicionar_area(id_revisor, cod_area)
+
+        for cod_autor, id_revisor in conn.execute("""
+            SELECT DISTINCT OUTRO.Cod_Autor, PROPRIO.Cod_Autor
+            FROM Autoria PROPRIO
+            JOIN Autoria OUTRO ON OUTRO.Cod_Artigo = PROPRIO.Cod_Artigo AND OUTRO.Cod_Autor <> PROPRIO.Cod_Autor
+            WHERE PROPRIO.Cod_Autor IN (SELECT ID_Usuario FROM Revisor)
+        """):
+            self.adicionar_coautoria(id_revisor, cod_autor)
+
+        if agregados_disponiveis(conn):
+            cargas = conn.execute("SELECT Cod_Revisor, Qtd_Linhas FROM Resumo_Revisor")
+        else:
+            cargas = conn.execute("SELECT Cod_Revisor, COUNT(*) FROM Revisao GROUP BY Cod_Revisor")
+        self.carga.update(dict(cargas))
+
+    def _posicao(self, conn):
+        versao_esquema = conn.execute("PRAGMA schema_version").fetchone()[0]
+        if not alteracoes_disponiveis(conn):
+            return versao_esquema, None
+        return versao_esquema, conn.execute("SELECT COALESCE(MAX(Seq), 0) FROM Alteracoes_Revisores").fetchone()[0]
+
+    def _reler_revisor(self, conn, id_revisor):
+        """Troca tudo o que o índice sabe de um revisor pelo estado atual no banco (ou o remove)."""
+        for cod_area in self.areas_do_revisor.pop(id_revisor, ()):
+            self.revisores_por_area[cod_area].discard(id_revisor)
+        for cod_autor in self.coautores_do_revisor.pop(id_revisor, ()):
+            self.coautores_revisores[cod_autor].discard(id_revisor)
+        for atributo in (self.nome, self.instituicao, self.nota_media, self.carga):
+            atributo.pop(id_revisor, None)
+
+        revisor = conn.execute("""
+            SELECT U.Nome, U.Instituicao, R.Nota_Media
+            FROM Revisor R
+            JOIN Usuario U ON U.ID_Usuario = R.ID_Usuario
+            WHERE R.ID_Usuario = ?
+        """, (id_revisor,)).fetchone()
+        if revisor is None:
+            return
+        self.adicionar_revisor(id_revisor, *revisor)
+
+        for (cod_area,) in conn.execute("SELECT Cod_Area FROM Revisor_Area WHERE ID_Revisor = ?", (id_revisor,)):
+            self.adicionar_area(id_revisor, cod_area)
+
+        for (cod_autor,) in conn.execute("""
+            SELECT DISTINCT OUTRO.Cod_Autor
+            FROM Autoria PROPRIO
+            JOIN Autoria OUTRO ON OUTRO.Cod_Artigo = PROPRIO.Cod_Artigo AND OUTRO.Cod_Autor <> PROPRIO.Cod_Autor
+            WHERE PROPRIO.Cod_Autor = ?
+        """, (id_revisor,)):
+            self.adicionar_coautoria(id_revisor, cod_autor)
+
+        if agregados_disponiveis(conn):
+            carga = conn.execute("SELECT Qtd_Linhas FROM Resumo_Revisor WHERE Cod_Revisor = ?", (id_revisor,)).fetchone()
+            carga = carga[0] if carga else 0
+        else:
+            carga = conn.execute("SELECT COUNT(*) FROM Revisao WHERE Cod_Revisor = ?", (id_revisor,)).fetchone()[0]
+        if carga:
+            self.carga[id_revisor] = carga
+
+    def adicionar_revisor(self, id_revisor, nome, instituicao, nota_media):
+        with self.trava:
+            self.nome[id_revisor] = nome
+            self.instituicao[id_revisor] = instituicao
+            self.nota_media[id_revisor] = nota_media
+
+    def adicionar_area(self, id_revisor, cod_area):
+        with self.trava:
+            self.revisores_por_area[cod_area].add(id_revisor)
+            self.areas_do_revisor[id_revisor].add(cod_area)
+
+    def adicionar_coautoria(self, id_revisor, cod_autor):
+        with self.trava:
+            self.coautores_revisores[cod_autor].add(id_revisor)
+            self.coautores_do_revisor[id_revisor].add(cod_autor)
+
+    def registrar_revisao(self, id_revisor, quantidade=1):
+        with self.trava:
+            self.carga[id_revisor] += quantidade
+
+    def recomendar(self, artigo, quantidade=3):
+        """Ranqueia revisores elegíveis para um artigo (ver `ler_artigos`).
+
+        Ordem: mais áreas em comum, menor carga de revisões, maior Nota_Media. Ficam de fora os autores do
+        artigo, quem já o revisa, quem já foi coautor de algum autor e revisores da mesma instituição de algum autor.
+        """
+        with self.trava:
+            sobreposicao = Counter()
+            for cod_area in artigo["areas"]:
+                sobreposicao.update(self.revisores_por_area.get(cod_area, ()))
+
+            impedidos = artigo["autores"] | artigo["revisores"]
+            for cod_autor in artigo["autores"]:
+                impedidos |= self.coautores_revisores.get(cod_autor, set())
+            instituicoes = artigo["instituicoes"]
+            candidatos = (
+                id_revisor for id_revisor in sobreposicao
+                if id_revisor not in impedidos and self.instituicao.get(id_revisor) not in instituicoes
+            )
+            melhores = heapq.nsmallest(quantidade, candidatos, key=lambda id_revisor: (
+                -sobreposicao[id_revisor],
+                self.carga[id_revisor],
+                -(self.nota_media.get(id_revisor) or 0),
+                id_revisor,
+            ))
+
+            return [{
+                "Cod_Revisor": id_revisor,
+                "Nome": self.nome.get(id_revisor),
+                "Areas_em_Comum": sobreposicao[id_revisor],
+                "Carga": self.carga[id_revisor],
+                "Nota_Media": self.nota_media.get(id_revisor),
+            } for id_revisor in melhores]
+
+def ler_artigos(conn, cods_artigo):
+    """Áreas, autores, instituições dos autores e revisores atuais de cada artigo, em três consultas por lote."""
+    artigos = {}
+    for inicio in range(0, len(cods_artigo), TAMANHO_LOTE_ARTIGOS):
+        lote = cods_artigo[inicio:inicio + TAMANHO_LOTE_ARTIGOS]
+        ids = json.dumps(lote)
+        for cod in lote:
+            artigos[cod] = {"areas": set(), "autores": set(), "instituicoes": set(), "revisores": set()}
+
+        for cod, cod_area in conn.execute("""
+            SELECT Cod_Artigo, Cod_Area FROM Artigo_Area
+            WHERE Cod_Artigo IN (SELECT value FROM json_each(?))
+        """, (ids,)):
+            artigos[cod]["areas"].add(cod_area)
+
+        for cod, cod_autor, instituicao in conn.execute("""
+            SELECT AUT.Cod_Artigo, AUT.Cod_Autor, U.Instituicao
+            FROM Autoria AUT
+            LEFT JOIN Usuario U ON U.ID_Usuario = AUT.Cod_Autor
+            WHERE AUT.Cod_Artigo IN (SELECT value FROM json_each(?))
+        """, (ids,)):
+            artigos[cod]["autores"].add(cod_autor)
+            if instituicao is not None:
+                artigos[cod]["instituicoes"].add(instituicao)
+
+        for cod, cod_revisor in conn.execute("""
+            SELECT Cod_Artigo, Cod_Revisor FROM Revisao
+            WHERE Cod_Artigo IN (SELECT value FROM json_each(?))
+        """, (ids,)):
+            artigos[cod]["revisores"].add(cod_revisor)
+
+    return artigos
+
+def recomendar_lote(conn, indice, cods_artigo, por_artigo=3):
+    """Recomenda `por_artigo` revisores para cada artigo, contando as escolhas anteriores do lote na carga.
+
+    Assim o lote distribui o trabalho em vez de mandar todos os artigos da área para o mesmo revisor.
+    Devolve {Cod_Artigo: [recomendações]}; a carga do índice fica atualizada com as escolhas.
+    """
+    artigos = ler_artigos(conn, list(cods_artigo))
+    recomendacoes = {}
+    with indice.trava:
+        for cod, artigo in artigos.items():
+            escolhidos = indice.recomendar(artigo, por_artigo)
+            for escolhido in escolhidos:
+                indice.registrar_revisao(escolhido["Cod_Revisor"])
+            recomendacoes[cod] = escolhidos
+    return recomendacoes
+
+def desfazer_reserva(indice, recomendacoes):
+    """Devolve ao índice a carga reservada por `recomendar_lote` quando as recomendações não são gravadas."""
+    with indice.trava:
+        for escolhidos in recomendacoes.values():
+            for escolhido in escolhidos:
+                indice.registrar_revisao(escolhido["Cod_Revisor"], -1)
+
+def gravar_atribuicoes(conn, recomendacoes):
+    """Insere as recomendações em Revisao (sem parecer nem nota); devolve o número de linhas inseridas.
+
+    Pares que já existiam são ignorados e não entram na conta (rowcount do executemany, que ao contrário
+    de total_changes não soma as linhas gravadas pelos triggers de Revisao).
+    """
+    linhas = [
+        (cod, escolhido["Cod_Revisor"])
+        for cod, escolhidos in recomendacoes.items()
+        for escolhido in escolhidos
+    ]
+    return conn.executemany("INSERT OR IGNORE INTO Revisao (Cod_Artigo, Cod_Revisor) VALUES (?, ?)", linhas).rowcount
+
+def interpretar_intervalos(texto):
+    """Converte '1, 5, 10-20' em [1, 5, 10, 11, ..., 20]."""
+    cods = []
+    for parte in texto.replace(";", ",").split(","):
+        parte = parte.strip()
+        if not parte:
+            continue
+        inicio, separador, fim = parte.partition("-")
+        if separador:
+            cods.extend(range(int(inicio), int(fim) + 1))
+        else:
+            cods.append(int(parte))
+    return list(dict.fromkeys(cods))
+
+def main():
+    import argparse
+    import time
+    from banco_de_dados import DB_PATH, conectar
+
+    parser = argparse.ArgumentParser(description="Recomenda revisores para artigos por área, carga e conflitos.")
+    parser.add_argument("artigos", help="Códigos dos artigos (ex.: 1,5,10-20)")
+    parser.add_argument("--db", default=DB_PATH, help="Caminho do arquivo SQLite")
+    parser.add_argument("--por-artigo", type=int, default=3, help="Revisores por artigo")
+    parser.add_argument("--gravar", action="store_true", help="Insere as recomendações em Revisao")
+    parser.add_argument("--resumo", action="store_true", help="Mostra só os tempos, sem listar as recomendações")
+    args = parser.parse_args()
+
+    conn = conectar(args.db)
+    inicio = time.perf_counter()
+    indice = IndiceRevisores.do_banco(conn)
+    montagem = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    recomendacoes = recomendar_lote(conn, indice, interpretar_intervalos(args.artigos), args.por_artigo)
+    recomendacao = time.perf_counter() - inicio
+
+    if not args.resumo:
+        for cod, escolhidos in recomendacoes.items():
+            print(f"\nArtigo {cod}:")
+            if not escolhidos:
+                print("  (nenhum revisor elegível)")
+            for escolhido in escolhidos:
+                print(f"  {escolhido['Cod_Revisor']:>7} {escolhido['Nome']:<25} áreas em comum={escolhido['Areas_em_Comum']} "
+                      f"carga={escolhido['Carga']} nota média={escolhido['Nota_Media']}")
+
+    if args.gravar:
+        with conn:
+            inseridas = gravar_atribuicoes(conn, recomendacoes)
+        print(f"\n✓ {inseridas} atribuição(ões) gravadas em Revisao")
+
+    print(f"\nÍndice montado em {montagem:.2f} s; {len(recomendacoes)} artigo(s) recomendados em {recomendacao:.2f} s")
+    conn.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import sys
+from array import array
+from itertools import islice
+
+TIPOS_ARRAY = ("q", "d")
+
+def _coluna_tipada(valores):
+    for tipo in TIPOS_ARRAY:
+        try:
+            return array(tipo, valores)
+        except (TypeError, OverflowError):
+            continue
+    return list(valores)
+
+class ResultadoColunar:
+    """Resultado de consulta guardado por colunas: inteiros e reais em array.array, o resto em listas.
+
+    Só vira DataFrame (importando pandas) quando a interface pede.
+    """
+
+    def __init__(self, colunas, dados, truncado=False):
+        self.colunas = list(colunas)
+        self.dados = dados
+        self.truncado = truncado
+        self.perfil = None
+
+    @classmethod
+    def do_cursor(cls, colunas, linhas, truncado=False):
+        if not linhas:
+            return cls(colunas, [[] for _ in colunas], truncado)
+        return cls(colunas, [_coluna_tipada(valores) for valores in zip(*linhas)], truncado)
+
+    def __len__(self):
+        return len(self.dados[0]) if self.dados else 0
+
+    def __iter__(self):
+        return self.linhas()
+
+    def linhas(self):
+        return zip(*self.dados)
+
+    def coluna(self, nome):
+        return self.dados[self.colunas.index(nome)]
+
+    def tamanho_bytes(self):
+        total = sys.getsizeof(self.dados)
+        for valores in self.dados:
+            if isinstance(valores, array):
+                total += valores.itemsize * len(valores)
+            else:
+                total += sys.getsizeof(valores) + sum(sys.getsizeof(valor) for valor in valores)
+        return total
+
+    def para_dataframe(self):
+        """DataFrame novo a cada chamada: guardá-lo aqui escaparia da contagem de bytes do CacheResultados."""
+        import pandas as pd
+
+        df = pd.DataFrame({i: valores for i, valores in enumerate(self.dados)}, columns=range(len(self.colunas)))
+        df.columns = self.colunas
+        df.attrs["truncado"] = self.truncado
+        return df
+
+    def imprimir(self, saida=sys.stdout, tamanho_bloco=1000):
+        saida.write(" | ".join(self.colunas) + "\n")
+        saida.write("-" * 70 + "\n")
+        linhas = self.linhas()
+        while True:
+            bloco = list(islice(linhas, tamanho_bloco))
+            if not bloco:
+                return
+            saida.write("\n".join(map(repr, bloco)) + "\n")
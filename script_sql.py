@@ -0,0 +1,134 @@
+import re
+import sqlite3
+import time
+
+from limites_execucao import ControleExecucao
+
+PADRAO_COMENTARIOS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+COMANDOS_TRANSACAO = ("BEGIN", "COMMIT", "END")
+
+COMANDOS_REJEITADOS = ("ROLLBACK", "SAVEPOINT", "RELEASE")
+
+class ErroScript(Exception):
+    def __init__(self, indice, sql, erro, relatorio):
+        self.indice = indice
+        self.sql = sql
+        self.relatorio = relatorio
+        super().__init__(f"Comando {indice} falhou ({erro}); nenhuma alteração do script foi gravada.\n{sql}")
+
+class RelatorioScript:
+    """Tempo, linhas afetadas e erro de cada comando de um script executado em uma única transação."""
+
+    def __init__(self):
+        self.comandos = []
+        self.segundos = 0.0
+
+    @property
+    def erros(self):
+        return [comando for comando in self.comandos if comando["erro"]]
+
+    @property
+    def linhas_afetadas(self):
+        return sum(comando["linhas_afetadas"] or 0 for comando in self.comandos)
+
+    def registrar(self, indice, sql, linhas_afetadas, segundos, erro=None, ignorado=False, linhas_retornadas=None):
+        self.comandos.append({
+            "indice": indice,
+            "sql": sql,
+            "linhas_afetadas": linhas_afetadas,
+            "linhas_retornadas": linhas_retornadas,
+            "tempo_ms": segundos * 1000,
+            "erro": erro,
+            "ignorado": ignorado,
+        })
+
+    def resumo(self):
+        return (
+            f"{len(self.comandos)} comando(s) em {self.segundos:.2f} s: "
+            f"{self.linhas_afetadas} linha(s) afetada(s), {len(self.erros)} erro(s)."
+        )
+
+def _sem_comentarios(sql):
+    return PADRAO_COMENTARIOS.sub(" ", sql).strip().rstrip(";").strip()
+
+def dividir_comandos(texto):
+    """Separa o texto em comandos usando sqlite3.complete_statement.
+
+    Um ';' só encerra o comando quando o SQLite o considera completo, então pontos e vírgulas dentro de
+    strings, comentários e corpos de trigger (BEGIN ... END;) não quebram o comando.
+    """
+    comandos = []
+    inicio = 0
+    posicao = texto.find(";")
+    while posicao != -1:
+        candidato = texto[inicio:posicao + 1]
+        if sqlite3.complete_statement(candidato):
+            if _sem_comentarios(candidato):
+                comandos.append(candidato.strip())
+            inicio = posicao + 1
+        posicao = texto.find(";", posicao + 1)
+
+    resto = texto[inicio:]
+    if _sem_comentarios(resto):
+        comandos.append(resto.strip())
+    return comandos
+
+def _primeira_palavra(sql):
+    return _sem_comentarios(sql).split(None, 1)[0].upper()
+
+def e_controle_transacao(sql):
+    return _primeira_palavra(sql) in COMANDOS_TRANSACAO
+
+def e_comando_rejeitado(sql):
+    return _primeira_palavra(sql) in COMANDOS_REJEITADOS
+
+def executar_script(conn, comandos, controle=None, continuar_em_erro=False):
+    """Executa os comandos dentro da transação já aberta em `conn`, um SAVEPOINT por comando.
+
+    Um comando com erro é desfeito sozinho (ROLLBACK TO); sem `continuar_em_erro`, levanta ErroScript
+    para que quem abriu a transação desfaça o script inteiro. BEGIN/COMMIT/END do próprio script são
+    ignorados, já que o script todo roda em uma transação só. ROLLBACK, SAVEPOINT e RELEASE desmontariam o
+    SAVEPOINT de cada comando: o script é recusado com ErroScript antes de executar qualquer comando.
+    """
+    controle = controle or ControleExecucao(tempo_limite_s=None)
+    relatorio = RelatorioScript()
+    inicio = time.perf_counter()
+
+    for indice, sql in enumerate(comandos, start=1):
+        if e_comando_rejeitado(sql):
+            erro = f"{_primeira_palavra(sql)} não é permitido em scripts (o script inteiro roda em uma transação)"
+            relatorio.registrar(indice, sql, None, 0.0, erro=erro)
+            raise ErroScript(indice, sql, erro, relatorio)
+
+    with controle.aplicar(conn):
+        for indice, sql in enumerate(comandos, start=1):
+            if e_controle_transacao(sql):
+                relatorio.registrar(indice, sql, None, 0.0, ignorado=True)
+                continue
+
+            inicio_comando = time.perf_counter()
+            conn.execute("SAVEPOINT comando_script")
+            try:
+                cursor = conn.execute(sql)
+                retornadas = None
+                if cursor.description:
+                    retornadas = sum(len(bloco) for bloco in iter(lambda: cursor.fetchmany(1000), []))
+                afetadas = cursor.rowcount if cursor.rowcount >= 0 else None
+                conn.execute("RELEASE comando_script")
+            except sqlite3.Error as e:
+                if controle.motivo is not None or controle.cancelado:
+                    raise
+                conn.execute("ROLLBACK TO comando_script")
+                conn.execute("RELEASE comando_script")
+                relatorio.registrar(indice, sql, None, time.perf_counter() - inicio_comando, erro=str(e))
+                if not continuar_em_erro:
+                    relatorio.segundos = time.perf_counter() - inicio
+                    raise ErroScript(indice, sql, e, relatorio) from e
+                continue
+
+            relatorio.registrar(indice, sql, afetadas, time.perf_counter() - inicio_comando,
+                                linhas_retornadas=retornadas)
+
+    relatorio.segundos = time.perf_counter() - inicio
+    return relatorio
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from banco_de_dados import conectar, init_db
+
+@pytest.fixture
+def banco(tmp_path):
+    """Banco com os dados de exemplo num diretório temporário; devolve o caminho."""
+    caminho = str(tmp_path / "submissao.db")
+    init_db(caminho)
+    return caminho
+
+@pytest.fixture
+def conn(banco):
+    conexao = conectar(banco, isolation_level=None)
+    yield conexao
+    conexao.close()
@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+
+from acesso_assincrono import AcessoAssincrono
+from executor_consultas import FilaCheia
+from limites_execucao import ConsultaAbortada
+
+SQL_LENTO = """
+WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 100000000)
+SELECT COUNT(*) FROM c
+"""
+
+def rodar(banco, corrotina, **opcoes):
+    async def principal():
+        async with AcessoAssincrono(banco, **opcoes) as acesso:
+            return await corrotina(acesso)
+
+    return asyncio.run(principal())
+
+def test_tempo_limite_interrompe_a_consulta(banco):
+    async def cenario(acesso):
+        inicio = time.perf_counter()
+        with pytest.raises(ConsultaAbortada):
+            await acesso.consultar(SQL_LENTO, tempo_limite_s=0.2)
+        assert time.perf_counter() - inicio < 5
+        return (await acesso.consultar("SELECT COUNT(*) FROM Usuario"))[1]
+
+    assert rodar(banco, cenario)[0][0] > 0
+
+def test_fila_cheia(banco):
+    async def cenario(acesso):
+        lenta = asyncio.ensure_future(acesso.consultar(SQL_LENTO, tempo_limite_s=5))
+        await asyncio.sleep(0.05)
+        with pytest.raises(FilaCheia):
+            await acesso.consultar("SELECT 1")
+        lenta.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await lenta
+        return await acesso.consultar("SELECT 1")
+
+    assert rodar(banco, cenario, max_pendentes=1, espera_fila_s=0.05) == (["1"], [(1,)])
+
+def test_iterar_devolve_todas_as_linhas(banco, conn):
+    esperado = conn.execute("SELECT Cod_Artigo, Cod_Revisor FROM Revisao ORDER BY 1, 2").fetchall()
+
+    async def cenario(acesso):
+        return [linha async for linha in acesso.iterar("SELECT Cod_Artigo, Cod_Revisor FROM Revisao ORDER BY 1, 2",
+                                                        tamanho_bloco=3)]
+
+    assert rodar(banco, cenario) == esperado
+
+def test_cancelar_durante_a_reserva_devolve_a_conexao(banco):
+    """`reservas` mantém vivos os gerenciadores de contexto, para a coleta de lixo não devolver a conexão."""
+    async def cenario(acesso):
+        pool = acesso.pool
+        obter_leitor = pool._obter_leitor
+
+        def leitor_lento(timeout):
+            time.sleep(0.3)
+            return obter_leitor(timeout)
+
+        pool._obter_leitor = leitor_lento
+        leitura = pool.leitura
+        reservas = []
+        pool.leitura = lambda *args: reservas.append(leitura(*args)) or reservas[-1]
+
+        async def primeira_linha():
+            async for linha in acesso.iterar("SELECT 1"):
+                return linha
+
+        tarefa = asyncio.ensure_future(primeira_linha())
+        await asyncio.sleep(0.05)
+        tarefa.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await tarefa
+        await asyncio.sleep(0.5)
+        pool._obter_leitor, pool.leitura = obter_leitor, leitura
+        return pool._livres.qsize(), len(pool._leitores)
+
+    assert rodar(banco, cenario, max_trabalhadores=1) == (1, 1)
@@ -0,0 +1,36 @@
+import pytest
+
+from catalogo import CONSULTAS, parametros
+
+CONSULTAS_MATERIALIZADAS = [num for num, consulta in CONSULTAS.items() if "sql_materializado" in consulta]
+
+ALTERACOES = {
+    "insert": """
+        INSERT INTO Revisao (Cod_Artigo, Cod_Revisor, Parecer, Nota, Data_Entrega)
+        SELECT A.Cod_Artigo, R.ID_Usuario, 'Novo', 6.5, '2025-01-01'
+        FROM Artigo A, Revisor R
+        WHERE NOT EXISTS (SELECT 1 FROM Revisao V WHERE V.Cod_Artigo = A.Cod_Artigo AND V.Cod_Revisor = R.ID_Usuario)
+        LIMIT 3
+    """,
+    "update": "UPDATE Revisao SET Nota = Nota + 1 WHERE Cod_Artigo IN (SELECT Cod_Artigo FROM Artigo LIMIT 3)",
+    "delete": "DELETE FROM Autoria WHERE rowid IN (SELECT rowid FROM Autoria LIMIT 2)",
+    "replace": """
+        REPLACE INTO Revisao (Cod_Artigo, Cod_Revisor, Parecer, Nota, Data_Entrega)
+        SELECT Cod_Artigo, Cod_Revisor, 'Refeito', 1.5, Data_Entrega FROM Revisao LIMIT 2
+    """,
+    "replace_artigo": """
+        INSERT OR REPLACE INTO Artigo (Cod_Artigo, Titulo, Resumo, Status, Cod_Edicao)
+        SELECT Cod_Artigo, Titulo, Resumo, 'Rejeitado', Cod_Edicao FROM Artigo LIMIT 1
+    """,
+}
+
+def resultado(conn, sql, num):
+    linhas = conn.execute(sql, parametros(num, {"nota_minima": 0, "soma_minima": 0, "minimo_revisores": 1})).fetchall()
+    return sorted((linha[0], round(linha[1], 6)) for linha in linhas)
+
+@pytest.mark.parametrize("alteracao", sorted(ALTERACOES))
+def test_resumos_acompanham_as_tabelas_base(conn, alteracao):
+    conn.execute("PRAGMA foreign_keys = OFF")
+    conn.execute(ALTERACOES[alteracao])
+    for num in CONSULTAS_MATERIALIZADAS:
+        assert resultado(conn, CONSULTAS[num]["sql_materializado"], num) == resultado(conn, CONSULTAS[num]["sql"], num), num
@@ -0,0 +1,99 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from analitico_colunar import CONSULTAS_ANALITICAS, AnaliticoColunar
+from catalogo import CONSULTAS, parametros
+from limites_execucao import ConsultaAbortada, ControleExecucao
+from pool_conexoes import PoolConexoes
+from recomendacao_revisores import gravar_atribuicoes
+
+VALORES = {"nota_minima": 0, "soma_minima": 0, "minimo_revisores": 1}
+
+def normalizar(linhas):
+    return sorted((linha[0], round(linha[1], 6)) for linha in linhas)
+
+def conferir(analitico, conn):
+    for num in CONSULTAS_ANALITICAS:
+        esperado = conn.execute(CONSULTAS[num]["sql"], parametros(num, VALORES)).fetchall()
+        assert normalizar(analitico.executar(num, VALORES)[1]) == normalizar(esperado), num
+
+@pytest.fixture
+def analitico(banco):
+    motor = AnaliticoColunar(banco)
+    motor.atualizar()
+    yield motor
+    motor.fechar()
+
+def test_insercao_e_anexada(analitico, conn):
+    conn.execute("""
+        INSERT INTO Revisao (Cod_Artigo, Cod_Revisor, Parecer, Nota, Data_Entrega)
+        SELECT A.Cod_Artigo, R.ID_Usuario, 'Novo', 6.5, '2025-01-01'
+        FROM Artigo A, Revisor R
+        WHERE NOT EXISTS (SELECT 1 FROM Revisao V WHERE V.Cod_Artigo = A.Cod_Artigo AND V.Cod_Revisor = R.ID_Usuario)
+        LIMIT 3
+    """)
+    assert analitico.atualizar()["Revisao"] == "anexada"
+    conferir(analitico, conn)
+
+def test_replace_rele_a_tabela(analitico, conn):
+    conn.execute("""
+        REPLACE INTO Revisao (Cod_Artigo, Cod_Revisor, Parecer, Nota, Data_Entrega)
+        SELECT Cod_Artigo, Cod_Revisor, 'Refeito', 1.5, Data_Entrega FROM Revisao LIMIT 1
+    """)
+    assert analitico.atualizar()["Revisao"] == "recarregada"
+    conferir(analitico, conn)
+
+def test_or_ignore_sem_efeito_mantem_a_anexacao(analitico, conn):
+    existente = conn.execute("SELECT Cod_Artigo, Cod_Revisor FROM Revisao LIMIT 1").fetchone()
+    nova = conn.execute("""
+        SELECT A.Cod_Artigo, R.ID_Usuario FROM Artigo A, Revisor R
+        WHERE NOT EXISTS (SELECT 1 FROM Revisao V WHERE V.Cod_Artigo = A.Cod_Artigo AND V.Cod_Revisor = R.ID_Usuario)
+          AND A.Cod_Artigo <> ?
+        LIMIT 1
+    """, (existente[0],)).fetchone()
+    gravar_atribuicoes(conn, {existente[0]: [{"Cod_Revisor": existente[1]}], nova[0]: [{"Cod_Revisor": nova[1]}]})
+
+    assert analitico.atualizar()["Revisao"] == "anexada"
+    conferir(analitico, conn)
+
+def test_restaurar_o_mesmo_modelo_duas_vezes(analitico, banco, tmp_path):
+    modelo = str(tmp_path / "modelo.db")
+    with sqlite3.connect(banco) as origem, sqlite3.connect(modelo) as destino:
+        origem.backup(destino)
+
+    pool = PoolConexoes(banco)
+    inserir = "INSERT INTO Area (Nome_Area) VALUES ('Area Nova ' || (SELECT COUNT(*) FROM Area))"
+    try:
+        with sqlite3.connect(f"file:{modelo}?mode=ro", uri=True) as origem:
+            pool.restaurar(origem)
+            with pool.escrita() as conn:
+                conn.execute(inserir)
+            analitico.atualizar()
+            pool.restaurar(origem)
+            with pool.escrita() as conn:
+                conn.execute("INSERT INTO Area (Nome_Area) VALUES ('Outra Area')")
+        assert analitico.atualizar()["Area"] == "recarregada"
+        with pool.leitura() as conn:
+            conferir(analitico, conn)
+    finally:
+        pool.fechar()
+
+def test_cancelamento_interrompe_a_consulta_analitica(banco, conn):
+    motor = AnaliticoColunar(banco)
+    try:
+        controle = ControleExecucao(tempo_limite_s=None)
+        controle.cancelar()
+        with pytest.raises(ConsultaAbortada):
+            motor.executar(9, VALORES, controle)
+        assert controle.inicio is not None
+
+        controle = ControleExecucao(tempo_limite_s=None, max_passos=10, intervalo=1)
+        with pytest.raises(ConsultaAbortada):
+            motor.executar(9, VALORES, controle)
+
+        conferir(motor, conn)
+    finally:
+        motor.fechar()
@@ -0,0 +1,32 @@
+import os
+
+from backup import criar_backup, listar_backups, restaurar_backup
+from pool_conexoes import PoolConexoes
+
+def test_backups_no_mesmo_segundo_nao_se_sobrescrevem(banco, tmp_path):
+    pool = PoolConexoes(banco)
+    diretorio = str(tmp_path / "backups")
+    try:
+        with pool.leitura() as conn:
+            relatorios = [criar_backup(conn, diretorio) for _ in range(3)]
+    finally:
+        pool.fechar()
+
+    assert len({relatorio["arquivo"] for relatorio in relatorios}) == 3
+    assert len(listar_backups(diretorio)) == 3
+
+def test_restauracao_nao_deixa_arquivos_auxiliares(banco, tmp_path):
+    pool = PoolConexoes(banco)
+    diretorio = str(tmp_path / "backups")
+    try:
+        with pool.leitura() as conn:
+            relatorio = criar_backup(conn, diretorio)
+        with pool.escrita() as conn:
+            conn.execute("DELETE FROM Revisao")
+        restaurar_backup(relatorio["caminho"], pool.restaurar)
+        with pool.leitura() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM Revisao").fetchone()[0] > 0
+    finally:
+        pool.fechar()
+
+    assert os.listdir(diretorio) == [relatorio["arquivo"]]
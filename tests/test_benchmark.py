@@ -0,0 +1,19 @@
+from benchmark import comparar_com_baseline, medir_consulta, percentil
+
+SQL_GRANDE = "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 200000) SELECT i, 'x' || i FROM n"
+
+def test_pico_de_memoria_e_por_consulta(conn):
+    grande = medir_consulta(conn, SQL_GRANDE, repeticoes=1)
+    pequena = medir_consulta(conn, "SELECT 1", repeticoes=1)
+
+    assert grande["linhas"] == 200000
+    assert pequena["pico_alocado_python_kb"] < grande["pico_alocado_python_kb"]
+
+def test_percentil_interpola():
+    assert percentil([1, 2, 3, 4], 50) == 2.5
+
+def test_comparar_com_baseline():
+    atual = {"escalas": {"0.1": {"1": {"nome": "Q", "p50_ms": 30.0}, "2": {"nome": "R", "p50_ms": 10.0}}}}
+    baseline = {"escalas": {"0.1": {"1": {"p50_ms": 10.0}, "2": {"p50_ms": 10.0}}}}
+
+    assert [r["consulta"] for r in comparar_com_baseline(atual, baseline, 1.5)] == ["1"]
@@ -0,0 +1,47 @@
+from busca_textual import TABELAS_BUSCA, buscar_artigos, buscar_pareceres
+
+def codigos(resultado):
+    return [linha[0] for linha in resultado[1]]
+
+def verificar_indices(conn):
+    for busca in TABELAS_BUSCA:
+        conn.execute(f"INSERT INTO {busca} ({busca}, rank) VALUES ('integrity-check', 1)")
+
+def test_replace_de_artigo_remove_os_termos_antigos(conn):
+    cod_artigo, titulo = conn.execute("SELECT Cod_Artigo, Titulo FROM Artigo WHERE Titulo LIKE '%Finanças%'").fetchone()
+    assert cod_artigo in codigos(buscar_artigos(conn, "finanças"))
+
+    conn.execute("""
+        REPLACE INTO Artigo (Cod_Artigo, Titulo, Resumo, Status, Cod_Edicao)
+        SELECT Cod_Artigo, 'Compiladores Incrementais', 'Análise de dependências.', Status, Cod_Edicao
+        FROM Artigo WHERE Cod_Artigo = ?
+    """, (cod_artigo,))
+
+    assert cod_artigo not in codigos(buscar_artigos(conn, "finanças"))
+    assert codigos(buscar_artigos(conn, "compiladores")) == [cod_artigo]
+    verificar_indices(conn)
+
+def test_replace_de_revisao_atualiza_pareceres(conn):
+    cod_artigo, cod_revisor = conn.execute("SELECT Cod_Artigo, Cod_Revisor FROM Revisao LIMIT 1").fetchone()
+    conn.execute("""
+        REPLACE INTO Revisao (Cod_Artigo, Cod_Revisor, Parecer, Nota, Data_Entrega)
+        VALUES (?, ?, 'Metodologia impecável.', 9.0, '2025-01-01')
+    """, (cod_artigo, cod_revisor))
+
+    assert codigos(buscar_pareceres(conn, "impecável")) == [cod_artigo]
+    verificar_indices(conn)
+
+def test_pareceres_continuam_certos_apos_vacuum(conn):
+    primeira = conn.execute("SELECT MIN(ID_Revisao) FROM Revisao").fetchone()[0]
+    cod_artigo, cod_revisor = conn.execute(
+        "SELECT Cod_Artigo, Cod_Revisor FROM Revisao ORDER BY ID_Revisao DESC LIMIT 1"
+    ).fetchone()
+    conn.execute("UPDATE Revisao SET Parecer = 'Metodologia impecável.' WHERE Cod_Artigo = ? AND Cod_Revisor = ?",
+                 (cod_artigo, cod_revisor))
+    conn.execute("DELETE FROM Revisao WHERE ID_Revisao = ?", (primeira,))
+
+    conn.execute("VACUUM")
+
+    colunas, linhas = buscar_pareceres(conn, "impecável")
+    assert [(linha[0], linha[2]) for linha in linhas] == [(cod_artigo, cod_revisor)]
+    verificar_indices(conn)
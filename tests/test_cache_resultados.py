@@ -0,0 +1,69 @@
+from cache_resultados import CacheResultados, normalizar_sql
+
+class Resultado:
+    def __init__(self, nome, tamanho):
+        self.nome = nome
+        self.tamanho = tamanho
+
+    def tamanho_bytes(self):
+        return self.tamanho
+
+def test_normalizar_preserva_literais():
+    sql = "SELECT  *\n FROM Usuario -- todos\n WHERE Nome = 'Ana  Maria' ;"
+    assert normalizar_sql(sql) == "SELECT * FROM Usuario WHERE Nome = 'Ana  Maria'"
+    assert normalizar_sql("SELECT /* x */ 1;") == "SELECT 1"
+
+def test_acerto_ignora_espacos_e_respeita_a_variante():
+    cache = CacheResultados()
+    resultado = Resultado("a", 10)
+    cache.guardar("SELECT * FROM Area", 1, resultado)
+
+    assert cache.obter("SELECT *\n  FROM Area;", 1) is resultado
+    assert cache.obter("SELECT * FROM Area", 1, variante="pagina 2") is None
+    assert (cache.acertos, cache.falhas) == (1, 1)
+
+def test_lru_despeja_o_menos_usado_pelo_limite_em_bytes():
+    cache = CacheResultados(limite_bytes=30)
+    for nome in "abc":
+        cache.guardar(f"SELECT '{nome}'", 1, Resultado(nome, 10))
+    cache.obter("SELECT 'a'", 1)
+    cache.guardar("SELECT 'd'", 1, Resultado("d", 10))
+
+    assert cache.obter("SELECT 'b'", 1) is None
+    assert [cache.obter(f"SELECT '{nome}'", 1).nome for nome in "acd"] == list("acd")
+    assert cache.estatisticas()["bytes"] == 30
+
+def test_regravar_a_mesma_chave_nao_conta_bytes_duas_vezes():
+    cache = CacheResultados(limite_bytes=100)
+    cache.guardar("SELECT 1", 1, Resultado("antigo", 40))
+    cache.guardar("SELECT 1", 2, Resultado("novo", 30))
+
+    assert cache.estatisticas()["bytes"] == 30
+    assert cache.obter("SELECT 1", 2).nome == "novo"
+
+def test_resultado_maior_que_o_limite_nao_e_guardado():
+    cache = CacheResultados(limite_bytes=10)
+    cache.guardar("SELECT 1", 1, Resultado("grande", 11))
+    assert cache.estatisticas()["entradas"] == 0
+
+def test_versao_diferente_invalida_a_entrada():
+    cache = CacheResultados()
+    cache.guardar("SELECT 1", 1, Resultado("a", 10))
+
+    assert cache.obter("SELECT 1", 2) is None
+    assert cache.estatisticas()["entradas"] == 0
+    assert cache.estatisticas()["bytes"] == 0
+
+def test_invalidar_esvazia_o_cache():
+    cache = CacheResultados()
+    cache.guardar("SELECT 1", 1, Resultado("a", 10))
+    cache.invalidar()
+
+    assert cache.obter("SELECT 1", 1) is None
+    assert cache.estatisticas()["invalidacoes"] == 1
+
+def test_funcoes_nao_deterministicas_nao_sao_guardadas():
+    cache = CacheResultados()
+    cache.guardar("SELECT random()", 1, Resultado("a", 10))
+    cache.guardar("SELECT date('now')", 1, Resultado("b", 10))
+    assert cache.estatisticas()["entradas"] == 0
@@ -0,0 +1,44 @@
+import builtins
+
+import pytest
+
+import carga_em_lote
+from carga_em_lote import carregar
+
+@pytest.fixture
+def abertos(monkeypatch):
+    arquivos = []
+
+    def abrir(*args, **kwargs):
+        arquivo = builtins.open(*args, **kwargs)
+        arquivos.append(arquivo)
+        return arquivo
+
+    monkeypatch.setattr(carga_em_lote, "open", abrir, raising=False)
+    return arquivos
+
+def test_carrega_csv_e_jsonl(conn, tmp_path, abertos):
+    (tmp_path / "Area.csv").write_text("Nome_Area,Descricao\nCompiladores,\nGrafos,Teoria\n", encoding="utf-8")
+    (tmp_path / "Edicao.jsonl").write_text('{"Ano": 2030, "Status": "Aberta"}\n\n', encoding="utf-8")
+    antes = conn.execute("SELECT COUNT(*) FROM Area").fetchone()[0]
+
+    relatorio = carregar(conn, carga_em_lote.arquivos_do_diretorio(str(tmp_path)))
+
+    assert relatorio["total_linhas"] == 3
+    assert conn.execute("SELECT COUNT(*) FROM Area").fetchone()[0] == antes + 2
+    assert conn.execute("SELECT Descricao FROM Area WHERE Nome_Area = 'Compiladores'").fetchone()[0] is None
+    assert all(arquivo.closed for arquivo in abertos)
+
+@pytest.mark.parametrize("nome, conteudo", [
+    ("Area.csv", "Coluna_Inexistente\nx\n"),
+    ("Area.jsonl", '{"Coluna_Inexistente": 1}\n'),
+    ("Area.jsonl", ""),
+])
+def test_arquivo_invalido_e_fechado(conn, tmp_path, abertos, nome, conteudo):
+    caminho = tmp_path / nome
+    caminho.write_text(conteudo, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        carregar(conn, {"Area": str(caminho)})
+
+    assert len(abertos) == 1 and abertos[0].closed
@@ -0,0 +1,29 @@
+from banco_de_dados import TABELAS_CONTADAS, ler_contadores
+from pool_conexoes import PoolConexoes
+
+def contagens_reais(conn):
+    return {tabela: conn.execute(f"SELECT COUNT(*) FROM {tabela}").fetchone()[0] for tabela in TABELAS_CONTADAS}
+
+def test_replace_mantem_contadores(conn):
+    conn.execute("""
+        REPLACE INTO Revisao (Cod_Artigo, Cod_Revisor, Parecer, Nota, Data_Entrega)
+        SELECT Cod_Artigo, Cod_Revisor, 'Refeito', 5.0, Data_Entrega FROM Revisao LIMIT 1
+    """)
+    conn.execute("""
+        INSERT OR REPLACE INTO Usuario (ID_Usuario, Nome, Email, Senha, Data_Cadastro)
+        VALUES (1, 'Outro Nome', 'outro@x.com', 'x', '2024-01-01')
+    """)
+    assert ler_contadores(conn) == contagens_reais(conn)
+
+def test_replace_pelo_escritor_do_pool(banco):
+    pool = PoolConexoes(banco)
+    try:
+        with pool.escrita() as conn:
+            conn.execute("""
+                REPLACE INTO Revisao (Cod_Artigo, Cod_Revisor, Parecer, Nota, Data_Entrega)
+                SELECT Cod_Artigo, Cod_Revisor, 'Refeito', 5.0, Data_Entrega FROM Revisao LIMIT 1
+            """)
+        with pool.leitura() as conn:
+            assert ler_contadores(conn) == contagens_reais(conn)
+    finally:
+        pool.fechar()
@@ -0,0 +1,82 @@
+import io
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+import executar_queries
+
+def linhas_com_falha():
+    yield (1, "a")
+    raise sqlite3.OperationalError("interrupted")
+
+def test_json_fecha_objeto_quando_leitura_falha_no_meio():
+    saida = io.StringIO()
+    saida.write("[")
+    with pytest.raises(sqlite3.OperationalError):
+        executar_queries.escrever_json(1, "Q", "SELECT", ["a", "b"], linhas_com_falha(), saida=saida)
+    saida.write("]")
+
+    [objeto] = json.loads(saida.getvalue())
+    assert objeto["linhas"] == [[1, "a"]]
+    assert objeto["erro"] == "interrupted"
+
+def test_saida_json_continua_valida_com_consulta_falhando(banco):
+    conn = sqlite3.connect(banco)
+    conn.execute("DROP TABLE Edicao")
+    conn.close()
+
+    saida = subprocess.run(
+        [sys.executable, executar_queries.__file__, "--db", banco, "--format", "json", "--consultas", "1,2"],
+        capture_output=True, text=True, check=True
+    ).stdout
+
+    resultado = json.loads(saida)
+    assert [objeto["num"] for objeto in resultado] == [1, 2]
+    assert "Edicao" in resultado[0]["erro"]
+
+@pytest.mark.parametrize("formato", ["json", "csv"])
+def test_parallel_mantem_colunas_de_resultado_vazio(banco, formato):
+    comando = [sys.executable, executar_queries.__file__, "--db", banco, "--format", formato, "--consultas", "1",
+               "--param", "ano=1999"]
+
+    serial = subprocess.run(comando, capture_output=True, text=True, check=True).stdout
+    paralelo = subprocess.run(comando + ["--parallel", "2"], capture_output=True, text=True, check=True).stdout
+
+    assert paralelo == serial
+    if formato == "json":
+        assert json.loads(paralelo)[0]["colunas"] == ["Titulo", "Ano", "Status"]
+
+def executar_cli(banco, *argumentos):
+    comando = [sys.executable, executar_queries.__file__, "--db", banco, *argumentos]
+    return subprocess.run(comando, capture_output=True, text=True, check=True)
+
+@pytest.mark.parametrize("formato", ["json", "csv"])
+def test_parallel_produz_a_mesma_saida_que_o_serial(banco, formato):
+    serial = executar_cli(banco, "--format", formato).stdout
+    paralelo = executar_cli(banco, "--format", formato, "--parallel", "3").stdout
+
+    assert paralelo == serial
+    if formato == "json":
+        assert [objeto["num"] for objeto in json.loads(paralelo)] == sorted(executar_queries.CONSULTAS)
+
+@pytest.mark.parametrize("processos", ["1", "2"])
+def test_metricas_e_perfil_de_inicializacao(banco, tmp_path, processos):
+    caminho = tmp_path / "consultas.prom"
+    execucao = executar_cli(banco, "--format", "csv", "--consultas", "1,2", "--parallel", processos,
+                            "--metricas", str(caminho), "--profile-startup")
+
+    exposicao = caminho.read_text(encoding="utf-8")
+    assert exposicao.count("consultas_duracao_segundos_count{") == 2
+    assert "import sqlite3" in execucao.stderr
+    assert "total em imports" in execucao.stderr
+
+def test_importar_o_modulo_nao_carrega_dependencias_pesadas():
+    codigo = ("import sys, executar_queries; "
+              "print(sorted(m for m in ('pandas', 'numpy', 'concurrent.futures', 'metricas') if m in sys.modules))")
+    saida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True,
+                           cwd=os.path.dirname(executar_queries.__file__)).stdout
+    assert saida.strip() == "[]"
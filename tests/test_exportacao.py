@@ -0,0 +1,48 @@
+import csv
+
+import pytest
+
+from exportacao import classes_das_colunas, exportar
+from limites_execucao import ConsultaAbortada, ControleExecucao
+
+SQL_MISTA = """
+WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 30)
+SELECT
+    CASE WHEN i > 20 THEN i END AS nula_no_inicio,
+    CASE WHEN i > 20 THEN i + 0.5 ELSE i END AS inteira_depois_real,
+    CASE WHEN i > 20 THEN 'x' ELSE i END AS mista
+FROM n
+"""
+
+def test_classes_cobrem_o_resultado_inteiro(conn):
+    assert classes_das_colunas(conn, SQL_MISTA, 3) == [{"integer"}, {"integer", "real"}, {"integer", "text"}]
+
+@pytest.mark.parametrize("formato", ["Parquet", "Arrow IPC"])
+def test_arrow_aceita_tipos_que_mudam_entre_blocos(conn, tmp_path, formato):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    caminho = tmp_path / "resultado"
+    assert exportar(conn, SQL_MISTA, formato, str(caminho), tamanho_bloco=10) == 30
+
+    if formato == "Parquet":
+        tabela = pyarrow.parquet.read_table(caminho)
+    else:
+        tabela = pyarrow.ipc.open_file(str(caminho)).read_all()
+    assert tabela.schema.types == [pa.int64(), pa.float64(), pa.string()]
+    assert tabela.column("nula_no_inicio").to_pylist()[-1] == 30
+
+def test_exportacao_respeita_limite_de_passos(conn, tmp_path):
+    sql = "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT i FROM n"
+    controle = ControleExecucao(tempo_limite_s=None, max_passos=100_000)
+
+    with pytest.raises(ConsultaAbortada):
+        exportar(conn, sql, "CSV", str(tmp_path / "r.csv"), controle=controle)
+
+def test_csv(conn, tmp_path):
+    caminho = tmp_path / "r.csv"
+    assert exportar(conn, "SELECT Cod_Artigo, Titulo FROM Artigo", "CSV", str(caminho)) == \
+        conn.execute("SELECT COUNT(*) FROM Artigo").fetchone()[0]
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        assert next(csv.reader(arquivo)) == ["Cod_Artigo", "Titulo"]
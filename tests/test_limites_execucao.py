@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from limites_execucao import ConsultaAbortada, ControleExecucao
+
+SQL_INFINITA = "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n) SELECT COUNT(*) FROM n"
+
+class ConexaoLenta:
+    """Conexão falsa cujo interrupt demora, para expor a corrida entre cancelar e o fim de aplicar."""
+
+    def __init__(self):
+        self.eventos = []
+        self.interrompendo = threading.Event()
+        self.liberar = threading.Event()
+
+    def set_progress_handler(self, funcao, intervalo):
+        if funcao is None:
+            self.eventos.append("devolvida")
+
+    def interrupt(self):
+        self.interrompendo.set()
+        self.liberar.wait(5)
+        self.eventos.append("interrompida")
+
+def test_cancelar_nao_interrompe_conexao_ja_devolvida():
+    controle = ControleExecucao(tempo_limite_s=None)
+    conn = ConexaoLenta()
+    uso = controle.aplicar(conn)
+    uso.__enter__()
+
+    cancelamento = threading.Thread(target=controle.cancelar)
+    cancelamento.start()
+    assert conn.interrompendo.wait(5)
+
+    saida = threading.Thread(target=uso.__exit__, args=(None, None, None))
+    saida.start()
+    saida.join(0.2)
+    assert saida.is_alive()
+
+    conn.liberar.set()
+    cancelamento.join(5)
+    saida.join(5)
+    assert conn.eventos == ["interrompida", "devolvida"]
+
+    controle.cancelar()
+    assert conn.eventos == ["interrompida", "devolvida"]
+
+def test_cancelar_interrompe_consulta_em_andamento(conn):
+    controle = ControleExecucao(tempo_limite_s=None)
+    threading.Timer(0.2, controle.cancelar).start()
+
+    with pytest.raises(ConsultaAbortada, match="cancelada"):
+        with controle.aplicar(conn):
+            conn.execute(SQL_INFINITA).fetchone()
+
+def test_tempo_limite(conn):
+    with pytest.raises(ConsultaAbortada, match="Tempo limite"):
+        with ControleExecucao(tempo_limite_s=0.2).aplicar(conn):
+            conn.execute(SQL_INFINITA).fetchone()
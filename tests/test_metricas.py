@@ -0,0 +1,84 @@
+import json
+import urllib.request
+
+import pytest
+
+import metricas
+from metricas import IMPRESSAO_EXCEDENTE, MetricasConsultas, impressao_digital
+
+def test_impressao_ignora_valores():
+    a = impressao_digital("SELECT * FROM Artigo WHERE Cod_Artigo = 10 AND Titulo = 'x' AND Area IN (1, 2, 3)")
+    b = impressao_digital("select *  from Artigo where Cod_Artigo = 7 and Titulo = 'y' and Area in (4, 5)")
+    assert a == b
+    assert a[1] == "SELECT * FROM ARTIGO WHERE COD_ARTIGO = ? AND TITULO = ? AND AREA IN (?)"
+
+def test_histograma_e_exposicao(tmp_path):
+    registro = MetricasConsultas(caminho_log=None)
+    for segundos in (0.0005, 0.003, 0.003, 60.0):
+        registro.registrar("SELECT 1", segundos, linhas=2, bytes_resultado=100)
+    registro.registrar("SELECT * FROM Area", 0.02, erro="falhou")
+
+    texto = registro.exposicao()
+    impressao = impressao_digital("SELECT 1")[0]
+    rotulos = f'impressao="{impressao}",consulta="SELECT ?"'
+    assert f'consultas_duracao_segundos_bucket{{{rotulos},le="0.001"}} 1' in texto
+    assert f'consultas_duracao_segundos_bucket{{{rotulos},le="0.005"}} 3' in texto
+    assert f'consultas_duracao_segundos_bucket{{{rotulos},le="30.0"}} 3' in texto
+    assert f'consultas_duracao_segundos_bucket{{{rotulos},le="+Inf"}} 4' in texto
+    assert f"consultas_duracao_segundos_count{{{rotulos}}} 4" in texto
+    assert f'consultas_linhas_total{{impressao="{impressao}"}} 8' in texto
+    assert f'consultas_bytes_total{{impressao="{impressao}"}} 400' in texto
+    assert f'consultas_erros_total{{impressao="{impressao}"}} 0' in texto
+    assert f'consultas_erros_total{{impressao="{impressao_digital("SELECT * FROM Area")[0]}"}} 1' in texto
+    assert texto.endswith("\n")
+
+    caminho = tmp_path / "consultas.prom"
+    registro.gravar(str(caminho))
+    assert caminho.read_text(encoding="utf-8") == texto
+
+def test_impressoes_alem_do_limite_sao_agrupadas():
+    registro = MetricasConsultas(caminho_log=None, max_impressoes=2)
+    for tabela in ("Usuario", "Artigo", "Revisao", "Area"):
+        registro.registrar(f"SELECT * FROM {tabela}", 0.01)
+
+    impressoes = {entrada["impressao"]: entrada["execucoes"] for entrada in registro.resumo()}
+    assert len(impressoes) == 3
+    assert impressoes[IMPRESSAO_EXCEDENTE] == 2
+
+def test_medir_conta_excecoes_como_erro():
+    registro = MetricasConsultas(caminho_log=None)
+    with pytest.raises(ValueError):
+        with registro.medir("SELECT 1") as medicao:
+            medicao.linhas = 5
+            raise ValueError("falhou")
+
+    entrada, = registro.resumo()
+    assert (entrada["execucoes"], entrada["erros"], entrada["linhas"]) == (1, 1, 5)
+
+def test_log_de_lentas_e_rotacao(tmp_path, monkeypatch):
+    caminho = tmp_path / "logs" / "lentas.jsonl"
+    registro = MetricasConsultas(limite_lenta_ms=100, caminho_log=str(caminho))
+    registro.registrar("SELECT 1", 0.05)
+    assert not caminho.exists()
+
+    registro.registrar("SELECT * FROM Usuario WHERE ID_Usuario = ?", 0.2, linhas=1, parametros=(3,))
+    linha, = caminho.read_text(encoding="utf-8").splitlines()
+    assert json.loads(linha)["tempo_ms"] == 200.0
+    assert json.loads(linha)["parametros"] == [3]
+
+    monkeypatch.setattr(metricas, "MAX_BYTES_LOG", 10)
+    registro.registrar("SELECT 2", 0.3)
+    assert len((tmp_path / "logs" / "lentas.jsonl.1").read_text(encoding="utf-8").splitlines()) == 1
+    assert json.loads(caminho.read_text(encoding="utf-8"))["sql"] == "SELECT 2"
+
+def test_servir_expoe_metrics():
+    registro = MetricasConsultas(caminho_log=None)
+    registro.registrar("SELECT 1", 0.01)
+    servidor = registro.servir(porta=0)
+    try:
+        porta = servidor.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{porta}/metrics", timeout=5) as resposta:
+            assert resposta.read().decode("utf-8") == registro.exposicao()
+    finally:
+        servidor.shutdown()
+        servidor.server_close()
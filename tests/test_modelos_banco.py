@@ -0,0 +1,89 @@
+import os
+import sqlite3
+import threading
+
+import pytest
+
+import modelos_banco
+from modelos_banco import ModeloIndisponivel, garantir_modelo, preparar_modelo, resetar_banco
+
+@pytest.fixture(autouse=True)
+def diretorio_modelos(tmp_path, monkeypatch):
+    diretorio = tmp_path / "modelos"
+    monkeypatch.setattr(modelos_banco, "DIRETORIO_MODELOS", str(diretorio))
+    return diretorio
+
+def restaurar_em(destino):
+    return lambda origem: origem.backup(destino)
+
+def test_sessoes_simultaneas_geram_o_modelo_uma_vez(diretorio_modelos, monkeypatch):
+    geracoes = []
+    init_db = modelos_banco.init_db
+
+    def contar(caminho, *args):
+        geracoes.append(caminho)
+        init_db(caminho, *args)
+
+    monkeypatch.setattr(modelos_banco, "init_db", contar)
+    barreira = threading.Barrier(4)
+    resultados = []
+
+    def sessao():
+        barreira.wait()
+        resultados.append(garantir_modelo())
+
+    threads = [threading.Thread(target=sessao) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(geracoes) == 1
+    assert sorted(criado for _, criado in resultados) == [False, False, False, True]
+    assert os.listdir(diretorio_modelos) == [os.path.basename(resultados[0][0])]
+
+def test_temporarios_tem_nomes_unicos(monkeypatch):
+    temporarios = []
+    monkeypatch.setattr(modelos_banco, "init_db", lambda caminho, *args: temporarios.append(caminho) or 1 / 0)
+
+    for _ in range(2):
+        with pytest.raises(ZeroDivisionError):
+            garantir_modelo()
+
+    assert len(set(temporarios)) == 2
+    assert not any(os.path.exists(caminho) for caminho in temporarios)
+
+def test_reset_restaura_o_modelo(tmp_path):
+    destino = sqlite3.connect(str(tmp_path / "submissao.db"))
+    try:
+        assert "modelo gerado agora" in resetar_banco(restaurar_em(destino))
+        original = destino.execute("SELECT COUNT(*) FROM Revisao").fetchone()[0]
+        destino.execute("DELETE FROM Revisao")
+        destino.commit()
+
+        assert "modelo gerado agora" not in resetar_banco(restaurar_em(destino), gerar=False)
+        assert destino.execute("SELECT COUNT(*) FROM Revisao").fetchone()[0] == original
+    finally:
+        destino.close()
+
+def test_reset_sem_gerar_nao_roda_init_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(modelos_banco, "init_db", lambda *args: pytest.fail("init_db no reset"))
+    destino = sqlite3.connect(str(tmp_path / "submissao.db"))
+    try:
+        with pytest.raises(ModeloIndisponivel):
+            resetar_banco(restaurar_em(destino), gerar=False)
+    finally:
+        destino.close()
+
+def test_preparar_modelo_em_segundo_plano(tmp_path):
+    futuro = preparar_modelo()
+    assert preparar_modelo() is futuro
+    caminho, criado = futuro.result(timeout=60)
+    assert criado and os.path.exists(caminho)
+
+    destino = sqlite3.connect(str(tmp_path / "submissao.db"))
+    try:
+        resetar_banco(restaurar_em(destino), gerar=False)
+        assert destino.execute("SELECT COUNT(*) FROM Usuario").fetchone()[0] > 0
+    finally:
+        destino.close()
@@ -0,0 +1,26 @@
+import pytest
+
+from limites_execucao import ConsultaAbortada, ControleExecucao
+from paginacao import buscar_pagina
+
+SQL_LENTA = """
+WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n)
+SELECT COUNT(*) FROM n
+"""
+
+def test_pagina_respeita_limite_de_passos(conn):
+    with pytest.raises(ConsultaAbortada):
+        buscar_pagina(conn, SQL_LENTA, 1, 50, controle=ControleExecucao(tempo_limite_s=None, max_passos=100_000))
+
+def test_pagina_cancelada_nao_executa(conn):
+    controle = ControleExecucao(tempo_limite_s=None)
+    controle.cancelar()
+
+    with pytest.raises(ConsultaAbortada):
+        buscar_pagina(conn, "SELECT * FROM Artigo", 1, 50, controle=controle)
+
+def test_pagina_sem_controle(conn):
+    colunas, linhas = buscar_pagina(conn, "SELECT Cod_Artigo FROM Artigo ORDER BY Cod_Artigo", 2, 1)
+
+    assert colunas == ["Cod_Artigo"]
+    assert linhas == conn.execute("SELECT Cod_Artigo FROM Artigo ORDER BY Cod_Artigo LIMIT 1 OFFSET 1").fetchall()
@@ -0,0 +1,7 @@
+from perfil_consultas import perfilar
+
+def test_cte_materializada_nao_e_estimada_como_tabela(conn):
+    colunas, linhas, _, perfil = perfilar(conn, "WITH t AS MATERIALIZED (SELECT * FROM Artigo) SELECT * FROM t")
+
+    assert len(linhas) == conn.execute("SELECT COUNT(*) FROM Artigo").fetchone()[0]
+    assert set(perfil["tabelas_varridas"]) == {"Artigo"}
@@ -0,0 +1,68 @@
+import pytest
+
+from recomendacao_revisores import IndiceRevisores, gravar_atribuicoes, marcar_recarga
+
+def test_gravar_atribuicoes_conta_so_as_linhas_inseridas(conn):
+    cod_artigo, cod_revisor = conn.execute("SELECT Cod_Artigo, Cod_Revisor FROM Revisao LIMIT 1").fetchone()
+    novo = conn.execute("""
+        SELECT ID_Usuario FROM Revisor
+        WHERE ID_Usuario NOT IN (SELECT Cod_Revisor FROM Revisao WHERE Cod_Artigo = ?)
+    """, (cod_artigo,)).fetchone()[0]
+
+    recomendacoes = {cod_artigo: [{"Cod_Revisor": cod_revisor}, {"Cod_Revisor": novo}]}
+    assert gravar_atribuicoes(conn, recomendacoes) == 1
+    assert gravar_atribuicoes(conn, recomendacoes) == 0
+
+def _estado(indice):
+    return {
+        "areas": {area: revisores for area, revisores in indice.revisores_por_area.items() if revisores},
+        "coautores": {autor: revisores for autor, revisores in indice.coautores_revisores.items() if revisores},
+        "carga": {revisor: carga for revisor, carga in indice.carga.items() if carga},
+        "nome": indice.nome,
+        "instituicao": indice.instituicao,
+        "nota_media": indice.nota_media,
+    }
+
+def test_atualizar_aplica_alteracoes_sem_remontar(conn, monkeypatch):
+    indice = IndiceRevisores.do_banco(conn)
+    revisor, outro = [linha[0] for linha in conn.execute("SELECT ID_Usuario FROM Revisor ORDER BY ID_Usuario LIMIT 2")]
+    cod_artigo = conn.execute("""
+        SELECT Cod_Artigo FROM Artigo
+        WHERE Cod_Artigo NOT IN (SELECT Cod_Artigo FROM Revisao WHERE Cod_Revisor = ?)
+    """, (revisor,)).fetchone()[0]
+    cod_area = conn.execute("""
+        SELECT Cod_Area FROM Area WHERE Cod_Area NOT IN (SELECT Cod_Area FROM Revisor_Area WHERE ID_Revisor = ?)
+    """, (revisor,)).fetchone()[0]
+
+    conn.execute("INSERT INTO Revisor_Area (ID_Revisor, Cod_Area) VALUES (?, ?)", (revisor, cod_area))
+    conn.execute("DELETE FROM Revisor_Area WHERE ID_Revisor = ?", (outro,))
+    conn.execute("INSERT INTO Revisao (Cod_Artigo, Cod_Revisor) VALUES (?, ?)", (cod_artigo, revisor))
+    conn.execute("INSERT OR IGNORE INTO Autor (ID_Usuario) VALUES (?)", (revisor,))
+    conn.execute("INSERT INTO Autoria (Cod_Autor, Cod_Artigo) VALUES (?, ?)", (revisor, cod_artigo))
+    conn.execute("UPDATE Usuario SET Instituicao = 'Outra' WHERE ID_Usuario = ?", (outro,))
+
+    monkeypatch.setattr(IndiceRevisores, "_ler", lambda self, conn: pytest.fail("remontou o índice inteiro"))
+    indice.atualizar(conn)
+    monkeypatch.undo()
+
+    assert _estado(indice) == _estado(IndiceRevisores.do_banco(conn))
+
+def test_carga_em_lote_pede_remontagem(conn):
+    indice = IndiceRevisores.do_banco(conn)
+    conn.execute("DROP TRIGGER trg_Revisor_Area_revisores_delete")
+    conn.execute("DELETE FROM Revisor_Area")
+    marcar_recarga(conn.cursor())
+
+    indice.atualizar(conn)
+
+    assert not any(indice.revisores_por_area.values())
+
+def test_mudanca_de_esquema_remonta_o_indice(conn):
+    indice = IndiceRevisores.do_banco(conn)
+    conn.execute("DELETE FROM Revisor_Area")
+    conn.execute("DELETE FROM Alteracoes_Revisores")
+    conn.execute("PRAGMA schema_version = " + str(conn.execute("PRAGMA schema_version").fetchone()[0] + 1))
+
+    indice.atualizar(conn)
+
+    assert not any(indice.revisores_por_area.values())
@@ -0,0 +1,59 @@
+import pytest
+
+from script_sql import ErroScript, dividir_comandos, executar_script
+
+def contar_areas(conn):
+    return conn.execute("SELECT COUNT(*) FROM Area").fetchone()[0]
+
+def executar(conn, texto, **opcoes):
+    conn.execute("BEGIN")
+    try:
+        relatorio = executar_script(conn, dividir_comandos(texto), **opcoes)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return relatorio
+
+def test_dividir_respeita_strings_e_triggers():
+    texto = """
+        INSERT INTO Area (Nome_Area) VALUES ('a;b');
+        CREATE TRIGGER t AFTER INSERT ON Area BEGIN SELECT 1; END;
+        -- só comentário;
+        SELECT 1
+    """
+    assert len(dividir_comandos(texto)) == 3
+
+def test_script_roda_em_uma_transacao(conn):
+    antes = contar_areas(conn)
+    relatorio = executar(conn, """
+        BEGIN;
+        INSERT INTO Area (Nome_Area) VALUES ('Nova 1');
+        INSERT INTO Area (Nome_Area) VALUES ('Nova 2');
+        COMMIT;
+    """)
+
+    assert contar_areas(conn) == antes + 2
+    assert [comando["ignorado"] for comando in relatorio.comandos] == [True, False, False, True]
+
+def test_erro_desfaz_o_script_inteiro(conn):
+    antes = contar_areas(conn)
+    with pytest.raises(ErroScript):
+        executar(conn, "INSERT INTO Area (Nome_Area) VALUES ('Nova'); INSERT INTO Inexistente VALUES (1);")
+    assert contar_areas(conn) == antes
+
+def test_continuar_em_erro_desfaz_so_o_comando(conn):
+    antes = contar_areas(conn)
+    relatorio = executar(conn, "INSERT INTO Inexistente VALUES (1); INSERT INTO Area (Nome_Area) VALUES ('Nova');",
+                         continuar_em_erro=True)
+    assert contar_areas(conn) == antes + 1
+    assert len(relatorio.erros) == 1
+
+@pytest.mark.parametrize("comando", ["ROLLBACK", "ROLLBACK TO x", "SAVEPOINT x", "RELEASE x", "release savepoint x"])
+@pytest.mark.parametrize("continuar_em_erro", [False, True])
+def test_controle_de_savepoint_e_recusado_antes_de_executar(conn, comando, continuar_em_erro):
+    antes = contar_areas(conn)
+    with pytest.raises(ErroScript, match="não é permitido"):
+        executar(conn, f"INSERT INTO Area (Nome_Area) VALUES ('Nova'); {comando};",
+                 continuar_em_erro=continuar_em_erro)
+    assert contar_areas(conn) == antes